@@ -171,12 +171,14 @@ gunicorn            : Start Baserow backend django using a prod ready gunicorn s
 gunicorn-wsgi       : Same as gunicorn but runs a wsgi server which does not support WS
 celery-worker       : Start the celery worker queue which runs important async tasks
 celery-exportworker : Start the celery worker queue which runs slower async tasks
+celery-webhooks-worker : Start the celery worker queue which calls the webhooks
 celery-beat         : Start the celery beat service used to schedule periodic jobs
 
 HEALTHCHECK COMMANDS (exit with non zero when unhealthy, zero when healthy)
 backend-healthcheck             : Checks the gunicorn/django-dev service health
 celery-worker-healthcheck       : Checks the celery-worker health
 celery-exportworker-healthcheck : Checks the celery-exportworker health
+celery-webhooks-worker-healthcheck : Checks the celery-webhooks-worker health
 
 DEV COMMANDS (most will only work in the baserow_backend_dev image):
 django-dev      : Start a normal Baserow backend django development server, performs
@@ -368,7 +370,7 @@ case "$1" in
       if [[ -n "${BASEROW_RUN_MINIMAL}" && $BASEROW_AMOUNT_OF_WORKERS == "1" ]]; then
         export OTEL_SERVICE_NAME="celery-worker-combined"
         echo "Starting combined celery and export worker..."
-        start_celery_worker -Q celery,export,automation_workflow -n default-worker@%h "${@:2}"
+        start_celery_worker -Q celery,export,automation_workflow,webhooks -n default-worker@%h "${@:2}"
       else
         export OTEL_SERVICE_NAME="celery-worker"
         start_celery_worker -Q celery,automation_workflow -n default-worker@%h "${@:2}"
@@ -392,6 +394,20 @@ case "$1" in
       echo "Running celery export worker healthcheck..."
       exec celery -A baserow inspect ping -d "export-worker@$HOSTNAME" -t 10 "${@:2}"
     ;;
+    celery-webhooks-worker)
+      if [[ -n "${BASEROW_RUN_MINIMAL}" && $BASEROW_AMOUNT_OF_WORKERS == "1" ]]; then
+        echo "Not starting webhooks worker as the other worker will handle all queues " \
+             "to reduce memory usage"
+        while true; do sleep 2073600; done
+      else
+        export OTEL_SERVICE_NAME="celery-webhooks-worker"
+        start_celery_worker -Q webhooks -n webhooks-worker@%h "${@:2}"
+      fi
+    ;;
+    celery-webhooks-worker-healthcheck)
+      echo "Running celery webhooks worker healthcheck..."
+      exec celery -A baserow inspect ping -d "webhooks-worker@$HOSTNAME" -t 10 "${@:2}"
+    ;;
     celery-beat)
       # Delay the beat startup as there seems to be bug where the other celery workers
       # starting up interfere with or break the lock obtained by it. Without this the
@@ -1,4 +1,9 @@
-from typing import Protocol
+import base64
+import json
+from datetime import date, datetime, time
+from decimal import Decimal
+from typing import Any, List, Protocol
+from uuid import UUID
 
 from django.core.paginator import Paginator as DjangoPaginator
 
@@ -12,6 +17,28 @@ from rest_framework.pagination import (
 from rest_framework.response import Response
 from rest_framework.status import HTTP_400_BAD_REQUEST
 
+from baserow.core.db import KeysetQuerysetPaginator
+
+
+def _get_bad_request_exception(error: str, detail: str) -> APIException:
+    exception = APIException({"error": error, "detail": detail})
+    exception.status_code = HTTP_400_BAD_REQUEST
+    return exception
+
+
+def _keyset_json_default(value):
+    """
+    Serializes the sort key values that JSON doesn't support natively. In contrast to
+    the `DjangoJSONEncoder`, the microseconds of date times are preserved because
+    the cursor values must exactly match the database values.
+    """
+
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    if isinstance(value, (Decimal, UUID)):
+        return str(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not serializable.")
+
 
 class Pageable(Protocol):
     def paginate_queryset(self, queryset, request, view=None):
@@ -69,14 +96,10 @@ class PageNumberPagination(RestFrameworkPageNumberPagination):
         page_size = super().get_page_size(request)
 
         if self.limit_page_size and page_size > self.limit_page_size:
-            exception = APIException(
-                {
-                    "error": "ERROR_PAGE_SIZE_LIMIT",
-                    "detail": f"The page size is limited to {self.limit_page_size}.",
-                }
+            raise _get_bad_request_exception(
+                "ERROR_PAGE_SIZE_LIMIT",
+                f"The page size is limited to {self.limit_page_size}.",
             )
-            exception.status_code = HTTP_400_BAD_REQUEST
-            raise exception
 
         return page_size
 
@@ -150,3 +173,122 @@ class LimitOffsetPaginationWithoutCount(LimitOffsetPagination):
                 "results": schema,
             },
         }
+
+
+class KeysetPagination(KeysetQuerysetPaginator):
+    """
+    A cursor based paginator exposing the keyset pagination of the
+    `KeysetQuerysetPaginator` in the API. The cursor is an opaque token containing
+    the values of all the order by expressions of the last returned row.
+    """
+
+    cursor_query_param = "cursor"
+    page_size_query_param = "size"
+    page_size = 100
+
+    def __init__(self, limit_page_size=None):
+        self.limit_page_size = limit_page_size
+        self.next_cursor = None
+
+    @classmethod
+    def is_requested(cls, request) -> bool:
+        """
+        Indicates whether the provided request asks for keyset pagination.
+        """
+
+        return cls.cursor_query_param in request.GET
+
+    def get_page_size(self, request):
+        try:
+            page_size = int(request.GET.get(self.page_size_query_param, self.page_size))
+        except (TypeError, ValueError):
+            page_size = self.page_size
+
+        if page_size < 1:
+            page_size = self.page_size
+
+        if self.limit_page_size and page_size > self.limit_page_size:
+            raise _get_bad_request_exception(
+                "ERROR_PAGE_SIZE_LIMIT",
+                f"The page size is limited to {self.limit_page_size}.",
+            )
+
+        return page_size
+
+    @staticmethod
+    def encode_cursor(values: List[Any]) -> str:
+        """
+        Encodes the provided sort key values into an opaque, url safe token.
+        """
+
+        raw = json.dumps(values, default=_keyset_json_default, separators=(",", ":"))
+        return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+    @staticmethod
+    def decode_cursor(cursor: str) -> List[Any]:
+        """
+        Decodes a token created by `encode_cursor` back into the sort key values.
+
+        :raises APIException: If the cursor is malformed.
+        """
+
+        try:
+            values = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        except (ValueError, TypeError, UnicodeError):
+            values = None
+
+        if not isinstance(values, list):
+            raise _get_bad_request_exception(
+                "ERROR_INVALID_PAGINATION_CURSOR", "The provided cursor is invalid."
+            )
+
+        return values
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        page_size = self.get_page_size(request)
+        cursor = request.GET.get(self.cursor_query_param)
+
+        try:
+            queryset, aliases, order_bys = self._prepare_queryset(queryset)
+        except ValueError:
+            raise _get_bad_request_exception(
+                "ERROR_INVALID_PAGINATION_CURSOR",
+                "The ordering of the requested rows can't be used with a cursor.",
+            )
+
+        values = None
+        if cursor:
+            values = self.decode_cursor(cursor)
+            if len(values) != len(order_bys):
+                raise _get_bad_request_exception(
+                    "ERROR_INVALID_PAGINATION_CURSOR",
+                    "The provided cursor does not match the ordering of the rows.",
+                )
+
+        page, next_values = self._get_page(
+            queryset, aliases, order_bys, values, page_size
+        )
+        self.next_cursor = (
+            None if next_values is None else self.encode_cursor(next_values)
+        )
+
+        return page
+
+    def get_paginated_response(self, data):
+        return Response({"next_cursor": self.next_cursor, "results": data})
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["next_cursor", "results"],
+            "properties": {
+                "next_cursor": {
+                    "type": "string",
+                    "nullable": True,
+                    "description": "The cursor to provide to get the next page of "
+                    "results, or `null` if this is the last page.",
+                },
+                "results": schema,
+            },
+        }
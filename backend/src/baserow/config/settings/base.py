@@ -303,6 +303,12 @@ BUILDER_DISPATCH_ACTION_CACHE_TTL_SECONDS = int(
     os.getenv("BASEROW_BUILDER_DISPATCH_ACTION_CACHE_TTL_SECONDS")
     or 300
 )
+# The maximum number of threads used to dispatch the data sources of a page
+# concurrently. Every thread uses its own database connection. The data sources are
+# dispatched one after the other if set to 1.
+BUILDER_DATA_SOURCES_DISPATCH_MAX_WORKERS = int(
+    os.getenv("BASEROW_BUILDER_DATA_SOURCES_DISPATCH_MAX_WORKERS") or 1
+)
 
 
 CELERY_SINGLETON_BACKEND_CLASS = (
@@ -981,6 +987,15 @@ BASEROW_PERIODIC_FIELD_UPDATE_UNUSED_WORKSPACE_INTERVAL_MIN = int(
 PERIODIC_FIELD_UPDATE_QUEUE_NAME = os.getenv(
     "BASEROW_PERIODIC_FIELD_UPDATE_QUEUE_NAME", "export"
 )
+# Computes the formulas depending on the current time, like `now()` and `today()`,
+# when they're queried instead of periodically updating all their values. Only
+# formulas that don't reference other tables can be evaluated at query time. These
+# formulas don't get a database index. Their stored value is only written when the
+# row changes, and the full-text search column is built from it, so searching may
+# not match the value shown in the views.
+BASEROW_EVALUATE_TIME_DEPENDENT_FORMULAS_AT_QUERY_TIME = str_to_bool(
+    os.getenv("BASEROW_EVALUATE_TIME_DEPENDENT_FORMULAS_AT_QUERY_TIME", "false")
+)
 
 BASEROW_WEBHOOKS_MAX_CONSECUTIVE_TRIGGER_FAILURES = int(
     os.getenv("BASEROW_WEBHOOKS_MAX_CONSECUTIVE_TRIGGER_FAILURES", 8)
@@ -1065,6 +1080,16 @@ BASEROW_ROW_HISTORY_RETENTION_DAYS = int(
 BASEROW_MAX_ROW_REPORT_ERROR_COUNT = int(
     os.getenv("BASEROW_MAX_ROW_REPORT_ERROR_COUNT", 30)
 )
+# When larger than 0, the realtime `rows_updated` messages of a table are coalesced
+# during this window, so that bulk and high frequency edits result in a single
+# message. If more rows than the threshold have been updated during the window, the
+# clients are asked to refresh the table instead.
+BASEROW_REALTIME_ROWS_UPDATED_DEBOUNCE_MS = int(
+    os.getenv("BASEROW_REALTIME_ROWS_UPDATED_DEBOUNCE_MS", 0)
+)
+BASEROW_REALTIME_ROWS_UPDATED_REFRESH_THRESHOLD = int(
+    os.getenv("BASEROW_REALTIME_ROWS_UPDATED_REFRESH_THRESHOLD", 500)
+)
 BASEROW_MAX_SNAPSHOTS_PER_GROUP = int(os.getenv("BASEROW_MAX_SNAPSHOTS_PER_GROUP", 50))
 BASEROW_SNAPSHOT_EXPIRATION_TIME_DAYS = int(
     os.getenv("BASEROW_SNAPSHOT_EXPIRATION_TIME_DAYS", 360)  # 360 days
@@ -1181,6 +1206,47 @@ BASEROW_SYNC_TEMPLATES_TIME_LIMIT = int(
 APPEND_SLASH = False
 
 BASEROW_DISABLE_MODEL_CACHE = bool(os.getenv("BASEROW_DISABLE_MODEL_CACHE", ""))
+# The maximum number of generated table model classes kept in memory by every
+# process. Set to 0 to disable.
+BASEROW_GENERATED_MODEL_CLASSES_CACHE_SIZE = int(
+    os.getenv("BASEROW_GENERATED_MODEL_CLASSES_CACHE_SIZE", 128)
+)
+# The number of seconds the traversal of the field dependency graph of a database is
+# cached. Set to 0 to disable.
+BASEROW_FIELD_DEPENDENCIES_CACHE_TTL_SECONDS = int(
+    os.getenv("BASEROW_FIELD_DEPENDENCIES_CACHE_TTL_SECONDS", 60 * 60)
+)
+# When an approximate row count is requested, the rows of tables having less rows
+# than this are still counted exactly because it's fast enough.
+BASEROW_APPROXIMATE_COUNT_MIN_ROWS = int(
+    os.getenv("BASEROW_APPROXIMATE_COUNT_MIN_ROWS", 10000)
+)
+# The number of seconds the users permitted to receive the real time messages of an
+# object are cached. It's invalidated when the members of the workspace or their
+# permissions change. Set to 0 to disable.
+BASEROW_WS_PERMITTED_USERS_CACHE_TTL_SECONDS = int(
+    os.getenv("BASEROW_WS_PERMITTED_USERS_CACHE_TTL_SECONDS", 5 * 60)
+)
+# When enabled, the row history and audit log entries are appended to a buffer in
+# Redis and inserted in batches by a periodic task instead of in the transaction of
+# the action.
+BASEROW_BUFFERED_WRITES_ENABLED = str_to_bool(
+    os.getenv("BASEROW_BUFFERED_WRITES_ENABLED", "false")
+)
+BASEROW_BUFFERED_WRITES_FLUSH_INTERVAL_SECONDS = int(
+    os.getenv("BASEROW_BUFFERED_WRITES_FLUSH_INTERVAL_SECONDS", 10)
+)
+# The row history and audit log tables can be converted to tables partitioned by
+# range of time with the `partition_tables` management command. Each partition
+# contains a month or a day of entries. The partitions are created
+# BASEROW_TIME_PARTITIONS_AHEAD intervals ahead, and at least 14 days ahead with
+# daily partitions, because inserts fail if the partition doesn't exist.
+BASEROW_TIME_PARTITION_INTERVAL = os.getenv("BASEROW_TIME_PARTITION_INTERVAL", "month")
+if BASEROW_TIME_PARTITION_INTERVAL not in ("month", "day"):
+    raise ImproperlyConfigured(
+        "BASEROW_TIME_PARTITION_INTERVAL must be either 'month' or 'day'."
+    )
+BASEROW_TIME_PARTITIONS_AHEAD = int(os.getenv("BASEROW_TIME_PARTITIONS_AHEAD", 3))
 BASEROW_NOWAIT_FOR_LOCKS = not bool(
     os.getenv("BASEROW_WAIT_INSTEAD_OF_409_CONFLICT_ERROR", False)
 )
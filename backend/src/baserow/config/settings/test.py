@@ -117,6 +117,21 @@ BASEROW_LOGIN_ACTION_LOG_LIMIT = RateLimit.from_string("1000/s")
 
 BASEROW_WEBHOOKS_ALLOW_PRIVATE_ADDRESS = False
 
+# Tests often change tables directly in the database, so the generated model classes
+# must not be kept in memory unless explicitly enabled. The cache is cleared between
+# tests and the row, field and formula flows are tested with the cache enabled in
+# `tests/baserow/contrib/database/table/test_generated_model_classes_cache.py`.
+BASEROW_GENERATED_MODEL_CLASSES_CACHE_SIZE = 0
+
+# Tests often change field dependencies directly in the database, so the traversal of
+# the dependency graph must not be cached unless explicitly enabled.
+BASEROW_FIELD_DEPENDENCIES_CACHE_TTL_SECONDS = 0
+
+# Tests often change the workspace members and their permissions directly in the
+# database, so the users receiving the real time messages must not be cached unless
+# explicitly enabled.
+BASEROW_WS_PERMITTED_USERS_CACHE_TTL_SECONDS = 0
+
 CACHALOT_ENABLED = str_to_bool(os.getenv("CACHALOT_ENABLED", "false"))
 if CACHALOT_ENABLED:
     CACHES[CACHALOT_CACHE] = {
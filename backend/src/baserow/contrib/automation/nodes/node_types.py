@@ -1,4 +1,4 @@
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Union
 
 from django.contrib.auth.models import AbstractUser
 from django.db.models import Q, QuerySet
@@ -116,9 +116,18 @@ class AutomationNodeTriggerType(AutomationNodeType):
     def on_event(
         self,
         service_queryset: QuerySet[Service],
-        event_payload: Optional[List[Dict]] = None,
+        event_payload: Optional[Union[List[Dict], Callable[[], List[Dict]]]] = None,
         user: Optional[AbstractUser] = None,
     ):
+        """
+        Runs the workflows of the active triggers related to the services.
+
+        :param service_queryset: The services which received the event.
+        :param event_payload: The payload of the event or a callable returning it.
+            The callable is only called if at least one workflow must run.
+        :param user: The user who caused the event.
+        """
+
         from baserow.contrib.automation.workflows.service import (
             AutomationWorkflowService,
         )
@@ -140,6 +149,9 @@ class AutomationNodeTriggerType(AutomationNodeType):
         )
 
         for trigger in triggers:
+            if callable(event_payload):
+                event_payload = event_payload()
+
             workflow = trigger.workflow
             workflow_service.run_workflow(
                 workflow.id,
@@ -35,6 +35,9 @@ class DataSourceSerializer(ServiceSerializer):
     order = serializers.SerializerMethodField(
         help_text=DataSource._meta.get_field("order").help_text
     )
+    cache_ttl = serializers.SerializerMethodField(
+        help_text=DataSource._meta.get_field("cache_ttl").help_text
+    )
     type = serializers.SerializerMethodField(help_text="The type of the data source.")
 
     def _get_service_instance(self, instance):
@@ -67,6 +70,10 @@ class DataSourceSerializer(ServiceSerializer):
     def get_order(self, instance):
         return self.context["data_source"].order
 
+    @extend_schema_field(OpenApiTypes.INT)
+    def get_cache_ttl(self, instance):
+        return self.context["data_source"].cache_ttl
+
     @extend_schema_field(OpenApiTypes.OBJECT)
     def get_schema(self, instance):
         service_instance = self._get_service_instance(instance)
@@ -91,12 +98,18 @@ class DataSourceSerializer(ServiceSerializer):
             return None
 
     class Meta(ServiceSerializer.Meta):
-        fields = ServiceSerializer.Meta.fields + ("name", "page_id", "order")
+        fields = ServiceSerializer.Meta.fields + (
+            "name",
+            "page_id",
+            "order",
+            "cache_ttl",
+        )
         extra_kwargs = {
             **ServiceSerializer.Meta.extra_kwargs,
             "name": {"read_only": True},
             "page_id": {"read_only": True},
             "order": {"read_only": True, "help_text": "Lowest first."},
+            "cache_ttl": {"read_only": True},
         }
 
 
@@ -116,6 +129,11 @@ class CreateDataSourceSerializer(CreateServiceSerializer):
         allow_null=True,
         help_text=DataSource._meta.get_field("page").help_text,
     )
+    cache_ttl = serializers.IntegerField(
+        required=False,
+        min_value=0,
+        help_text=DataSource._meta.get_field("cache_ttl").help_text,
+    )
     before_id = serializers.IntegerField(
         required=False,
         help_text="If provided, creates the data_source before the data_source with the "
@@ -131,6 +149,7 @@ class CreateDataSourceSerializer(CreateServiceSerializer):
         fields = CreateServiceSerializer.Meta.fields + (
             "name",
             "page_id",
+            "cache_ttl",
             "before_id",
         )
 
@@ -138,17 +157,23 @@ class CreateDataSourceSerializer(CreateServiceSerializer):
 class BaseUpdateDataSourceSerializer(serializers.ModelSerializer):
     class Meta(ServiceSerializer.Meta):
         model = DataSource
-        fields = ("name",)
+        fields = ("name", "cache_ttl")
         extra_kwargs = {
             "name": {"required": False},
+            "cache_ttl": {"required": False},
         }
 
 
 class UpdateDataSourceSerializer(UpdateServiceSerializer):
     name = serializers.CharField(required=False)
+    cache_ttl = serializers.IntegerField(
+        required=False,
+        min_value=0,
+        help_text=DataSource._meta.get_field("cache_ttl").help_text,
+    )
 
     class Meta(ServiceSerializer.Meta):
-        fields = UpdateServiceSerializer.Meta.fields + ("name",)
+        fields = UpdateServiceSerializer.Meta.fields + ("name", "cache_ttl")
 
 
 class MoveDataSourceSerializer(serializers.Serializer):
@@ -1,7 +1,14 @@
-from typing import TYPE_CHECKING, Any, Dict, Iterable, Optional, Union
+import hashlib
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Union
 from zipfile import ZipFile
 
+from django.conf import settings
 from django.core.files.storage import Storage
+from django.db import connections, transaction
 from django.db.models import Q, QuerySet
 from django.db.utils import DatabaseError, IntegrityError
 
@@ -16,7 +23,7 @@ from baserow.contrib.builder.data_sources.models import DataSource
 from baserow.contrib.builder.formula_importer import import_formula
 from baserow.contrib.builder.pages.models import Page
 from baserow.contrib.builder.types import DataSourceDict
-from baserow.core.cache import local_cache
+from baserow.core.cache import global_cache, local_cache
 from baserow.core.integrations.models import Integration
 from baserow.core.integrations.registries import integration_type_registry
 from baserow.core.services.exceptions import (
@@ -33,6 +40,9 @@ from .types import DataSourceForUpdate
 if TYPE_CHECKING:
     from baserow.contrib.builder.models import Builder
 
+# Keeps track of the data source dispatch locks held by the current thread.
+_dispatch_thread_state = threading.local()
+
 
 class DataSourceHandler:
     def __init__(self):
@@ -338,6 +348,7 @@ class DataSourceHandler:
         name: str,
         service_type: Optional[ServiceType] = None,
         before: Optional[DataSource] = None,
+        cache_ttl: int = 0,
         **kwargs,
     ) -> DataSource:
         """
@@ -347,6 +358,8 @@ class DataSourceHandler:
         :param name: The human name of the data_source.
         :param service_type: The type of the service related to the data_source.
         :param before: If set, the new data_source is inserted before this data_source.
+        :param cache_ttl: The number of seconds the published dispatch result is
+            cached.
         :param kwargs: Additional attributes of the related service.
         :raises CannotCalculateIntermediateOrder: If it's not possible to find an
             intermediate order. The full order of the data_source of the page must be
@@ -368,7 +381,7 @@ class DataSourceHandler:
 
         try:
             data_source = DataSource.objects.create(
-                page=page, order=order, name=name, service=service
+                page=page, order=order, name=name, service=service, cache_ttl=cache_ttl
             )
         except IntegrityError as error:
             # The only unique values are page and name, together.
@@ -386,6 +399,7 @@ class DataSourceHandler:
         service_type: Optional[ServiceType] = None,
         name: Optional[str] = None,
         page: Optional[Page] = None,
+        cache_ttl: Optional[int] = None,
         **kwargs,
     ) -> DataSource:
         """
@@ -395,6 +409,8 @@ class DataSourceHandler:
         :param service_type: The service type for the data_source's service.
         :param name: A new name for the data_source.
         :param page: The data source's page.
+        :param cache_ttl: The number of seconds the published dispatch result is
+            cached.
         :param kwargs: The values that should be set on the data_source.
         :return: The updated data_source.
         """
@@ -446,6 +462,9 @@ class DataSourceHandler:
         if name is not None:
             data_source.name = name
 
+        if cache_ttl is not None:
+            data_source.cache_ttl = cache_ttl
+
         try:
             data_source.save()
         except DatabaseError:
@@ -479,6 +498,15 @@ class DataSourceHandler:
             result for this data source.
         """
 
+        max_workers = min(
+            settings.BUILDER_DATA_SOURCES_DISPATCH_MAX_WORKERS,
+            len(data_sources),
+        )
+        if max_workers > 1:
+            return self._dispatch_data_sources_concurrently(
+                data_sources, dispatch_context, max_workers
+            )
+
         data_sources_dispatch = {}
         for data_source in data_sources:
             # Add the initial call to the call stack
@@ -494,6 +522,79 @@ class DataSourceHandler:
 
         return data_sources_dispatch
 
+    def _dispatch_data_sources_concurrently(
+        self,
+        data_sources: List[DataSource],
+        dispatch_context: BuilderDispatchContext,
+        max_workers: int,
+    ) -> Dict[int, Any]:
+        """
+        Dispatches the data sources in a pool of threads, so that the slow services
+        don't wait for each other. Every thread uses its own database connection,
+        the dispatched services must therefore not depend on uncommitted data.
+
+        The results are shared between the threads, so that a data source referenced
+        by another one is dispatched only once when possible, see
+        `_data_source_dispatch_lock`.
+
+        :param data_sources: The data sources to be dispatched.
+        :param dispatch_context: The context used for the dispatch.
+        :param max_workers: The maximum number of threads.
+        :return: The result of dispatching the data source mapped by data source ID.
+        """
+
+        # These are shared by all the contexts created from this one, so that every
+        # data source is only dispatched once.
+        dispatch_context.cache.setdefault("data_source_contents", {})
+        dispatch_context.cache.setdefault(
+            "data_source_dispatch_locks",
+            {data_source.id: threading.RLock() for data_source in data_sources},
+        )
+
+        def dispatch(data_source):
+            # Every thread needs its own call stack.
+            thread_dispatch_context = BuilderDispatchContext.from_context(
+                dispatch_context
+            )
+            thread_dispatch_context.add_call(data_source.id)
+            try:
+                return self.dispatch_data_source(data_source, thread_dispatch_context)
+            except Exception as e:
+                return e
+            finally:
+                connections.close_all()
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(dispatch, data_sources)
+            return {
+                data_source.id: result
+                for data_source, result in zip(data_sources, results)
+            }
+
+    @contextmanager
+    def _data_source_dispatch_lock(self, cache: Dict[str, Any], data_source_id: int):
+        """
+        Prevents the data sources dispatched concurrently from being dispatched by
+        two threads at the same time. A thread only waits for a data source if it
+        doesn't hold the lock of another one, so that two threads can never wait on
+        each other. Otherwise, the data source is dispatched again.
+        """
+
+        lock = cache.get("data_source_dispatch_locks", {}).get(data_source_id)
+        if lock is None:
+            yield
+            return
+
+        held_locks = getattr(_dispatch_thread_state, "held_locks", 0)
+        acquired = lock.acquire(blocking=held_locks == 0)
+        _dispatch_thread_state.held_locks = held_locks + int(acquired)
+        try:
+            yield
+        finally:
+            if acquired:
+                _dispatch_thread_state.held_locks -= 1
+                lock.release()
+
     def dispatch_data_source(
         self, data_source: DataSource, dispatch_context: BuilderDispatchContext
     ) -> Any:
@@ -535,17 +636,122 @@ class DataSourceHandler:
                     "You can't reference a data source after the current data source"
                 )
 
-        if data_source.id not in cache.setdefault("data_source_contents", {}):
-            service_dispatch = self.service_handler.dispatch_service(
-                data_source.service.specific, dispatch_context
-            )
-
-            # Cache the dispatch in the formula cache if we have formulas that need
-            # it later
-            cache["data_source_contents"][data_source.id] = service_dispatch.data
+        with self._data_source_dispatch_lock(cache, data_source.id):
+            if data_source.id not in cache.setdefault("data_source_contents", {}):
+                # Cache the dispatch in the formula cache if we have formulas that
+                # need it later
+                cache["data_source_contents"][
+                    data_source.id
+                ] = self._dispatch_data_source_service(data_source, dispatch_context)
 
         return cache["data_source_contents"][data_source.id]
 
+    def _dispatch_data_source_service(
+        self, data_source: DataSource, dispatch_context: BuilderDispatchContext
+    ) -> Any:
+        """
+        Dispatches the service of the data source. If the data source has a cache
+        TTL and belongs to a published builder, the result is shared in the global
+        cache between all the requests having the same parameters, so that many
+        visitors of a public page don't each hit the database.
+
+        :param data_source: The data source to dispatch.
+        :param dispatch_context: The context used for the dispatch.
+        :return: The data of the service dispatch.
+        """
+
+        service = data_source.service.specific
+
+        def dispatch():
+            return self.service_handler.dispatch_service(service, dispatch_context).data
+
+        # Only the published builders don't have a workspace. The editor must always
+        # show fresh data.
+        if not data_source.cache_ttl or dispatch_context.page.builder.workspace_id:
+            return dispatch()
+
+        table_id = getattr(service, "table_id", None)
+        invalidate_key = (
+            self.get_dispatch_cache_invalidate_key(service.table.database_id)
+            if table_id
+            else None
+        )
+
+        return global_cache.get(
+            self._get_dispatch_cache_key(data_source, dispatch_context),
+            default=dispatch,
+            invalidate_key=invalidate_key,
+            timeout=data_source.cache_ttl,
+        )
+
+    def _get_dispatch_cache_key(
+        self, data_source: DataSource, dispatch_context: BuilderDispatchContext
+    ) -> str:
+        """
+        Returns the cache key of the dispatch of the data source. It contains
+        everything that can influence the result: the formula inputs sent by the
+        client, the pagination, search, filter and sort parameters and the user
+        source user. Anonymous visitors all share the same entries. The id of an
+        authenticated user is part of the key because formulas can reference it.
+        """
+
+        request = dispatch_context.request
+        user = getattr(request, "user_source_user", None)
+        if user is None or user.is_anonymous:
+            user_key = None
+        else:
+            user_key = [user.user_source_id, user.id, user.role]
+
+        metadata = getattr(request, "data", {}).get("metadata", {})
+        if isinstance(metadata, str):
+            try:
+                metadata = json.loads(metadata)
+            except json.JSONDecodeError:
+                pass
+
+        element = dispatch_context.element
+        parameters = json.dumps(
+            [
+                user_key,
+                metadata,
+                dispatch_context.range(data_source.service),
+                dispatch_context.search_query(),
+                dispatch_context.filters(),
+                dispatch_context.sortings(),
+                dispatch_context.only_record_id,
+                dispatch_context.only_expose_public_allowed_properties,
+                element.id if element else None,
+            ],
+            sort_keys=True,
+            default=str,
+        )
+        parameters_hash = hashlib.sha1(
+            parameters.encode("utf-8"), usedforsecurity=False
+        ).hexdigest()
+
+        return f"ab_data_source_{data_source.id}_dispatch_{parameters_hash}"
+
+    @classmethod
+    def get_dispatch_cache_invalidate_key(cls, database_id: int) -> str:
+        return f"database_{database_id}__ab_data_source_dispatch_invalidate_key"
+
+    @classmethod
+    def invalidate_dispatch_cache(cls, database_id: int):
+        """
+        Invalidates the cached dispatches of all the published data sources using
+        a table of the given database. The published pages are only visited by
+        other requests, so it's enough to invalidate once the transaction commits.
+        Invalidating earlier would allow a concurrent request to cache the old rows
+        again before the commit.
+
+        :param database_id: The database where the data has changed.
+        """
+
+        invalidate_key = cls.get_dispatch_cache_invalidate_key(database_id)
+        transaction.on_commit(
+            lambda: global_cache.invalidate(invalidate_key=invalidate_key)
+        )
+
     def move_data_source(
         self, data_source: DataSourceForUpdate, before: Optional[DataSource] = None
     ) -> DataSource:
@@ -611,6 +817,7 @@ class DataSourceHandler:
             name=data_source.name,
             order=str(data_source.order),
             service=serialized_service,
+            cache_ttl=data_source.cache_ttl,
         )
 
     def import_data_source(
@@ -667,6 +874,7 @@ class DataSourceHandler:
             service=service,
             order=serialized_data_source["order"],
             name=serialized_data_source["name"],
+            cache_ttl=serialized_data_source.get("cache_ttl", 0),
         )
 
         id_mapping["builder_data_sources"][
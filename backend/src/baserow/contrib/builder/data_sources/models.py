@@ -46,6 +46,12 @@ class DataSource(
     service = models.OneToOneField(
         Service, on_delete=models.SET_NULL, null=True, related_name="data_source"
     )
+    cache_ttl = models.PositiveIntegerField(
+        default=0,
+        help_text="The number of seconds the result of a dispatch of the published "
+        "data source is shared between the visitors sending the same parameters. "
+        "The result isn't cached if 0.",
+    )
 
     class Meta:
         ordering = ("page_id", "order", "id")
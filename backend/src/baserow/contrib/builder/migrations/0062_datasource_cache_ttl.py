@@ -0,0 +1,22 @@
+# Generated by Django 5.0.13 on 2026-10-18 10:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("builder", "0061_coresmtpemailworkflowaction"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="datasource",
+            name="cache_ttl",
+            field=models.PositiveIntegerField(
+                default=0,
+                help_text="The number of seconds the result of a dispatch of the "
+                "published data source is shared between the visitors sending the "
+                "same parameters. The result isn't cached if 0.",
+            ),
+        ),
+    ]
@@ -1,11 +1,14 @@
 from django.dispatch import receiver
 
 from baserow.contrib.builder.data_sources import signals as ds_signals
+from baserow.contrib.builder.data_sources.handler import DataSourceHandler
 from baserow.contrib.builder.elements import signals as element_signals
 from baserow.contrib.builder.handler import BuilderHandler
 from baserow.contrib.builder.models import Builder
 from baserow.contrib.builder.pages import signals as page_signals
 from baserow.contrib.builder.workflow_actions import signals as wa_signals
+from baserow.contrib.database.fields import signals as field_signals
+from baserow.contrib.database.rows import signals as row_signals
 from baserow.core.user_sources import signals as us_signals
 
 __all__ = [
@@ -21,6 +24,8 @@ __all__ = [
     "ds_deleted",
     "page_deleted",
     "page_updated",
+    "rows_changed",
+    "field_changed",
 ]
 
 # Elements
@@ -90,6 +95,22 @@ def ds_deleted(sender, data_source_id, page, user, **kwargs):
     BuilderHandler().invalidate_builder_public_properties_cache(page.builder)
 
 
+# Rows and fields of the tables used by the data sources
+
+
+@receiver(row_signals.rows_created)
+@receiver(row_signals.rows_updated)
+@receiver(row_signals.rows_deleted)
+def rows_changed(sender, table, **kwargs):
+    DataSourceHandler.invalidate_dispatch_cache(table.database_id)
+
+
+@receiver(field_signals.field_updated)
+@receiver(field_signals.field_deleted)
+def field_changed(sender, field, **kwargs):
+    DataSourceHandler.invalidate_dispatch_cache(field.table.database_id)
+
+
 # Page
 
 
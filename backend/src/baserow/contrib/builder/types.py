@@ -48,6 +48,7 @@ class DataSourceDict(TypedDict):
     name: str
     order: int
     service: Optional[ServiceDictSubClass]
+    cache_ttl: int
 
 
 class PageDict(TypedDict):
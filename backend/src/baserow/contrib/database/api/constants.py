@@ -38,6 +38,18 @@ ONLY_COUNT_API_PARAM = OpenApiParameter(
     description="If provided only the count will be returned.",
 )
 
+APPROXIMATE_COUNT_API_PARAM = OpenApiParameter(
+    name="approximate",
+    location=OpenApiParameter.QUERY,
+    type=OpenApiTypes.BOOL,
+    description=(
+        "Can be provided together with `count`. If provided, the count of large "
+        "tables is not calculated by counting the rows, but comes from the table "
+        "usage if the view isn't filtered or from an estimation of the database "
+        "otherwise. This is a lot faster, but the count can be inaccurate."
+    ),
+)
+
 EXCLUDE_COUNT_API_PARAM = OpenApiParameter(
     name="exclude_count",
     location=OpenApiParameter.QUERY,
@@ -237,6 +249,20 @@ PAGINATION_API_PARAMS = (
     ),
 )
 
+CURSOR_PAGINATION_API_PARAM = OpenApiParameter(
+    name="cursor",
+    location=OpenApiParameter.QUERY,
+    type=OpenApiTypes.STR,
+    description=(
+        "If provided, the rows are paginated by a cursor instead of a page number or "
+        "offset. Provide an empty value to get the first page and the "
+        "`next_cursor` of the previous response to get the next one. In contrast to "
+        "the `page` and `offset` parameters, every page is equally fast to fetch, "
+        "which makes this the preferred way to iterate over large tables. The "
+        "`size` parameter defines how many rows are returned."
+    ),
+)
+
 INCLUDE_FIELDS_API_PARAM = OpenApiParameter(
     name="include_fields",
     location=OpenApiParameter.QUERY,
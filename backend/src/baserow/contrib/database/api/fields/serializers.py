@@ -18,6 +18,9 @@ from baserow.contrib.database.fields.constants import (
     BASEROW_BOOLEAN_FIELD_FALSE_VALUES,
     BASEROW_BOOLEAN_FIELD_TRUE_VALUES,
 )
+from baserow.contrib.database.fields.expressions import (
+    get_json_aggregation_annotation_name,
+)
 from baserow.contrib.database.fields.models import Field, FieldConstraint
 from baserow.contrib.database.fields.registries import field_type_registry
 from baserow.contrib.database.fields.utils.duration import (
@@ -230,12 +233,24 @@ class ArrayValueSerializer(serializers.Serializer):
         return super().to_representation(instance)
 
 
+class LinkRowValueField(serializers.CharField):
+    """
+    Serializes the related row as the human readable value of its primary field. The
+    value is already computed if the related row has been JSON aggregated.
+    """
+
+    def get_attribute(self, instance):
+        if isinstance(instance, dict):
+            return instance["value"] or ""
+        return super().get_attribute(instance)
+
+
 class LinkRowValueSerializer(serializers.Serializer):
     id = serializers.IntegerField(
         read_only=True,
         help_text="The unique identifier of the row in the related table.",
     )
-    value = serializers.CharField(
+    value = LinkRowValueField(
         help_text="The primary field's value as a string of the row in the "
         "related table.",
         required=False,
@@ -296,7 +311,23 @@ class IntegerOrStringField(serializers.Field):
         return value
 
 
-class LimitListSerializer(serializers.ListSerializer):
+class JsonAggregatedListSerializer(serializers.ListSerializer):
+    """
+    Serializes the many to many cell value of a row. If the row has been fetched
+    with `enhance_by_fields(use_json_aggregation=True)`, the JSON aggregated value
+    is used instead of the related manager, so that no query is executed and no
+    related instances are created.
+    """
+
+    def get_attribute(self, instance):
+        annotation_name = get_json_aggregation_annotation_name(self.source)
+        instance_dict = getattr(instance, "__dict__", {})
+        if annotation_name in instance_dict:
+            return instance_dict[annotation_name] or []
+        return super().get_attribute(instance)
+
+
+class LimitListSerializer(JsonAggregatedListSerializer):
     def __init__(self, *args, **kwargs):
         self.limit = kwargs.pop("limit", None)
         super().__init__(*args, **kwargs)
@@ -23,6 +23,8 @@ from baserow.contrib.database.api.constants import (
     ADHOC_FILTERS_API_PARAMS_WITH_AGGREGATION,
     ADHOC_FILTERS_API_PARAMS_WITH_AGGREGATION_NO_COMBINE,
     ADHOC_SORTING_API_PARAM,
+    APPROXIMATE_COUNT_API_PARAM,
+    CURSOR_PAGINATION_API_PARAM,
     EXCLUDE_COUNT_API_PARAM,
     EXCLUDE_FIELDS_API_PARAM,
     INCLUDE_FIELDS_API_PARAM,
@@ -138,8 +140,10 @@ class GridViewView(APIView):
                 ),
             ),
             ONLY_COUNT_API_PARAM,
+            APPROXIMATE_COUNT_API_PARAM,
             EXCLUDE_COUNT_API_PARAM,
             *PAGINATION_API_PARAMS,
+            CURSOR_PAGINATION_API_PARAM,
             *ADHOC_FILTERS_API_PARAMS_NO_COMBINE,
             ADHOC_SORTING_API_PARAM,
             INCLUDE_FIELDS_API_PARAM,
@@ -153,7 +157,8 @@ class GridViewView(APIView):
         description=(
             "Lists the requested rows of the view's table related to the provided "
             "`view_id` if the authorized user has access to the database's workspace. "
-            "The response is paginated either by a limit/offset or page/size style. "
+            "The response is paginated either by a limit/offset, page/size or cursor "
+            "style. "
             "The style depends on the provided GET parameters. The properties of the "
             "returned rows depends on which fields the table has. For a complete "
             "overview of fields use the **list_database_table_fields** endpoint to "
@@ -189,6 +194,7 @@ class GridViewView(APIView):
                     "ERROR_VIEW_FILTER_TYPE_DOES_NOT_EXIST",
                     "ERROR_VIEW_FILTER_TYPE_UNSUPPORTED_FIELD",
                     "ERROR_FILTERS_PARAM_VALIDATION_ERROR",
+                    "ERROR_INVALID_PAGINATION_CURSOR",
                 ]
             ),
             404: get_error_schema(
@@ -247,19 +253,30 @@ class GridViewView(APIView):
             view.table, include_fields, exclude_fields
         )
 
+        has_group_bys = bool(view_type.can_group_by and view.viewgroupby_set.all())
         queryset = get_view_filtered_queryset(
-            view, adhoc_filters, order_by, query_params
+            view,
+            adhoc_filters,
+            order_by,
+            query_params,
+            # The group by metadata is computed using the related managers of the
+            # rows, so they must be prefetched in that case.
+            use_json_aggregation=not has_group_bys,
         )
         model = queryset.model
 
         if ONLY_COUNT_API_PARAM.name in request.GET:
-            return Response({"count": queryset.count()})
+            if APPROXIMATE_COUNT_API_PARAM.name in request.GET:
+                count = view_handler.get_approximate_queryset_count(queryset)
+            else:
+                count = queryset.count()
+            return Response({"count": count})
 
         response, page, _ = paginate_and_serialize_queryset(
             queryset, request, field_ids
         )
 
-        if view_type.can_group_by and view.viewgroupby_set.all():
+        if has_group_bys:
             group_by_fields = [
                 model._field_objects[group_by.field_id]["field"]
                 for group_by in view.viewgroupby_set.all()
@@ -708,8 +725,10 @@ class PublicGridViewRowsView(APIView):
                 ),
             ),
             ONLY_COUNT_API_PARAM,
+            APPROXIMATE_COUNT_API_PARAM,
             EXCLUDE_COUNT_API_PARAM,
             *PAGINATION_API_PARAMS,
+            CURSOR_PAGINATION_API_PARAM,
             ADHOC_SORTING_API_PARAM,
             INCLUDE_FIELDS_API_PARAM,
             EXCLUDE_FIELDS_API_PARAM,
@@ -732,7 +751,8 @@ class PublicGridViewRowsView(APIView):
         description=(
             "Lists the requested rows of the view's table related to the provided "
             "`slug` if the grid view is public."
-            "The response is paginated either by a limit/offset or page/size style. "
+            "The response is paginated either by a limit/offset, page/size or cursor "
+            "style. "
             "The style depends on the provided GET parameters. The properties of the "
             "returned rows depends on which fields the table has. For a complete "
             "overview of fields use the **list_database_table_fields** endpoint to "
@@ -763,6 +783,7 @@ class PublicGridViewRowsView(APIView):
                     "ERROR_VIEW_FILTER_TYPE_DOES_NOT_EXIST",
                     "ERROR_VIEW_FILTER_TYPE_UNSUPPORTED_FIELD",
                     "ERROR_FILTERS_PARAM_VALIDATION_ERROR",
+                    "ERROR_INVALID_PAGINATION_CURSOR",
                 ]
             ),
             401: get_error_schema(["ERROR_NO_AUTHORIZATION_TO_PUBLICLY_SHARED_VIEW"]),
@@ -814,7 +835,11 @@ class PublicGridViewRowsView(APIView):
         model = queryset.model
 
         if ONLY_COUNT_API_PARAM.name in request.GET:
-            return Response({"count": queryset.count()})
+            if APPROXIMATE_COUNT_API_PARAM.name in request.GET:
+                count = view_handler.get_approximate_queryset_count(queryset)
+            else:
+                count = queryset.count()
+            return Response({"count": count})
 
         response, page, _ = paginate_and_serialize_queryset(
             queryset, request, field_ids
@@ -9,6 +9,7 @@ from rest_framework.request import Request
 from rest_framework.response import Response
 
 from baserow.api.pagination import (
+    KeysetPagination,
     LimitOffsetPagination,
     LimitOffsetPaginationWithoutCount,
     Pageable,
@@ -54,6 +55,7 @@ def get_view_filtered_queryset(
     order_by: Optional[str] = None,
     query_params: Optional[Dict[str, Any]] = None,
     model: Optional[GeneratedTableModel] = None,
+    use_json_aggregation: bool = False,
 ) -> QuerySet:
     """
     Returns a queryset that is filtered based on the provided view, adhoc filters, and
@@ -64,6 +66,8 @@ def get_view_filtered_queryset(
     :param order_by: The order by string to apply to the queryset.
     :param query_params: The query parameters to apply to the queryset.
     :param model: The model to filter the queryset by.
+    :param use_json_aggregation: Whether the many to many cell values must be
+        selected as JSON in the main query instead of being prefetched.
     :return: The filtered queryset.
     """
 
@@ -85,6 +89,7 @@ def get_view_filtered_queryset(
         search=search_value,
         search_mode=search_mode,
         model=model,
+        use_json_aggregation=use_json_aggregation,
     )
 
     if has_adhoc_sorts:
@@ -162,7 +167,9 @@ def _get_paginator(request: Request) -> Pageable:
     :return: The paginator to use.
     """
 
-    if EXCLUDE_COUNT_API_PARAM.name in request.GET:
+    if KeysetPagination.is_requested(request):
+        paginator = KeysetPagination()
+    elif EXCLUDE_COUNT_API_PARAM.name in request.GET:
         if LimitOffsetPagination.limit_query_param in request.GET:
             paginator = LimitOffsetPaginationWithoutCount()
         else:
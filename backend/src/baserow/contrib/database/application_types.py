@@ -30,6 +30,7 @@ from baserow.contrib.database.views.registries import view_type_registry
 from baserow.core.db import specific_queryset
 from baserow.core.handler import CoreHandler
 from baserow.core.models import Application, Workspace
+from baserow.core.psycopg import sql
 from baserow.core.registries import (
     ApplicationType,
     ImportExportConfig,
@@ -49,6 +50,7 @@ from .db.atomic import read_repeatable_single_database_atomic_transaction
 from .export_serialized import DatabaseExportSerializedStructure
 from .fields.utils import DeferredFieldImporter, DeferredForeignKeyUpdater
 from .search.handler import SearchHandler
+from .table.constants import CREATED_BY_COLUMN_NAME, LAST_MODIFIED_BY_COLUMN_NAME
 from .table.models import GeneratedTableModel, Table
 
 
@@ -137,10 +139,22 @@ class DatabaseApplicationType(ApplicationType):
                 )
 
             serialized_rows = []
+            rows_source_model = None
             row_count_limit = settings.BASEROW_IMPORT_EXPORT_TABLE_ROWS_COUNT_LIMIT
             export_all_table_rows = not import_export_config.only_structure
+            copy_rows_in_database = False
             if export_all_table_rows:
                 model = table.get_model(fields=fields, add_dependencies=False)
+                copy_rows_in_database = self._can_copy_rows_in_database(
+                    model, import_export_config
+                )
+
+            if copy_rows_in_database:
+                # The rows don't leave the instance, so instead of serializing them,
+                # the import copies them directly from this table in the database.
+                rows_source_model = model
+                progress.increment()
+            elif export_all_table_rows:
                 row_queryset = model.objects.all()[: row_count_limit or None]
 
                 row_progress = progress.create_child(1, row_queryset.count())
@@ -187,6 +201,8 @@ class DatabaseApplicationType(ApplicationType):
                 rows=serialized_rows,
                 data_sync=serialized_data_sync,
             )
+            if rows_source_model is not None:
+                structure["_rows_source_model"] = rows_source_model
 
             for serialized_structure in serialization_processor_registry.get_all():
                 extra_data = serialized_structure.export_serialized(
@@ -198,6 +214,24 @@ class DatabaseApplicationType(ApplicationType):
 
         return serialized_tables
 
+    def _can_copy_rows_in_database(
+        self, model: GeneratedTableModel, import_export_config: ImportExportConfig
+    ) -> bool:
+        """
+        Indicates whether the rows of the table can be copied directly in the database
+        by the import instead of being serialized. This is only possible if the data
+        doesn't leave the instance and if all the field types support it.
+        """
+
+        return (
+            import_export_config.is_duplicate
+            and not settings.BASEROW_IMPORT_EXPORT_TABLE_ROWS_COUNT_LIMIT
+            and all(
+                field_object["type"].can_copy_rows_in_database
+                for field_object in model._field_objects.values()
+            )
+        )
+
     def export_serialized(
         self,
         database: Database,
@@ -635,6 +669,18 @@ class DatabaseApplicationType(ApplicationType):
 
         for serialized_table in serialized_tables:
             table_model = serialized_table["_model"]
+            rows_source_model = serialized_table.get("_rows_source_model")
+            if rows_source_model is not None:
+                self._copy_table_rows_in_database(
+                    rows_source_model,
+                    table_model,
+                    id_mapping,
+                    user_email_mapping,
+                    already_filled_up_through_table_names,
+                )
+                self._reset_table_sequence(table_model)
+                continue
+
             rows_to_be_inserted = []
             # Holds a mapping where the key is a model, and the value a list of
             # objects that must be inserted. These objects are returned by the
@@ -703,12 +749,7 @@ class DatabaseApplicationType(ApplicationType):
             for model, objects in additional_objects_to_be_inserted.items():
                 model.objects.bulk_create(objects, batch_size=512)
 
-            # When the rows are inserted we keep the provide the old ids and because of
-            # that the auto increment is still set at `1`. This needs to be set to the
-            # maximum value because otherwise creating a new row could later fail.
-            sequence_sql = connection.ops.sequence_reset_sql(no_style(), [table_model])
-            with connection.cursor() as cursor:
-                cursor.execute(sequence_sql[0])
+            self._reset_table_sequence(table_model)
 
         # Now that the fields have been created, we need to run the deferred fk
         # updates pointing to those.
@@ -720,6 +761,198 @@ class DatabaseApplicationType(ApplicationType):
         # total progress of this import.
         self._after_rows_imported(imported_fields, progress)
 
+    def _reset_table_sequence(self, table_model: GeneratedTableModel):
+        """
+        When the rows are inserted we keep the provide the old ids and because of
+        that the auto increment is still set at `1`. This needs to be set to the
+        maximum value because otherwise creating a new row could later fail.
+        """
+
+        sequence_sql = connection.ops.sequence_reset_sql(no_style(), [table_model])
+        with connection.cursor() as cursor:
+            cursor.execute(sequence_sql[0])
+
+    def _copy_table_rows_in_database(
+        self,
+        source_model: GeneratedTableModel,
+        table_model: GeneratedTableModel,
+        id_mapping: Dict[str, Any],
+        user_email_mapping: Dict[str, Any],
+        already_filled_up_through_table_names: Set[str],
+    ):
+        """
+        Copies the rows of the original table into the imported table with a single
+        `INSERT ... SELECT` query, and the relations of the many to many fields in the
+        same way. This is much faster than serializing and importing every row in
+        Python and doesn't load the rows in memory, but it's only possible when the
+        original table lives in the same database.
+
+        :param source_model: The model of the original table.
+        :param table_model: The model of the imported table.
+        :param id_mapping: The map of exported ids to newly created ids.
+        :param user_email_mapping: A mapping of user emails to the users that can be
+            referenced by the rows.
+        :param already_filled_up_through_table_names: The names of the through tables
+            that have already been filled up by the import of another table. The
+            through tables filled up by this method are added to it.
+        """
+
+        # Maps the field names of the imported table to the field objects of the
+        # original and the imported table.
+        field_objects = {}
+        for field_id, source_field_object in source_model._field_objects.items():
+            field_object = table_model._field_objects.get(
+                id_mapping["database_fields"].get(field_id)
+            )
+            if field_object is not None:
+                field_objects[field_object["name"]] = (
+                    source_field_object,
+                    field_object,
+                )
+
+        source_alias = "source"
+        user_ids = [user.id for user in user_email_mapping.values()]
+        source_field_names = {f.name for f in source_model._meta.concrete_fields}
+        columns, expressions, params = [], [], []
+        for model_field in table_model._meta.concrete_fields:
+            columns.append(sql.Identifier(model_field.column))
+            name = model_field.name
+            if name in field_objects:
+                source_field_object, field_object = field_objects[name]
+                source_column = source_model._meta.get_field(
+                    source_field_object["name"]
+                ).column
+                expressions.append(
+                    field_object["type"].get_rows_copy_sql_expression(
+                        field_object["field"],
+                        sql.Identifier(source_alias, source_column),
+                        id_mapping,
+                    )
+                )
+            elif name in source_field_names and name in (
+                CREATED_BY_COLUMN_NAME,
+                LAST_MODIFIED_BY_COLUMN_NAME,
+            ):
+                # Only the users of the workspace can be referenced, just like when
+                # importing the serialized email addresses.
+                source_column = sql.Identifier(source_alias, model_field.column)
+                expressions.append(
+                    sql.SQL(
+                        "CASE WHEN {column} = ANY({user_ids}) THEN {column} END"
+                    ).format(column=source_column, user_ids=sql.Placeholder())
+                )
+                params.append(user_ids)
+            elif name in source_field_names and name in (
+                "id",
+                "order",
+                "created_on",
+                "updated_on",
+            ):
+                expressions.append(sql.Identifier(source_alias, model_field.column))
+            else:
+                expressions.append(sql.Placeholder())
+                params.append(
+                    model_field.get_db_prep_save(model_field.get_default(), connection)
+                )
+
+        query = sql.SQL(
+            "INSERT INTO {table} ({columns}) SELECT {expressions} "
+            "FROM {source_table} AS {source_alias} WHERE NOT {source_alias}.trashed"
+        ).format(
+            table=sql.Identifier(table_model._meta.db_table),
+            columns=sql.SQL(", ").join(columns),
+            expressions=sql.SQL(", ").join(expressions),
+            source_table=sql.Identifier(source_model._meta.db_table),
+            source_alias=sql.Identifier(source_alias),
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(query, params)
+
+        for model_field in table_model._meta.many_to_many:
+            through_table_name = model_field.remote_field.through._meta.db_table
+            if (
+                model_field.name not in field_objects
+                or through_table_name in already_filled_up_through_table_names
+            ):
+                continue
+            already_filled_up_through_table_names.add(through_table_name)
+            source_field_object, field_object = field_objects[model_field.name]
+            self._copy_through_table_rows_in_database(
+                source_model._meta.get_field(source_field_object["name"]),
+                model_field,
+                field_object,
+                id_mapping,
+            )
+
+    def _copy_through_table_rows_in_database(
+        self,
+        source_model_field: models.ManyToManyField,
+        model_field: models.ManyToManyField,
+        field_object: Dict[str, Any],
+        id_mapping: Dict[str, Any],
+    ):
+        """
+        Copies the relations of a many to many field of the original table into the
+        through table of the imported field. Relations to trashed rows are not copied
+        because the trashed rows are not copied either.
+
+        :param source_model_field: The many to many field of the original table.
+        :param model_field: The many to many field of the imported table.
+        :param field_object: The field object of the imported field.
+        :param id_mapping: The map of exported ids to newly created ids.
+        """
+
+        source_through_fields = (
+            source_model_field.remote_field.through._meta.get_fields()
+        )
+        source_current_field = source_through_fields[1]
+        source_relation_field = source_through_fields[2]
+        through_model = model_field.remote_field.through
+        through_fields = through_model._meta.get_fields()
+
+        source = sql.Identifier("source")
+        relation_expression = field_object["type"].get_rows_copy_sql_expression(
+            field_object["field"],
+            sql.Identifier("source", source_relation_field.column),
+            id_mapping,
+        )
+        conditions = [
+            sql.SQL("{}.{} IN (SELECT id FROM {} WHERE NOT trashed)").format(
+                source,
+                sql.Identifier(source_current_field.column),
+                sql.Identifier(source_current_field.related_model._meta.db_table),
+            ),
+            sql.SQL("{} IS NOT NULL").format(relation_expression),
+        ]
+        related_model = source_relation_field.related_model
+        if any(f.name == "trashed" for f in related_model._meta.concrete_fields):
+            conditions.append(
+                sql.SQL("{}.{} IN (SELECT id FROM {} WHERE NOT trashed)").format(
+                    source,
+                    sql.Identifier(source_relation_field.column),
+                    sql.Identifier(related_model._meta.db_table),
+                )
+            )
+
+        query = sql.SQL(
+            "INSERT INTO {through_table} ({current_column}, {relation_column}) "
+            "SELECT {source}.{source_current_column}, {relation_expression} "
+            "FROM {source_through_table} AS {source} WHERE {conditions}"
+        ).format(
+            through_table=sql.Identifier(through_model._meta.db_table),
+            current_column=sql.Identifier(through_fields[1].column),
+            relation_column=sql.Identifier(through_fields[2].column),
+            source=source,
+            source_current_column=sql.Identifier(source_current_field.column),
+            relation_expression=relation_expression,
+            source_through_table=sql.Identifier(
+                source_model_field.remote_field.through._meta.db_table
+            ),
+            conditions=sql.SQL(" AND ").join(conditions),
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(query)
+
     def _import_serialized_fields_values_to_row(
         self,
         row_instance: GeneratedTableModel,
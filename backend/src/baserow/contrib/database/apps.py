@@ -1052,6 +1052,22 @@ class DatabaseConfig(AppConfig):
         row_history_provider_registry.register(UpdateRowsHistoryProvider())
         row_history_provider_registry.register(RestoreFromTrashHistoryProvider())
 
+        from baserow.contrib.database.rows.buffered_write_types import (
+            RowHistoryBufferedWriteType,
+        )
+        from baserow.core.buffered_writes import buffered_write_type_registry
+
+        buffered_write_type_registry.register(RowHistoryBufferedWriteType())
+
+        from baserow.contrib.database.rows.partition_types import (
+            RowHistoryTimePartitionedModelType,
+        )
+        from baserow.core.partitioning import time_partitioned_model_type_registry
+
+        time_partitioned_model_type_registry.register(
+            RowHistoryTimePartitionedModelType()
+        )
+
         from baserow.contrib.database.fields.field_constraints import (
             RatingTypeUniqueWithEmptyConstraint,
             TextTypeUniqueWithEmptyConstraint,
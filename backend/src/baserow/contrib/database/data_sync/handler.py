@@ -1,5 +1,7 @@
+import hashlib
+import json
 from copy import deepcopy
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 from django.contrib.auth.models import AbstractUser
 from django.core.cache import cache
@@ -7,6 +9,8 @@ from django.db.models import Prefetch, QuerySet
 from django.utils import timezone, translation
 from django.utils.translation import gettext as _
 
+from celery.utils import chunks
+
 from baserow.contrib.database.db.schema import safe_django_schema_editor
 from baserow.contrib.database.fields.constants import DeleteFieldStrategyEnum
 from baserow.contrib.database.fields.handler import FieldHandler
@@ -15,7 +19,6 @@ from baserow.contrib.database.fields.registries import field_type_registry
 from baserow.contrib.database.models import Database
 from baserow.contrib.database.operations import CreateTableDatabaseTableOperationType
 from baserow.contrib.database.rows.handler import RowHandler
-from baserow.contrib.database.rows.types import CreatedRowsData
 from baserow.contrib.database.search.handler import SearchHandler
 from baserow.contrib.database.table.models import Table
 from baserow.contrib.database.table.operations import UpdateDatabaseTableOperationType
@@ -38,10 +41,12 @@ from .exceptions import (
     SyncError,
     UniquePrimaryPropertyNotFound,
 )
-from .models import DataSync, DataSyncSyncedProperty
+from .models import DataSync, DataSyncRowHash, DataSyncSyncedProperty
 from .operations import SyncTableOperationType
 from .registries import data_sync_type_registry
 
+SYNC_BATCH_SIZE = 1000
+
 
 class DataSyncHandler:
     def get_data_sync(
@@ -357,48 +362,67 @@ class DataSyncHandler:
         key_to_property = {p.key: p for p in all_properties}
         progress.increment(by=1)  # makes the total `2`
 
-        existing_rows_queryset = model.objects.all().values(
-            # There is no need to fetch the rows cell values from the row because we
-            # don't need them.
-            *["id"]
-            + list(key_to_field_id.values())
-        )
-        progress.increment(by=6)  # makes the total `9`
+        field_names = list(key_to_field_id.values())
+        unique_primary_field_names = [
+            key_to_field_id[key] for key in unique_primary_keys
+        ]
+        hash_keys = sorted(key_to_field_id.keys())
 
-        existing_rows_in_table = {
-            tuple(row[key_to_field_id[key]] for key in unique_primary_keys): row
-            for row in existing_rows_queryset
+        existing_rows_in_table = {}
+        row_ids_to_delete = []
+        # Only the ids and the unique primary values of the existing rows are fetched,
+        # the other cell values are only needed for the rows that might have changed.
+        for row_id, *primary_values in (
+            model.objects.all()
+            .values_list("id", *unique_primary_field_names)
+            .iterator(chunk_size=SYNC_BATCH_SIZE)
+        ):
             # Unique primaries can't be empty. If they are, then they're left dangling
             # because the primary was removed. They will be deleted later.
-            if all(row[key_to_field_id[key]] for key in unique_primary_keys)
-        }
-        progress.increment(by=1)  # makes the total `10`
-
-        rows_of_data_sync = {
-            tuple(row[key] for key in unique_primary_keys): row
-            for row in data_sync_type.get_all_rows(
-                data_sync,
-                progress_builder=progress.create_child_builder(
-                    represents_progress=56  # makes the total `66`
-                ),
+            if all(primary_values):
+                existing_rows_in_table[tuple(primary_values)] = row_id
+            else:
+                row_ids_to_delete.append(row_id)
+        existing_row_hashes = dict(
+            DataSyncRowHash.objects.filter(data_sync=data_sync).values_list(
+                "row_id", "hash"
             )
-        }
+        )
+        progress.increment(by=7)  # makes the total `9`
 
-        rows_to_create = []
-        for new_id, data in rows_of_data_sync.items():
-            if new_id not in existing_rows_in_table:
-                rows_to_create.append(
-                    {
-                        f"field_{property.field_id}": data[property.key]
-                        for property in enabled_properties
-                    }
-                )
+        rows_to_create = {}
+        changed_rows = {}
+        synced_row_ids = set()
+        progress.increment(by=1)  # makes the total `10`
+
+        # The source rows are consumed one by one. The rows of which the hash is
+        # unchanged since the last sync are equal to the row in the table, so they're
+        # not kept in memory.
+        for row in data_sync_type.get_all_rows(
+            data_sync,
+            progress_builder=progress.create_child_builder(
+                represents_progress=56  # makes the total `66`
+            ),
+        ):
+            new_id = tuple(row[key] for key in unique_primary_keys)
+            row_hash = self._get_row_hash(row, hash_keys)
+            row_id = existing_rows_in_table.get(new_id)
+            if row_id is None:
+                rows_to_create[new_id] = (row, row_hash)
+            else:
+                synced_row_ids.add(row_id)
+                if existing_row_hashes.get(row_id) == row_hash:
+                    changed_rows.pop(row_id, None)
+                else:
+                    changed_rows[row_id] = (row, row_hash)
         progress.increment(by=1)  # makes the total `67`
 
         rows_to_update = []
-        for existing_id, existing_record in existing_rows_in_table.items():
-            if existing_id in rows_of_data_sync:
-                new_record_data = rows_of_data_sync[existing_id]
+        for chunk in chunks(iter(changed_rows.keys()), SYNC_BATCH_SIZE):
+            for existing_record in model.objects.filter(id__in=chunk).values(
+                "id", *field_names
+            ):
+                new_record_data, _ = changed_rows[existing_record["id"]]
                 changed = False
                 for enabled_property in enabled_properties:
                     key = enabled_property.key
@@ -412,36 +436,42 @@ class DataSyncHandler:
                     rows_to_update.append(existing_record)
         progress.increment(by=2)  # makes the total `69`
 
-        row_ids_to_delete = []
-        for existing_id in existing_rows_in_table.keys():
-            if existing_id is None or existing_id not in rows_of_data_sync:
-                row_ids_to_delete.append(existing_rows_in_table[existing_id]["id"])
-        # Loop over the dangling rows and delete those because they can't be identified
-        # anymore.
-        for row in existing_rows_queryset:
-            if any(not row[key_to_field_id[key]] for key in unique_primary_keys):
-                row_ids_to_delete.append(row["id"])
+        for row_id in existing_rows_in_table.values():
+            if row_id not in synced_row_ids:
+                row_ids_to_delete.append(row_id)
         progress.increment(by=1)  # makes the total `70`
 
-        created_rows = CreatedRowsData([], {})
-        if len(rows_to_create) > 0:
+        created_row_ids = []
+        new_row_hashes = {
+            row_id: row_hash for row_id, (_, row_hash) in changed_rows.items()
+        }
+        for chunk in chunks(iter(rows_to_create.values()), SYNC_BATCH_SIZE):
             created_rows = RowHandler().create_rows(
                 user=user,
                 table=data_sync.table,
                 model=model,
-                rows_values=rows_to_create,
+                rows_values=[
+                    {
+                        f"field_{property.field_id}": data[property.key]
+                        for property in enabled_properties
+                    }
+                    for data, _ in chunk
+                ],
                 generate_error_report=False,
                 send_realtime_update=False,
                 send_webhook_events=False,
                 skip_search_update=True,
             )
+            for created_row, (_, row_hash) in zip(created_rows.created_rows, chunk):
+                created_row_ids.append(created_row.id)
+                new_row_hashes[created_row.id] = row_hash
         progress.increment(by=10)  # makes the total `80`
 
-        if len(rows_to_update) > 0:
+        for chunk in chunks(iter(rows_to_update), SYNC_BATCH_SIZE):
             RowHandler().update_rows(
                 user=user,
                 table=data_sync.table,
-                rows_values=rows_to_update,
+                rows_values=chunk,
                 model=model,
                 send_realtime_update=False,
                 send_webhook_events=False,
@@ -460,6 +490,20 @@ class DataSyncHandler:
                 # The rows should not be trashed
                 permanently_delete=True,
             )
+            DataSyncRowHash.objects.filter(
+                data_sync=data_sync, row_id__in=row_ids_to_delete
+            ).delete()
+
+        DataSyncRowHash.objects.bulk_create(
+            [
+                DataSyncRowHash(data_sync=data_sync, row_id=row_id, hash=row_hash)
+                for row_id, row_hash in new_row_hashes.items()
+            ],
+            batch_size=SYNC_BATCH_SIZE,
+            update_conflicts=True,
+            update_fields=["hash"],
+            unique_fields=["data_sync", "row_id"],
+        )
         progress.increment(by=10)  # makes the total `100`
 
         if (
@@ -468,15 +512,29 @@ class DataSyncHandler:
             or len(row_ids_to_delete) > 0
         ):
             # No need to include this in the progress as it triggers a celery task
-            row_ids = [r["id"] for r in rows_to_update] + [
-                r.id for r in created_rows.created_rows
-            ]
+            row_ids = [r["id"] for r in rows_to_update] + created_row_ids
             SearchHandler.schedule_update_search_data(
                 data_sync.table,
                 fields=[p.field for p in enabled_properties],
                 row_ids=row_ids,
             )
 
+    def _get_row_hash(self, row: Dict[str, Any], keys: List[str]) -> str:
+        """
+        Computes the hash of the source row values of the provided keys. It's used to
+        detect if a row has changed since the last sync, without having to compare
+        every value with the cell values in the table.
+
+        :param row: The source row as returned by `get_all_rows`.
+        :param keys: The sorted keys of the enabled properties.
+        :return: The hex digest of the values.
+        """
+
+        values = json.dumps(
+            [row[key] for key in keys], sort_keys=True, default=str
+        ).encode("utf-8")
+        return hashlib.md5(values).hexdigest()  # nosec
+
     def set_data_sync_synced_properties(
         self,
         user: AbstractUser,
@@ -653,3 +711,12 @@ class DataSyncHandler:
                     "metadata",
                 )
             )
+
+        if (
+            properties_to_be_removed
+            or properties_to_be_added
+            or properties_to_be_updated
+        ):
+            # The cell values of the changed fields might not match the source anymore,
+            # so every row must be compared again during the next sync.
+            DataSyncRowHash.objects.filter(data_sync=data_sync).delete()
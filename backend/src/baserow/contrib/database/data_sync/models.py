@@ -82,6 +82,28 @@ class DataSyncSyncedProperty(models.Model):
     )
 
 
+class DataSyncRowHash(models.Model):
+    """
+    Stores a hash of the source values of a synced row, as they were during the last
+    sync. If the hash of a source row hasn't changed, then the row doesn't have to be
+    compared with the row in the table, and doesn't have to be updated.
+    """
+
+    data_sync = models.ForeignKey(
+        DataSync, on_delete=models.CASCADE, related_name="row_hashes"
+    )
+    row_id = models.PositiveIntegerField(
+        help_text="The id of the row in the synced table."
+    )
+    hash = models.CharField(
+        max_length=32,
+        help_text="The hash of the enabled property values of the source row.",
+    )
+
+    class Meta:
+        unique_together = ("data_sync", "row_id")
+
+
 class SyncDataSyncTableJob(Job):
     data_sync = models.ForeignKey(
         DataSync,
@@ -2,7 +2,6 @@ import abc
 import time
 from typing import Any, Callable
 
-from django.core.paginator import Paginator
 from django.db.models import QuerySet
 
 import unicodecsv as csv
@@ -12,6 +11,7 @@ from baserow.contrib.database.table.models import FieldObject
 from baserow.contrib.database.views.filters import AdHocFilters
 from baserow.contrib.database.views.handler import ViewHandler
 from baserow.contrib.database.views.registries import view_type_registry
+from baserow.core.db import KeysetQuerysetPaginator, get_estimated_count
 
 
 class FileWriter(abc.ABC):
@@ -67,12 +67,13 @@ class FileWriter(abc.ABC):
 
 class PaginatedExportJobFileWriter(FileWriter):
     """
-    Uses Django's built-in paginator to write querysets to files in a memory efficient
-    manner. Also updates the provided job as it progresses through any queryset writes
-    every EXPORT_JOB_UPDATE_FREQUENCY_SECONDS.
+    Streams querysets to files in chunks in a memory efficient manner. Also updates
+    the provided job as it progresses through any queryset writes every
+    EXPORT_JOB_UPDATE_FREQUENCY_SECONDS.
     """
 
     EXPORT_JOB_UPDATE_FREQUENCY_SECONDS = 1
+    ROWS_PER_CHUNK = 2000
 
     def __init__(self, file, job):
         super().__init__(file)
@@ -88,6 +89,37 @@ class PaginatedExportJobFileWriter(FileWriter):
     def write(self, value: str, encoding="utf-8"):
         self._file.write(value.encode(encoding))
 
+    def _iterate_chunks(self, queryset):
+        """
+        Iterates over the rows of the queryset in chunks of ROWS_PER_CHUNK rows. The
+        next chunk is selected by the sort key of the last row of the previous one,
+        so that every chunk is equally fast, even deep into very large tables. Only
+        querysets that can't be paginated by keyset fall back to offsets.
+
+        :param queryset: The queryset to iterate over.
+        :return: A generator yielding the rows of every chunk and whether it's
+            the last one.
+        """
+
+        try:
+            KeysetQuerysetPaginator.get_keyset_order(queryset)
+        except ValueError:
+            pass
+        else:
+            yield from KeysetQuerysetPaginator().iterate_queryset(
+                queryset, self.ROWS_PER_CHUNK
+            )
+            return
+
+        offset = 0
+        while True:
+            rows = list(queryset[offset : offset + self.ROWS_PER_CHUNK + 1])
+            is_last_chunk = len(rows) <= self.ROWS_PER_CHUNK
+            yield rows[: self.ROWS_PER_CHUNK], is_last_chunk
+            if is_last_chunk:
+                break
+            offset += self.ROWS_PER_CHUNK
+
     def write_rows(self, queryset, write_row, progress_weight=100):
         """
         Writes the queryset to the file using the provided write_row callback.
@@ -95,7 +127,9 @@ class PaginatedExportJobFileWriter(FileWriter):
         cancelled and if so stop writing to the file and will raise a
         ExportJobCanceledException. Finally will also update job.progress_percentage
         every EXPORT_JOB_UPDATE_FREQUENCY_SECONDS as it progresses through writing
-        the queryset.
+        the queryset. The progress is based on the number of rows estimated by the
+        query planner because counting all the rows upfront is too slow for large
+        tables.
 
         :param queryset: The queryset to write to the file.
         :param write_row: A callable function which takes each row from the queryset in
@@ -107,17 +141,22 @@ class PaginatedExportJobFileWriter(FileWriter):
         """
 
         self.update_check()
-        paginator = Paginator(queryset.all(), 2000)
+        queryset = queryset.all()
+        estimated_count = get_estimated_count(queryset)
         i = 0
         results = []
-        for page in paginator.page_range:
-            for row in paginator.page(page).object_list:
+        for rows, is_last_chunk in self._iterate_chunks(queryset):
+            last_index = len(rows) - 1
+            for index, row in enumerate(rows):
                 i = i + 1
-                is_last_row = i == paginator.count
+                is_last_row = is_last_chunk and index == last_index
                 result = write_row(row, is_last_row)
                 if result is not None:
                     results.append(result)
-                self._check_and_update_job(i, paginator.count, progress_weight)
+                # The estimate can be lower than the real number of rows, in which
+                # case the progress stays just below the end until the last row.
+                total_rows = i if is_last_row else max(estimated_count, i + 1)
+                self._check_and_update_job(i, total_rows, progress_weight)
         return results
 
     def _check_and_update_job(self, current_row, total_rows, progress_weight=100):
@@ -248,20 +287,19 @@ class QuerysetSerializer(abc.ABC):
             for export.
         """
 
+        name = field_object["name"]
+        human_name = field_object["field"].name
+        get_export_value = field_object["type"].get_export_value
+        rich_value = self.can_handle_rich_value
+
         def serializer_func(row):
-            value = getattr(row, field_object["name"])
+            value = getattr(row, name)
 
             if value is None:
                 result = ""
             else:
-                result = field_object["type"].get_export_value(
-                    value, field_object, rich_value=self.can_handle_rich_value
-                )
+                result = get_export_value(value, field_object, rich_value=rich_value)
 
-            return (
-                field_object["name"],
-                field_object["field"].name,
-                result,
-            )
+            return name, human_name, result
 
         return serializer_func
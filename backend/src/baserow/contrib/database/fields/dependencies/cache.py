@@ -0,0 +1,140 @@
+"""
+This file is responsible for caching the result of the traversal of the field
+dependency graph. Updating a row requires to know all the fields that depend on the
+updated fields, their level and the link row fields leading back to the table of the
+row. Finding them requires a recursive query on the `FieldDependency` table, which is
+slow in databases having many formula, lookup and rollup fields.
+
+Because the dependency graph can only contain fields of the same database, the
+traversal result is stored in the global cache with an invalidate key per database.
+Every time the dependencies of a field in the database change, the invalidate key
+is bumped, so that the next traversal is executed against the database again.
+"""
+
+import hashlib
+from typing import TYPE_CHECKING, Callable, Iterable, List, Optional
+
+from django.conf import settings
+from django.db import transaction
+
+from baserow.contrib.database.fields.dependencies.types import DependantFieldPath
+from baserow.core.cache import global_cache
+
+if TYPE_CHECKING:
+    from baserow.contrib.database.fields.models import Field
+
+
+def is_field_dependencies_cache_enabled() -> bool:
+    return settings.BASEROW_FIELD_DEPENDENCIES_CACHE_TTL_SECONDS > 0
+
+
+def get_field_dependencies_invalidate_key(database_id: int) -> str:
+    return f"database_{database_id}__field_dependencies_invalidate_key"
+
+
+def get_dependant_field_paths_cache_key(
+    table_id: int,
+    field_ids: Iterable[int],
+    associated_relations_changed: bool,
+    database_id: int,
+) -> str:
+    # The key must stay short, even if the dependants of many fields are requested.
+    field_ids_hash = hashlib.sha1(
+        ",".join(str(field_id) for field_id in sorted(field_ids)).encode("utf-8"),
+        usedforsecurity=False,
+    ).hexdigest()
+    return (
+        f"database_{database_id}_table_{table_id}_dependant_field_paths_"
+        f"{field_ids_hash}_{int(associated_relations_changed)}"
+    )
+
+
+def get_cached_dependant_field_paths(
+    table_id: int,
+    field_ids: Iterable[int],
+    associated_relations_changed: bool,
+    database_id: Optional[int],
+    default: Callable[[], List[DependantFieldPath]],
+) -> List[DependantFieldPath]:
+    """
+    Returns the cached dependant field paths of the provided fields or calls the
+    default callable and caches the result if there are none.
+
+    :param table_id: The table that the provided field_ids are all part of.
+    :param field_ids: The field ids for which the dependants are requested.
+    :param associated_relations_changed: Whether the dependants of the associated
+        relations are also requested.
+    :param database_id: The database of the table. Nothing is cached if not
+        provided because the cache can't be invalidated without it.
+    :param default: Called to compute the dependant field paths on a cache miss.
+    :return: The list of dependant field paths.
+    """
+
+    if database_id is None or not is_field_dependencies_cache_enabled():
+        return default()
+
+    return global_cache.get(
+        get_dependant_field_paths_cache_key(
+            table_id, field_ids, associated_relations_changed, database_id
+        ),
+        default=default,
+        invalidate_key=get_field_dependencies_invalidate_key(database_id),
+        timeout=settings.BASEROW_FIELD_DEPENDENCIES_CACHE_TTL_SECONDS,
+    )
+
+
+def invalidate_field_dependencies_cache(database_ids: Iterable[int]):
+    """
+    Invalidates the cached dependant field paths of the provided databases. The
+    cache is invalidated right away, so that the rest of the transaction sees the
+    new dependencies, and again when the transaction commits, because another
+    transaction could have cached the old dependencies in the meantime.
+
+    :param database_ids: The ids of the databases where the dependencies changed.
+    """
+
+    if not is_field_dependencies_cache_enabled():
+        return
+
+    database_ids = set(database_ids)
+
+    def invalidate():
+        for database_id in database_ids:
+            global_cache.invalidate(
+                invalidate_key=get_field_dependencies_invalidate_key(database_id)
+            )
+
+    invalidate()
+    transaction.on_commit(invalidate)
+
+
+def invalidate_field_dependencies_cache_of_fields(fields: Iterable["Field"]):
+    """
+    Invalidates the cached dependant field paths of the databases of the provided
+    fields.
+
+    :param fields: The fields whose dependencies have changed.
+    """
+
+    if not is_field_dependencies_cache_enabled():
+        return
+
+    from baserow.contrib.database.fields.models import Field
+    from baserow.contrib.database.table.models import Table
+
+    database_ids = set()
+    table_ids_to_fetch = set()
+    for field in fields:
+        if Field.table.is_cached(field):
+            database_ids.add(field.table.database_id)
+        else:
+            table_ids_to_fetch.add(field.table_id)
+
+    if table_ids_to_fetch:
+        database_ids.update(
+            Table.objects_and_trash.filter(id__in=table_ids_to_fetch).values_list(
+                "database_id", flat=True
+            )
+        )
+
+    invalidate_field_dependencies_cache(database_ids)
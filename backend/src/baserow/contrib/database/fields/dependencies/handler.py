@@ -5,8 +5,12 @@ from typing import Dict, Iterable, List, Optional, Set, Tuple
 from django.conf import settings
 from django.contrib.auth.models import AbstractUser
 from django.contrib.contenttypes.models import ContentType
-from django.db.models import Q, QuerySet
+from django.db.models import Q
 
+from baserow.contrib.database.fields.dependencies.cache import (
+    get_cached_dependant_field_paths,
+    invalidate_field_dependencies_cache_of_fields,
+)
 from baserow.contrib.database.fields.dependencies.dependency_rebuilder import (
     break_dependencies_for_field,
     rebuild_fields_dependencies,
@@ -25,6 +29,7 @@ from baserow.core.models import Workspace
 from baserow.core.types import PermissionCheck
 
 from .models import FieldDependency
+from .types import DependantFieldPath
 
 FieldDependants = List[Tuple[Field, FieldType, List[LinkRowField]]]
 
@@ -60,7 +65,9 @@ class FieldDependencyHandler:
         """
 
         update_fields_with_broken_references(fields)
-        return rebuild_fields_dependencies(fields, field_cache)
+        new_dependencies = rebuild_fields_dependencies(fields, field_cache)
+        invalidate_field_dependencies_cache_of_fields(fields)
+        return new_dependencies
 
     @classmethod
     def break_dependencies_delete_dependants(cls, field):
@@ -72,6 +79,7 @@ class FieldDependencyHandler:
         """
 
         break_dependencies_for_field(field)
+        invalidate_field_dependencies_cache_of_fields([field])
 
     @classmethod
     def _get_all_dependent_fields(
@@ -81,10 +89,12 @@ class FieldDependencyHandler:
         field_cache: FieldCache,
         associated_relations_changed: bool,
         database_id_prefilter=None,
-    ) -> Tuple[QuerySet[FieldDependency], Dict[int, Field]]:
+    ) -> Tuple[List[DependantFieldPath], Dict[int, Field]]:
         """
         Recursively fetches field dependants and retrieves specific field types in a
-        query-efficient and performant manner.
+        query-efficient and performant manner. If the database is provided, the
+        result of the traversal of the dependency graph is cached until the
+        dependencies of a field in the database change.
 
         :param table_id: The table that the provided field_ids are all part of.
         :param field_ids: The field ids for which we need to find the dependent fields,
@@ -98,12 +108,60 @@ class FieldDependencyHandler:
             specific database. Providing it brings a significant performance
             improvement but limits dependencies to the database. This can only be done
             if all the provided fields are in the same database.
-        :return: A tuple containing the queryset of the dependencies and a dictionary of
-            the specific fields.
+        :return: A tuple containing the dependant field paths and a dictionary of the
+            specific fields.
         """
 
         if len(field_ids) == 0:
-            return []
+            return [], {}
+
+        def query_dependant_field_paths():
+            return cls._query_dependant_field_paths(
+                table_id,
+                field_ids,
+                associated_relations_changed,
+                database_id_prefilter=database_id_prefilter,
+            )
+
+        dependant_field_paths = get_cached_dependant_field_paths(
+            table_id,
+            field_ids,
+            associated_relations_changed,
+            database_id_prefilter,
+            default=query_dependant_field_paths,
+        )
+        specific_fields = cls._get_specific_fields_of_dependant_field_paths(
+            dependant_field_paths, field_cache
+        )
+
+        if any(
+            field_id not in specific_fields
+            for path in dependant_field_paths
+            for field_id in [path.id, *path.via_ids]
+        ):
+            # The cached paths reference a field that has been permanently deleted
+            # since, so the dependency graph has to be traversed again.
+            dependant_field_paths = query_dependant_field_paths()
+            specific_fields = cls._get_specific_fields_of_dependant_field_paths(
+                dependant_field_paths, field_cache
+            )
+
+        return dependant_field_paths, specific_fields
+
+    @classmethod
+    def _query_dependant_field_paths(
+        cls,
+        table_id: int,
+        field_ids: Iterable[int],
+        associated_relations_changed: bool,
+        database_id_prefilter=None,
+    ) -> List[DependantFieldPath]:
+        """
+        Executes the recursive query traversing the field dependency graph. See
+        `_get_all_dependent_fields` for the parameters.
+
+        :return: The dependant field paths ordered by their depth.
+        """
 
         query_parameters = {
             "pks": list(field_ids),
@@ -222,29 +280,49 @@ class FieldDependencyHandler:
             ORDER BY MAX(depth) ASC, id ASC
         """  # nosec b608
 
-        queryset = FieldDependency.objects.raw(raw_query, query_parameters)
+        dependant_field_paths = []
+        for dependency in FieldDependency.objects.raw(raw_query, query_parameters):
+            dependant_field_paths.append(
+                DependantFieldPath(
+                    id=dependency.id,
+                    dependency_ids=[
+                        int(v)
+                        for v in (dependency.dependency_ids or "").split("|")
+                        if v
+                    ],
+                    via_ids=[
+                        int(v) for v in (dependency.via_ids or "").split("|") if v
+                    ],
+                    content_type_id=dependency.content_type_id,
+                    name=dependency.name,
+                    table_id=dependency.table_id,
+                )
+            )
+
+        return dependant_field_paths
+
+    @classmethod
+    def _get_specific_fields_of_dependant_field_paths(
+        cls, dependant_field_paths: List[DependantFieldPath], field_cache: FieldCache
+    ) -> Dict[int, Field]:
+        """
+        Fetches the specific dependant and via fields of the provided paths with as
+        few queries as possible. The fields already in the field cache are not
+        fetched again.
+
+        :param dependant_field_paths: The paths returned by the traversal.
+        :param field_cache: The field cache to lookup the fields.
+        :return: A dictionary of the specific fields by their id.
+        """
+
         link_row_field_content_type = ContentType.objects.get_for_model(LinkRowField)
         fields_to_fetch = set()
         fields_in_cache = {}
 
-        # Unpacks the dependant field id, the link row via fields, and adds them to the
+        # Adds the dependant field id and the link row via fields to the
         # `fields_to_fetch` list, so that we can later query efficiently fetch the
         # specific objects.
-        for dependency in queryset:
-            if dependency.via_ids:
-                dependency.via_ids = [
-                    int(v) for v in dependency.via_ids.split("|") if v
-                ]
-            else:
-                dependency.via_ids = []
-
-            if dependency.dependency_ids:
-                dependency.dependency_ids = [
-                    int(v) for v in dependency.dependency_ids.split("|") if v
-                ]
-            else:
-                dependency.dependency_ids = []
-
+        for dependency in dependant_field_paths:
             field = Field(
                 id=dependency.id,
                 content_type_id=dependency.content_type_id,
@@ -296,7 +374,7 @@ class FieldDependencyHandler:
                 )
             }
 
-        return queryset, {**specific_fields, **fields_in_cache}
+        return {**specific_fields, **fields_in_cache}
 
     @classmethod
     def group_dependencies_by_level(
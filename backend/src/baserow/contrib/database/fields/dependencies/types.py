@@ -1,4 +1,4 @@
-from typing import List, Tuple
+from typing import List, NamedTuple, Tuple
 
 from baserow.contrib.database.fields.dependencies.models import FieldDependency
 
@@ -7,3 +7,17 @@ TargetFieldName = str
 FieldName = str
 ThroughFieldDependency = Tuple[ThroughFieldName, TargetFieldName]
 FieldDependencies = List[FieldDependency]
+
+
+class DependantFieldPath(NamedTuple):
+    """
+    A dependant field found by traversing the field dependency graph, the ids of the
+    fields it depends on and the link row fields leading back to the starting table.
+    """
+
+    id: int
+    dependency_ids: List[int]
+    via_ids: List[int]
+    content_type_id: int
+    name: str
+    table_id: int
@@ -1,11 +1,14 @@
 from collections import defaultdict
 from typing import Dict, List, Optional, Set, Tuple, cast
 
-from django.db.models import Expression, Q, Value
+from django.db.models import BooleanField, Expression, F, Q, Value
 
 from baserow.contrib.database.fields.field_cache import FieldCache
 from baserow.contrib.database.fields.models import Field, LinkRowField
 from baserow.contrib.database.fields.signals import field_updated, fields_type_changed
+from baserow.contrib.database.formula.expression_generator.django_expressions import (
+    IsDistinctFromExpr,
+)
 from baserow.contrib.database.search.handler import SearchHandler
 from baserow.contrib.database.table.constants import (
     ROW_NEEDS_BACKGROUND_UPDATE_COLUMN_NAME,
@@ -221,7 +224,7 @@ class PathBasedUpdateStatementCollector:
 
         updated_row_ids = []
         if self.update_statements:
-            annotations, filters = {}, Q()
+            filters = Q()
 
             # If we are only updating changes, we need to filter out rows that don't
             # need to be updated. Because of how postgres works, this could save a lot
@@ -233,24 +236,17 @@ class PathBasedUpdateStatementCollector:
                     if expr is None or not field.startswith("field_"):
                         continue
 
-                    annotated_field = f"{field}_expr"
-                    annotations[annotated_field] = expr
                     # Because the expression can evaluate to null and because of how the
                     # comparison with null should be handle in SQL
                     # (https://www.postgresql.org/docs/15/functions-comparison.html), we
-                    # need to properly filter rows to correctly update only the ones
+                    # need to use `IS DISTINCT FROM` to correctly update only the rows
                     # that need to be updated.
                     filters |= Q(
-                        **{
-                            f"{field}__isnull": False,
-                            f"{annotated_field}__isnull": True,
-                        }
-                    ) | ~Q(**{field: expr})
-
-            updated_row_ids = (
-                qs.annotate(**annotations)
-                .filter(filters)
-                .update_returning_ids(**self.update_statements)
+                        IsDistinctFromExpr(F(field), expr, output_field=BooleanField())
+                    )
+
+            updated_row_ids = qs.filter(filters).update_returning_ids(
+                **self.update_statements
             )
         return updated_row_ids
 
@@ -1,10 +1,13 @@
-from typing import Callable, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Type, Union
 
+from django.contrib.postgres.aggregates import JSONBAgg
 from django.db.models import (
     CharField,
     Expression,
     F,
     Func,
+    JSONField,
+    Model,
     OuterRef,
     QuerySet,
     Subquery,
@@ -12,7 +15,7 @@ from django.db.models import (
     Value,
 )
 from django.db.models.expressions import Combinable
-from django.db.models.functions import Cast
+from django.db.models.functions import Cast, JSONObject
 
 import typing_extensions
 
@@ -163,3 +166,69 @@ def extract_jsonb_array_values_to_single_string(
         function="array_to_string",
         output_field=TextField(),
     )
+
+
+def get_json_aggregation_annotation_name(field_name: str) -> str:
+    """
+    Returns the name of the annotation containing the JSON aggregated cell value of
+    the field, see `FieldType.get_json_aggregation_expression`.
+    """
+
+    return f"{field_name}_json_agg"
+
+
+def json_aggregate_many_to_many(
+    model: Type[Model],
+    field_name: str,
+    get_json_fields: Callable[[str], Dict[str, Expression]],
+    filters: Optional[Dict[str, Any]] = None,
+    ordering: Optional[List[str]] = None,
+) -> Subquery:
+    """
+    Returns a subquery expression that aggregates the related instances of a many to
+    many field as a JSON array of objects, so that they can be selected as part of
+    the main query instead of being prefetched with an additional query.
+
+    :param model: The model containing the many to many field.
+    :param field_name: The name of the many to many field.
+    :param get_json_fields: Called with the lookup of the related instance in the
+        through model. Must return the expressions of the JSON object keys.
+    :param filters: Optional filters the related instances must match, relative to
+        the related instance.
+    :param ordering: The order of the related instances, relative to the related
+        instance. If not provided, they're ordered by the id of the through table,
+        which is the order in which they have been added.
+    :return: The subquery resolving to a JSON array, or `NULL` if there are no
+        related instances.
+    """
+
+    model_field = model._meta.get_field(field_name)
+    through_model = model_field.remote_field.through
+    source_name = model_field.m2m_field_name()
+    target_name = model_field.m2m_reverse_field_name()
+
+    filters = {
+        **(getattr(model_field, "additional_filters", None) or {}),
+        **(filters or {}),
+    }
+    ordering = (
+        ["id"]
+        if ordering is None
+        else [f"{target_name}__{order_by}" for order_by in ordering]
+    )
+
+    return Subquery(
+        through_model.objects.filter(
+            **{source_name: OuterRef("pk")},
+            **{f"{target_name}__{key}": value for key, value in filters.items()},
+        )
+        .order_by()
+        .values(source_name)
+        .annotate(
+            result=JSONBAgg(
+                JSONObject(**get_json_fields(target_name)), ordering=ordering
+            )
+        )
+        .values("result")[:1],
+        output_field=JSONField(),
+    )
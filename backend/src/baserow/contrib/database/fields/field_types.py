@@ -23,6 +23,7 @@ from typing import (
 from zipfile import ZipFile
 from zoneinfo import ZoneInfo
 
+from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import AbstractUser
 from django.contrib.postgres.aggregates import ArrayAgg, JSONBAgg, StringAgg
@@ -79,6 +80,7 @@ from baserow.contrib.database.api.fields.serializers import (
     FileFieldRequestSerializer,
     FileFieldResponseSerializer,
     IntegerOrStringField,
+    JsonAggregatedListSerializer,
     LimitListSerializer,
     LinkRowFieldSerializerMixin,
     LinkRowRequestSerializer,
@@ -155,6 +157,7 @@ from baserow.core.formula import BaserowFormulaException
 from baserow.core.formula.parser.exceptions import FormulaFunctionTypeDoesNotExist
 from baserow.core.handler import CoreHandler
 from baserow.core.models import UserFile, WorkspaceUser
+from baserow.core.psycopg import sql
 from baserow.core.registries import ImportExportConfig
 from baserow.core.storage import ExportZipFile, get_default_storage
 from baserow.core.user_files.exceptions import UserFileDoesNotExist
@@ -192,7 +195,10 @@ from .exceptions import (
     LinkRowTableNotProvided,
     SelfReferencingLinkRowCannotHaveRelatedField,
 )
-from .expressions import extract_jsonb_array_values_to_single_string
+from .expressions import (
+    extract_jsonb_array_values_to_single_string,
+    json_aggregate_many_to_many,
+)
 from .field_cache import FieldCache
 from .field_filters import (
     AnnotatedQ,
@@ -300,6 +306,9 @@ class TextFieldMatchingRegexFieldType(FieldType, ABC):
     """
 
     _can_have_db_index = True
+    can_copy_rows_in_database = True
+    can_insert_rows_with_copy = True
+    human_readable_value_is_db_value = True
 
     @property
     @abstractmethod
@@ -420,6 +429,9 @@ class ManyToManyFieldTypeSerializeToInputValueMixin:
 class TextFieldType(CollationSortMixin, FieldType):
     type = "text"
     model_class = TextField
+    can_copy_rows_in_database = True
+    can_insert_rows_with_copy = True
+    human_readable_value_is_db_value = True
     allowed_fields = ["text_default"]
     serializer_field_names = ["text_default"]
     _can_group_by = True
@@ -473,6 +485,9 @@ class TextFieldType(CollationSortMixin, FieldType):
 class LongTextFieldType(CollationSortMixin, FieldType):
     type = "long_text"
     model_class = LongTextField
+    can_copy_rows_in_database = True
+    can_insert_rows_with_copy = True
+    human_readable_value_is_db_value = True
     allowed_fields = ["long_text_enable_rich_text"]
     serializer_field_names = ["long_text_enable_rich_text"]
     _can_have_db_index = True
@@ -569,6 +584,8 @@ class NumberFieldType(FieldType):
 
     type = "number"
     model_class = NumberField
+    can_copy_rows_in_database = True
+    can_insert_rows_with_copy = True
     allowed_fields = [
         "number_decimal_places",
         "number_negative",
@@ -859,6 +876,8 @@ class NumberFieldType(FieldType):
 class RatingFieldType(FieldType):
     type = "rating"
     model_class = RatingField
+    can_copy_rows_in_database = True
+    can_insert_rows_with_copy = True
     allowed_fields = ["max_value", "color", "style"]
     serializer_field_names = ["max_value", "color", "style"]
     _can_group_by = True
@@ -990,6 +1009,8 @@ class RatingFieldType(FieldType):
 class BooleanFieldType(FieldType):
     type = "boolean"
     model_class = BooleanField
+    can_copy_rows_in_database = True
+    can_insert_rows_with_copy = True
     allowed_fields = ["boolean_default"]
     serializer_field_names = ["boolean_default"]
     _can_group_by = True
@@ -1057,6 +1078,8 @@ class BooleanFieldType(FieldType):
 class DateFieldType(FieldType):
     type = "date"
     model_class = DateField
+    can_copy_rows_in_database = True
+    can_insert_rows_with_copy = True
     allowed_fields = [
         "date_format",
         "date_include_time",
@@ -2013,6 +2036,7 @@ class CreatedByFieldType(ReadOnlyFieldType):
 class DurationFieldType(FieldType):
     type = "duration"
     model_class = DurationField
+    can_copy_rows_in_database = True
     allowed_fields = ["duration_format"]
     serializer_field_names = ["duration_format"]
     _can_group_by = True
@@ -2184,6 +2208,8 @@ class LinkRowFieldType(
 
     type = "link_row"
     model_class = LinkRowField
+    can_copy_rows_in_database = True
+    can_insert_rows_with_copy = True
     allowed_fields = [
         "link_row_table_id",
         "link_row_related_field",
@@ -2519,6 +2545,46 @@ class LinkRowFieldType(
             models.Prefetch(name, queryset=related_queryset)
         )
 
+    def get_json_aggregation_expression(self, field, name, model, **kwargs):
+        """
+        Selects the related rows with the human readable value of their primary
+        field. This is only possible if the primary field value can be computed in
+        SQL, and if no other field of the related rows must be looked up.
+        """
+
+        field_kwargs = kwargs.get(f"field_{field.id}", {})
+        if field_kwargs.get("link_row_join", None) is not None:
+            return None
+
+        remote_model = model._meta.get_field(name).remote_field.model
+        primary_field_object = next(
+            (
+                object
+                for object in remote_model._field_objects.values()
+                if object["field"].primary
+            ),
+            None,
+        )
+        if (
+            primary_field_object is None
+            or not primary_field_object["type"].human_readable_value_is_db_value
+        ):
+            return None
+
+        primary_field_name = primary_field_object["name"]
+        return json_aggregate_many_to_many(
+            model,
+            name,
+            lambda row: {
+                "id": F(f"{row}__id"),
+                "value": F(f"{row}__{primary_field_name}"),
+                # Cast to text to not lose the precision of the decimal.
+                "order": Cast(F(f"{row}__order"), models.TextField()),
+            },
+            filters={"trashed": False},
+            ordering=["order", "id"],
+        )
+
     def enhance_field_queryset(
         self, queryset: QuerySet[Field], field: Field
     ) -> QuerySet[Field]:
@@ -3648,6 +3714,7 @@ class EmailFieldType(CollationSortMixin, CharFieldMatchingRegexFieldType):
 class FileFieldType(FieldType):
     type = "file"
     model_class = FileField
+    can_copy_rows_in_database = True
     can_be_in_form_view = True
     can_get_unique_values = False
     _can_order_by_types = []
@@ -3944,6 +4011,19 @@ class SelectOptionBaseFieldType(FieldType):
     def get_default_value(self, field: Field) -> Any:
         return getattr(field, self.get_default_options_field_name(), None)
 
+    def get_rows_copy_sql_expression(self, field, source_expression, id_mapping):
+        # Maps the old select option ids to the new ones in the database. Unknown
+        # options result in `NULL`, just like when importing the serialized value.
+        select_option_mapping = {
+            str(old_id): new_id
+            for old_id, new_id in id_mapping.get(
+                "database_field_select_options", {}
+            ).items()
+        }
+        return sql.SQL("({}::jsonb ->> {}::text)::bigint").format(
+            sql.Literal(json.dumps(select_option_mapping)), source_expression
+        )
+
     def create_select_options(self, field, select_options):
         """
         Creates the select options for the field.
@@ -4145,6 +4225,8 @@ class SelectOptionBaseFieldType(FieldType):
 class SingleSelectFieldType(CollationSortMixin, SelectOptionBaseFieldType):
     type = "single_select"
     model_class = SingleSelectField
+    can_copy_rows_in_database = True
+    can_insert_rows_with_copy = True
     allowed_fields = ["select_options", "single_select_default"]
     serializer_field_names = ["select_options", "single_select_default"]
     _can_order_by_types = [DEFAULT_SORT_TYPE_KEY, SINGLE_SELECT_SORT_BY_ORDER]
@@ -4633,6 +4715,7 @@ class MultipleSelectFieldType(
 ):
     type = "multiple_select"
     model_class = MultipleSelectField
+    can_copy_rows_in_database = True
     can_get_unique_values = False
     is_many_to_many_field = True
     _can_group_by = True
@@ -4783,13 +4866,13 @@ class MultipleSelectFieldType(
 
     def get_response_serializer_field(self, instance, **kwargs):
         required = kwargs.get("required", False)
-        return SelectOptionSerializer(
+        return JsonAggregatedListSerializer(
+            child=SelectOptionSerializer(),
             **{
                 "required": required,
                 "allow_null": not required,
-                "many": True,
                 **kwargs,
-            }
+            },
         )
 
     def enhance_queryset(self, queryset, field, name, **kwargs):
@@ -4798,6 +4881,17 @@ class MultipleSelectFieldType(
         # prefetch the data individually.
         return queryset.prefetch_related(name)
 
+    def get_json_aggregation_expression(self, field, name, model, **kwargs):
+        return json_aggregate_many_to_many(
+            model,
+            name,
+            lambda select_option: {
+                "id": F(f"{select_option}__id"),
+                "value": F(f"{select_option}__value"),
+                "color": F(f"{select_option}__color"),
+            },
+        )
+
     def get_search_expression(self, field: MultipleSelectField, queryset) -> Expression:
         return Subquery(
             queryset.filter(pk=OuterRef("pk")).values(
@@ -5258,6 +5352,7 @@ class PhoneNumberFieldType(CollationSortMixin, CharFieldMatchingRegexFieldType):
 class FormulaFieldType(FormulaFieldTypeArrayFilterSupport, ReadOnlyFieldType):
     type = "formula"
     model_class = FormulaField
+    can_copy_rows_in_database = True
     _db_column_fields = []
 
     can_be_in_form_view = False
@@ -5423,6 +5518,10 @@ class FormulaFieldType(FormulaFieldTypeArrayFilterSupport, ReadOnlyFieldType):
             expression=expression,
             expression_field=expression_field_type,
             db_index=instance.db_index,
+            evaluate_at_query_time=(
+                instance.needs_periodic_update
+                and settings.BASEROW_EVALUATE_TIME_DEPENDENT_FORMULAS_AT_QUERY_TIME
+            ),
             **kwargs,
         )
 
@@ -5544,14 +5643,46 @@ class FormulaFieldType(FormulaFieldTypeArrayFilterSupport, ReadOnlyFieldType):
         else:
             return False
 
+    def _is_evaluated_at_query_time(
+        self, field: FormulaField, field_cache: "FieldCache"
+    ) -> bool:
+        model = field_cache.get_model(field.table)
+        return model._meta.get_field(field.db_column).is_evaluated_at_query_time()
+
     def get_fields_needing_periodic_update(self) -> Optional[QuerySet]:
+        # The fields of which the values can't have changed since the last update are
+        # excluded, so that the workspaces only containing those are skipped.
         return FormulaField.objects.filter(
+            Q(next_periodic_update__isnull=True)
+            | Q(next_periodic_update__lte=datetime.now(tz=timezone.utc)),
             needs_periodic_update=True,
             table__trashed=False,
             table__database__trashed=False,
             table__database__workspace__trashed=False,
         )
 
+    def _set_next_periodic_updates(
+        self, fields: List[FormulaField], field_cache: "FieldCache"
+    ):
+        """
+        Stores the next time the values of the periodically updated fields can
+        change, based on the time of the workspace that has been used to compute them.
+        """
+
+        field_ids_per_next_update = defaultdict(list)
+        for field in fields:
+            now = field_cache.get_model(field.table).get_root().get_now_or_set_if_null()
+            next_update = FormulaHandler.get_next_periodic_update(
+                field.cached_typed_internal_expression, now
+            )
+            if next_update != field.next_periodic_update:
+                field_ids_per_next_update[next_update].append(field.id)
+
+        for next_update, field_ids in field_ids_per_next_update.items():
+            FormulaField.objects.filter(id__in=field_ids).update(
+                next_periodic_update=next_update
+            )
+
     def run_periodic_update(
         self,
         fields: List[Field],
@@ -5582,11 +5713,16 @@ class FormulaFieldType(FormulaFieldTypeArrayFilterSupport, ReadOnlyFieldType):
 
             update_collector = update_collectors[field.table_id]
 
-            self._update_field_values(
-                field, update_collector, field_cache, via_path_to_starting_table
-            )
+            # The value is computed when the field is queried, so it doesn't have to
+            # be updated. Its dependant fields still must be updated below.
+            if not self._is_evaluated_at_query_time(field, field_cache):
+                self._update_field_values(
+                    field, update_collector, field_cache, via_path_to_starting_table
+                )
             updated_fields.add(field)
 
+        self._set_next_periodic_updates(fields, field_cache)
+
         for update_collector in update_collectors.values():
             updated_fields |= set(
                 update_collector.apply_updates_and_get_updated_fields(
@@ -5604,7 +5740,9 @@ class FormulaFieldType(FormulaFieldTypeArrayFilterSupport, ReadOnlyFieldType):
         )
         for dependant_fields_group in all_dependent_fields_grouped_by_depth:
             for table_id, dependant_field in dependant_fields_group:
-                if not isinstance(dependant_field, FormulaField):
+                if not isinstance(
+                    dependant_field, FormulaField
+                ) or self._is_evaluated_at_query_time(dependant_field, field_cache):
                     # LinkRowFields might depends on FormulaFields, but we can't update
                     # them here because this is only valid for FormulaFields.
                     continue
@@ -6640,13 +6778,23 @@ class MultipleCollaboratorsFieldType(
 
     def get_response_serializer_field(self, instance, **kwargs):
         required = kwargs.get("required", False)
-        return CollaboratorSerializer(
+        return JsonAggregatedListSerializer(
+            child=CollaboratorSerializer(),
             **{
                 "required": required,
                 "allow_null": False,
-                "many": True,
                 **kwargs,
-            }
+            },
+        )
+
+    def get_json_aggregation_expression(self, field, name, model, **kwargs):
+        return json_aggregate_many_to_many(
+            model,
+            name,
+            lambda user: {
+                "id": F(f"{user}__id"),
+                "first_name": F(f"{user}__first_name"),
+            },
         )
 
     def serialize_to_input_value(self, field: Field, value: any) -> any:
@@ -7011,6 +7159,7 @@ class UUIDFieldType(ReadOnlyFieldType):
 
     type = "uuid"
     model_class = UUIDField
+    can_copy_rows_in_database = True
     can_be_in_form_view = False
     keep_data_on_duplication = True
     _can_have_db_index = True
@@ -7109,6 +7258,7 @@ class AutonumberFieldType(ReadOnlyFieldType):
 
     type = "autonumber"
     model_class = AutonumberField
+    can_copy_rows_in_database = True
     can_be_in_form_view = False
     keep_data_on_duplication = True
     request_serializer_field_names = ["view_id"]
@@ -7325,6 +7475,7 @@ class PasswordFieldType(FieldType):
 
     type = "password"
     model_class = PasswordField
+    can_copy_rows_in_database = True
     can_be_in_form_view = True
     keep_data_on_duplication = True
     _can_order_by_types = []
@@ -1,12 +1,24 @@
 from typing import Any, Optional
 
 from django.db import models
-from django.db.models import Field
-from django.db.models.expressions import RawSQL
+from django.db.models import (
+    Aggregate,
+    Expression,
+    F,
+    Field,
+    OuterRef,
+    Subquery,
+    Value,
+    Window,
+)
+from django.db.models.constants import LOOKUP_SEP
+from django.db.models.expressions import BaseExpression, Col, RawSQL
 from django.db.models.fields.related_descriptors import (
     ForwardManyToOneDescriptor,
     ManyToManyDescriptor,
 )
+from django.db.models.functions import Cast
+from django.db.models.sql import Query
 from django.utils.functional import cached_property
 
 from baserow.contrib.database.fields.utils.duration import duration_value_to_timedelta
@@ -180,16 +192,24 @@ class BaserowExpressionField(models.Field):
         expression: Optional[BaserowExpression],
         expression_field: Field,
         *args,
+        evaluate_at_query_time: bool = False,
         **kwargs,
     ):
         """
         :param expression: The Baserow expression used to calculate this fields value.
         :param expression_field: An instance of a Django field that should be used to
             store the result of the expression in the database.
+        :param evaluate_at_query_time: Indicates whether the value must be computed
+            by the expression every time the column is selected, filtered or sorted
+            on instead of reading the stored value. This is used for expressions
+            depending on the current time, so that they don't have to be
+            periodically updated. Only possible if the expression doesn't reference
+            other tables, see `is_evaluated_at_query_time`.
         """
 
         self.expression = expression
         self.expression_field = expression_field
+        self.evaluate_at_query_time = evaluate_at_query_time
 
         # Add all the various lookups for the underlying Django field so specific
         # filters work on a field of this type. E.g. if expression_field is a DateField
@@ -241,6 +261,10 @@ class BaserowExpressionField(models.Field):
         kwargs["expression"] = self.expression
         kwargs["expression_field"] = self.expression_field
         kwargs["requires_refresh_after_insert"] = self.requires_refresh_after_insert
+        kwargs["evaluate_at_query_time"] = self.evaluate_at_query_time
+        kwargs.pop("db_index", None)
+        if self._db_index:
+            kwargs["db_index"] = True
         return name, path, args, kwargs
 
     def db_type(self, connection):
@@ -258,6 +282,115 @@ class BaserowExpressionField(models.Field):
     def select_format(self, compiler, sql, params):
         return self.expression_field.select_format(compiler, sql, params)
 
+    def get_query_time_expression(self) -> Expression:
+        """
+        Generates the Django expression computing the value of this field. It must
+        be generated every time the column is compiled because the current time is
+        included as a value.
+        """
+
+        from baserow.contrib.database.formula.expression_generator.generator import (
+            baserow_expression_to_query_time_django_expression,
+        )
+
+        return baserow_expression_to_query_time_django_expression(
+            self.expression, self.model
+        )
+
+    def is_evaluated_at_query_time(self) -> bool:
+        """
+        Returns whether the value is computed when the column is queried. This is
+        only the case if it's been requested and if the expression only references
+        fields of the same table, because the references are replaced by the columns
+        of the table alias being queried.
+        """
+
+        if not self.evaluate_at_query_time or self.expression is None:
+            return False
+
+        if "_is_evaluated_at_query_time" not in self.__dict__:
+            self._is_evaluated_at_query_time = (
+                not self.expression.aggregate
+                and _only_references_own_columns(self.get_query_time_expression())
+            )
+        return self._is_evaluated_at_query_time
+
+    @property
+    def db_index(self) -> bool:
+        # The stored value of a field evaluated at query time is never used to
+        # filter or sort, so an index on it would only slow down the writes.
+        if (
+            self._db_index
+            and self.evaluate_at_query_time
+            and hasattr(self, "model")
+            and self.is_evaluated_at_query_time()
+        ):
+            return False
+        return self._db_index
+
+    @db_index.setter
+    def db_index(self, value: bool):
+        self._db_index = value
+
+    def get_col(self, alias, output_field=None):
+        if self.is_evaluated_at_query_time():
+            return QueryTimeExpressionCol(alias, self, output_field)
+        return super().get_col(alias, output_field)
+
+
+def _only_references_own_columns(expression: Any) -> bool:
+    if expression is None or isinstance(expression, Value):
+        return True
+    if isinstance(expression, F):
+        return not isinstance(expression, OuterRef) and LOOKUP_SEP not in (
+            expression.name
+        )
+    if not isinstance(expression, BaseExpression) or isinstance(
+        expression, (Aggregate, Query, Subquery, Window)
+    ):
+        return False
+    return all(
+        _only_references_own_columns(source_expression)
+        for source_expression in expression.get_source_expressions()
+    )
+
+
+def _replace_references_by_columns(expression: Any, model, alias: str) -> Any:
+    if isinstance(expression, F):
+        return model._meta.get_field(expression.name).get_col(alias)
+    if not isinstance(expression, BaseExpression):
+        return expression
+
+    expression = expression.copy()
+    expression.set_source_expressions(
+        [
+            _replace_references_by_columns(source_expression, model, alias)
+            for source_expression in expression.get_source_expressions()
+        ]
+    )
+    return expression
+
+
+class QueryTimeExpressionCol(Col):
+    """
+    A column of a `BaserowExpressionField` that is evaluated at query time. Instead
+    of the column, the expression of the field is compiled where the column is used,
+    so in the `SELECT`, `WHERE`, `ORDER BY`, etc. The references to the other fields
+    of the table are compiled as columns of the same table alias.
+    """
+
+    def as_sql(self, compiler, connection):
+        field = self.target
+        expression = _replace_references_by_columns(
+            field.get_query_time_expression(), field.model, self.alias
+        )
+        # Cast to the type of the column, so that the value is exactly the same as
+        # if it was stored.
+        expression = Cast(expression, output_field=field.expression_field)
+        return compiler.compile(
+            expression.resolve_expression(compiler.query, allow_joins=False)
+        )
+
 
 class SerialField(models.IntegerField):
     """
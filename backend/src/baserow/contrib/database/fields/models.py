@@ -707,6 +707,12 @@ class FormulaField(Field):
         default=False,
         help_text="Indicates if the field needs to be periodically updated.",
     )
+    next_periodic_update = models.DateTimeField(
+        blank=True,
+        null=True,
+        help_text="The time before which the periodically updated values of the "
+        "field can't change. If empty, the field is updated every time.",
+    )
     expand_formula_when_referenced = models.BooleanField(
         default=False,
         null=True,  # TODO zdm remove me in next release
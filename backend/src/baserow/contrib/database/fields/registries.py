@@ -54,6 +54,7 @@ from baserow.contrib.database.views.exceptions import (
     AggregationTypeDoesNotExist,
 )
 from baserow.contrib.database.views.utils import AnnotatedAggregation
+from baserow.core.psycopg import sql
 from baserow.core.registries import ImportExportConfig
 from baserow.core.registry import (
     APIUrlsInstanceMixin,
@@ -169,6 +170,31 @@ class FieldType(
     the read-only UUID field type for example
     """
 
+    can_copy_rows_in_database = False
+    """
+    Indicates whether the row values of this field can be duplicated by copying them
+    in the database when the data doesn't leave the instance, see
+    `get_rows_copy_sql_expression`. If any field of a table doesn't support it, all
+    the rows of the table are serialized and imported in Python instead.
+    """
+
+    can_insert_rows_with_copy = False
+    """
+    Indicates whether new row values of this field can be inserted with `COPY FROM`.
+    This is only possible if the model field doesn't compute its value in the
+    database on insert and the value prepared for the database has a text
+    representation that Postgres can parse. If any field of a table doesn't support
+    it, the rows are created with a regular `INSERT`.
+    """
+
+    human_readable_value_is_db_value = False
+    """
+    Indicates whether the human readable value of this field is the text value
+    stored in the database column, or an empty string if it's `NULL`. This allows
+    computing the value in SQL, for example to serialize link row values in the main
+    query when this field is the primary field of the linked table.
+    """
+
     field_data_is_derived_from_attrs = False
     """Set this to True if your field can completely reconstruct it's data just from
     it's field attributes. When set to False the fields data will be backed up when
@@ -375,6 +401,25 @@ class FieldType(
 
         return queryset
 
+    def get_json_aggregation_expression(
+        self, field: Field, name: str, model: "GeneratedTableModel", **kwargs
+    ) -> Optional[Expression]:
+        """
+        Can return an expression that selects the cell value of the field as a JSON
+        array in the main query. It's used instead of `enhance_queryset` when
+        `enhance_by_fields` is called with `use_json_aggregation=True`, so that the
+        value is fetched without an additional query and without instantiating the
+        related objects. The response serializer field must then accept the
+        aggregated value, see `JsonAggregatedListSerializer`.
+
+        :param field: The field instance.
+        :param name: The name of the field in the model.
+        :param model: The generated model of the table.
+        :return: The expression or None if the field can't be aggregated.
+        """
+
+        return None
+
     def enhance_field_queryset(
         self, queryset: QuerySet[Field], field: Field
     ) -> QuerySet[Field]:
@@ -1229,6 +1274,29 @@ class FieldType(
 
         setattr(row, field_name, value)
 
+    def get_rows_copy_sql_expression(
+        self,
+        field: Field,
+        source_expression: sql.Composable,
+        id_mapping: Dict[str, Any],
+    ) -> sql.Composable:
+        """
+        Returns the SQL expression that computes the value of the duplicated field
+        when the rows are copied with an `INSERT ... SELECT` query. Only called if
+        `can_copy_rows_in_database` is True. The result must be equal to exporting
+        and importing the value with the `get_export_serialized_value` and
+        `set_import_serialized_value` methods.
+
+        :param field: The newly created field instance.
+        :param source_expression: The column of the original field. For many to many
+            fields, this is the column of the through table containing the id of the
+            related object.
+        :param id_mapping: The map of exported ids to newly created ids.
+        :return: The SQL expression of the value to insert.
+        """
+
+        return source_expression
+
     def get_export_value(
         self, value: Any, field_object: "FieldObject", rich_value: bool = False
     ) -> Any:
@@ -1,7 +1,5 @@
-import json
 from typing import Any
 
-from django.core.files.base import ContentFile
 from django.db import transaction
 
 from rest_framework import serializers
@@ -38,6 +36,7 @@ from baserow.core.jobs.registries import JobType
 
 from .models import FileImportJob
 from .serializers import ReportSerializer
+from .utils import FileImportData, serialize_file_import_data
 
 BATCH_SIZE = 1024
 
@@ -97,14 +96,12 @@ class FileImportJobType(JobType):
 
     def after_job_creation(self, job, values):
         """
-        Save the data file for the newly created job.
+        Save the data file for the newly created job. The rows are written one per
+        line so that they can be streamed when the job runs.
         """
 
-        data_file = ContentFile(
-            json.dumps(
-                {"data": values["data"], "configuration": values.get("configuration")},
-                ensure_ascii=False,
-            ).encode("utf8")
+        data_file = serialize_file_import_data(
+            values["data"], values.get("configuration")
         )
         job.data_file.save(None, data_file)
 
@@ -155,11 +152,11 @@ class FileImportJobType(JobType):
     def run(self, job, progress):
         """
         Fills the provided table with the normalized data that needs to be created upon
-        creation of the table.
+        creation of the table. The rows are lazily read from the data file, so that
+        the import never holds all of them in memory.
         """
 
-        with job.data_file.open("r") as fin:
-            data: FileImportDict = json.load(fin)
+        data = FileImportData(job.data_file)
         try:
             if job.table is None:
                 new_table, error_report = action_type_registry.get_by_type(
@@ -168,7 +165,7 @@ class FileImportJobType(JobType):
                     job.user,
                     job.database,
                     name=job.name,
-                    data=data["data"],
+                    data=data,
                     first_row_header=job.first_row_header,
                     progress=progress,
                 )
@@ -181,7 +178,7 @@ class FileImportJobType(JobType):
                 ).do(
                     job.user,
                     table=job.table,
-                    data=data,
+                    data=FileImportDict(data=data, configuration=data.configuration),
                     progress=progress,
                 )
         # when a job handler fails, celery worker will not commit and `after_commit`
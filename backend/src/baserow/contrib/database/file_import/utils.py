@@ -0,0 +1,67 @@
+import json
+from typing import Any, Iterator, List, Optional
+
+from django.core.files.base import ContentFile
+from django.db.models.fields.files import FieldFile
+
+from baserow.contrib.database.rows.types import FileImportConfiguration
+
+
+def serialize_file_import_data(
+    data: List[List[Any]], configuration: Optional[FileImportConfiguration] = None
+) -> ContentFile:
+    """
+    Serializes the data of a file import as newline delimited JSON. The first line
+    contains the configuration and the number of rows, every following line
+    contains one row. This allows to read the rows back one by one with
+    `FileImportData`.
+
+    :param data: The rows that must be imported.
+    :param configuration: The optional import configuration.
+    :return: The content of the data file.
+    """
+
+    header = {"configuration": configuration, "row_count": len(data)}
+    lines = [json.dumps(header, ensure_ascii=False)]
+    lines.extend(json.dumps(row, ensure_ascii=False) for row in data)
+    return ContentFile("\n".join(lines).encode("utf8"))
+
+
+class FileImportData:
+    """
+    Reads the data file of a file import job. Every time this object is iterated
+    over, the rows are lazily read from the file one line at a time, so that the
+    whole file is never loaded in memory. Data files that were written as a single
+    JSON document are loaded entirely to stay compatible with jobs created before
+    the newline delimited format was introduced.
+    """
+
+    def __init__(self, data_file: FieldFile):
+        self._data_file = data_file
+        self._rows = None
+
+        with data_file.open("rb") as fin:
+            header = json.loads(next(iter(fin)))
+
+        if "data" in header:
+            self._rows = header["data"]
+            self.configuration = header.get("configuration")
+            self.row_count = len(self._rows)
+        else:
+            self.configuration = header["configuration"]
+            self.row_count = header["row_count"]
+
+    def __len__(self) -> int:
+        return self.row_count
+
+    def __iter__(self) -> Iterator[List[Any]]:
+        if self._rows is not None:
+            yield from self._rows
+            return
+
+        with self._data_file.open("rb") as fin:
+            lines = iter(fin)
+            # Skip the header line.
+            next(lines)
+            for line in lines:
+                yield json.loads(line)
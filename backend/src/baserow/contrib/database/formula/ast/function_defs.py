@@ -1,7 +1,7 @@
 from abc import ABC
-from datetime import timedelta
+from datetime import datetime, time, timedelta, timezone
 from decimal import Decimal
-from typing import List
+from typing import List, Optional
 
 from django.contrib.postgres.aggregates import JSONBAgg
 from django.db.models import (
@@ -1615,6 +1615,11 @@ class BaserowToday(ZeroArgumentBaserowFunction):
     type = "today"
     needs_periodic_update = True
 
+    def get_next_periodic_value_change(self, now: datetime) -> Optional[datetime]:
+        # The result is the UTC date of `now`, so it only changes at midnight UTC.
+        today = now.astimezone(timezone.utc).date()
+        return datetime.combine(today + timedelta(days=1), time(), tzinfo=timezone.utc)
+
     def type_function(
         self, func_call: BaserowFunctionCall[UnTyped]
     ) -> BaserowExpression[BaserowFormulaType]:
@@ -303,9 +303,15 @@ class ArgCountSpecifier(abc.ABC):
 
 
 class BaserowExpressionContext:
-    def __init__(self, model: Type[Model], model_instance: Optional[Model]):
+    def __init__(
+        self,
+        model: Type[Model],
+        model_instance: Optional[Model],
+        query_time: bool = False,
+    ):
         self.model = model
         self.model_instance = model_instance
+        self.query_time = query_time
         try:
             # TODO: rename to workspace
             self.group = model.get_root()
@@ -317,8 +323,10 @@ class BaserowExpressionContext:
     def get_utc_now(self):
         # Inside a workspace, we want to use the workspace value to keep all the
         # formulas in sync. If the workspace is not set as during a snapshot, we can use
-        # just the current time to ensure rows have a value.
-        if self.group:
+        # just the current time to ensure rows have a value. The expressions
+        # evaluated at query time are never stored, so they always use the current
+        # time.
+        if self.group and not self.query_time:
             return self.group.get_now_or_set_if_null()
         else:
             return datetime.now(tz=timezone.utc)
@@ -419,6 +427,19 @@ class BaserowFunctionDefinition(Instance, abc.ABC):
     is_wrapper = False
     try_coerce_nullable_args_to_not_null: bool = True
 
+    def get_next_periodic_value_change(self, now: datetime) -> Optional[datetime]:
+        """
+        Only used by the functions needing a periodic update. Should return the next
+        time the result of the function can change if it's been computed at `now`,
+        so that the fields using it don't have to be periodically updated before.
+
+        :param now: The time used to compute the result of the function.
+        :return: The next time the result can change or None if it can change at any
+            time.
+        """
+
+        return None
+
     @property
     @abc.abstractmethod
     def type(self) -> str:
@@ -39,6 +39,13 @@ class NotEqualsExpr(BinaryOpExpr):
     arg_joiner = "!="
 
 
+# Unlike `NotEqualsExpr`, the result is never null, two nulls are equal and a null is
+# different from any other value.
+# noinspection PyAbstractClass
+class IsDistinctFromExpr(BinaryOpExpr):
+    arg_joiner = " IS DISTINCT FROM "
+
+
 # noinspection PyAbstractClass
 class GreaterThanExpr(BinaryOpExpr):
     arg_joiner = ">"
@@ -44,6 +44,15 @@ def baserow_expression_to_update_django_expression(
     return _baserow_expression_to_django_expression(baserow_expression, model, None)
 
 
+def baserow_expression_to_query_time_django_expression(
+    baserow_expression: BaserowExpression[BaserowFormulaType],
+    model: Type[Model],
+):
+    return _baserow_expression_to_django_expression(
+        baserow_expression, model, None, query_time=True
+    )
+
+
 def baserow_expression_to_single_row_update_django_expression(
     baserow_expression: BaserowExpression[BaserowFormulaType],
     model_instance: Model,
@@ -67,6 +76,7 @@ def _baserow_expression_to_django_expression(
     model: Type[Model],
     model_instance: Optional[Model],
     insert=False,
+    query_time=False,
 ) -> Expression:
     """
     Takes a BaserowExpression and converts it to a Django Expression which calculates
@@ -88,6 +98,9 @@ def _baserow_expression_to_django_expression(
     :param insert: Must be set to True if the resulting expression will be used in
         a SQL INSERT statement. Will ensure any aggregate / lookup expressions are
         replaced with None as they cannot be calculated in an INSERT.
+    :param query_time: Must be set to True if the resulting expression is evaluated
+        every time the field is queried. The current time is then used instead of
+        the periodically updated time of the workspace.
     :return: A Django Expression which can be used in a create operation when a
         model_instance is provided or an update operation when one is not provided.
     """
@@ -107,7 +120,7 @@ def _baserow_expression_to_django_expression(
                 return baserow_expression.expression_type.placeholder_empty_value()
             else:
                 generator = BaserowExpressionToDjangoExpressionGenerator(
-                    model, model_instance
+                    model, model_instance, query_time=query_time
                 )
                 return baserow_expression.accept(generator).expression
     except RecursionError:
@@ -170,10 +183,13 @@ class BaserowExpressionToDjangoExpressionGenerator(
         self,
         model: Type[Model],
         model_instance: Optional[Model],
+        query_time: bool = False,
     ):
         self.model_instance = model_instance
         self.model = model
-        self.context = BaserowExpressionContext(model, model_instance)
+        self.context = BaserowExpressionContext(
+            model, model_instance, query_time=query_time
+        )
 
     def visit_field_reference(
         self, field_reference: BaserowFieldReference[BaserowFormulaType]
@@ -1,4 +1,5 @@
 import typing
+from datetime import datetime
 from typing import Dict, Optional, Set, Tuple, Type
 
 from django.db.models import Expression, Model
@@ -60,6 +61,22 @@ def _needs_periodic_update(expression: BaserowExpression):
     return any(getattr(f, "needs_periodic_update", False) for f in functions_used)
 
 
+def _get_next_periodic_update(
+    expression: BaserowExpression, now: datetime
+) -> Optional[datetime]:
+    functions_used: Set[BaserowFunctionDefinition] = expression.accept(
+        FunctionsUsedVisitor()
+    )
+    next_changes = [
+        f.get_next_periodic_value_change(now)
+        for f in functions_used
+        if getattr(f, "needs_periodic_update", False)
+    ]
+    if not next_changes or None in next_changes:
+        return None
+    return min(next_changes)
+
+
 def _expression_requires_refresh_after_insert(expression: BaserowExpression):
     """
     WARNING: This function is directly used by migration code. Please ensure
@@ -102,6 +119,23 @@ class FormulaHandler(metaclass=baserow_trace_methods(tracer)):
     Baserow.
     """
 
+    @classmethod
+    def get_next_periodic_update(
+        cls, expression: BaserowExpression, now: datetime
+    ) -> Optional[datetime]:
+        """
+        Returns the next time the result of an expression needing a periodic update
+        can change, based on the functions it uses. Until then, the values of the
+        field don't have to be updated.
+
+        :param expression: A fully typed internal Baserow expression.
+        :param now: The time that was used to compute the result of the expression.
+        :return: The next time the result can change or None if it can change at any
+            time.
+        """
+
+        return _get_next_periodic_update(expression, now)
+
     @classmethod
     def baserow_expression_to_update_django_expression(
         cls, expression: BaserowExpression, model: Type[Model]
@@ -361,6 +395,9 @@ class FormulaHandler(metaclass=baserow_trace_methods(tracer)):
         formula_field.version = BASEROW_FORMULA_VERSION
 
         formula_field.needs_periodic_update = _needs_periodic_update(expression)
+        # The values are recomputed, so the field must be updated periodically again
+        # until the next time they can change is known.
+        formula_field.next_periodic_update = None
         formula_field.expand_formula_when_referenced = _has_lookup_expressions(
             expression
         )
@@ -0,0 +1,51 @@
+# Generated by Django 5.0.13 on 2026-10-18 09:12
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("database", "0194_passwordfield_allow_endpoint_authentication"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DataSyncRowHash",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "row_id",
+                    models.PositiveIntegerField(
+                        help_text="The id of the row in the synced table."
+                    ),
+                ),
+                (
+                    "hash",
+                    models.CharField(
+                        help_text="The hash of the enabled property values of the source row.",
+                        max_length=32,
+                    ),
+                ),
+                (
+                    "data_sync",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="row_hashes",
+                        to="database.datasync",
+                    ),
+                ),
+            ],
+            options={
+                "unique_together": {("data_sync", "row_id")},
+            },
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 5.0.13 on 2026-10-18 14:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("database", "0195_datasyncrowhash"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="formulafield",
+            name="next_periodic_update",
+            field=models.DateTimeField(
+                blank=True,
+                null=True,
+                help_text="The time before which the periodically updated values of "
+                "the field can't change. If empty, the field is updated every time.",
+            ),
+        ),
+    ]
@@ -328,7 +328,7 @@ class ImportRowsActionType(UndoableActionType):
         table: Table,
         data: FileImportDict,
         progress: Optional[Progress] = None,
-    ) -> Tuple[List[GeneratedTableModel], Dict[str, Any]]:
+    ) -> Tuple[List[int], Dict[str, Any]]:
         """
         Creates rows for a given table with the provided values if the user
         belongs to the related workspace. It also calls the table_updated signal.
@@ -341,9 +341,10 @@ class ImportRowsActionType(UndoableActionType):
 
         :param user: The user of whose behalf the rows are created.
         :param table: The table for which the rows should be imported.
-        :param data: List of rows values for rows that need to be created.
+        :param data: List or sized iterable of rows values for rows that need to be
+            created.
         :param progress: An optional progress object to track the task progress.
-        :return: The created list of rows instances and the error report.
+        :return: The ids of the created rows and the error report.
         """
 
         if table.is_data_synced_table:
@@ -351,12 +352,16 @@ class ImportRowsActionType(UndoableActionType):
                 "Can't create rows because it has a data sync."
             )
 
-        created_rows, error_report = RowHandler().import_rows(
+        # Only keep the ids of the created rows, so that importing a large amount of
+        # rows doesn't keep all the row instances in memory.
+        created_row_ids = []
+        _, error_report = RowHandler().import_rows(
             user,
             table,
             data=data["data"],
             configuration=data.get("configuration") or {},
             progress=progress,
+            on_rows_created=lambda rows: created_row_ids.extend(r.id for r in rows),
         )
         if error_report:
             logger.warning(f"Errors during rows import: {error_report}")
@@ -366,13 +371,13 @@ class ImportRowsActionType(UndoableActionType):
             table.name,
             table.database.id,
             table.database.name,
-            [row.id for row in created_rows],
+            created_row_ids,
         )
         cls.register_action(
             user, params, scope=cls.scope(table.id), workspace=workspace
         )
 
-        return created_rows, error_report
+        return created_row_ids, error_report
 
     @classmethod
     def scope(cls, table_id) -> ActionScopeStr:
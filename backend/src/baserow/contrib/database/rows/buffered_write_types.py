@@ -0,0 +1,23 @@
+from itertools import groupby
+from typing import List
+
+from baserow.contrib.database.rows.models import RowHistory
+from baserow.contrib.database.rows.signals import rows_history_updated
+from baserow.core.buffered_writes import BufferedWriteType
+
+
+class RowHistoryBufferedWriteType(BufferedWriteType):
+    type = "row_history"
+    model_class = RowHistory
+
+    def after_insert(self, instances: List[RowHistory]):
+        from baserow.contrib.database.rows.history import RowHistoryHandler
+
+        for table_id, per_table_row_history_entries in groupby(
+            instances, lambda e: e.table_id
+        ):
+            rows_history_updated.send(
+                RowHistoryHandler,
+                table_id=table_id,
+                row_history_entries=list(per_table_row_history_entries),
+            )
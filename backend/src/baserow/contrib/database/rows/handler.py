@@ -5,6 +5,7 @@ from functools import cached_property
 from typing import (
     TYPE_CHECKING,
     Any,
+    Callable,
     Dict,
     Iterable,
     List,
@@ -60,9 +61,11 @@ from baserow.contrib.database.table.operations import (
 from baserow.contrib.database.table.signals import table_updated
 from baserow.contrib.database.trash.models import TrashedRows
 from baserow.core.db import (
+    copy_rows_into_table,
     get_highest_order_of_queryset,
     get_unique_orders_before_item,
     recalculate_full_orders,
+    spread_orders_before_item,
 )
 from baserow.core.exceptions import CannotCalculateIntermediateOrder, PermissionDenied
 from baserow.core.handler import CoreHandler
@@ -109,6 +112,8 @@ if TYPE_CHECKING:
 tracer = trace.get_tracer(__name__)
 
 BATCH_SIZE = 1024
+IMPORT_ROWS_CHUNK_SIZE = 10 * BATCH_SIZE
+COPY_ROWS_MIN_COUNT = 100
 
 meter = metrics.get_meter(__name__)
 rows_created_counter = meter.create_counter(
@@ -422,8 +427,8 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
         provided `before_row` or at the end of the table, depending on whether the
         `before_row` value is provided.
 
-        Note that this method can trigger an update of all the rows in the table in
-        the event all the orders must be recalculated.
+        Note that this method can update the orders of the rows around the
+        `before_row` in the event there is no intermediate order left.
 
         :param before_row: The row instance where the before orders must be
             calculated for. If `None`, then it's assumed that the orders are for
@@ -444,15 +449,12 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
             except CannotCalculateIntermediateOrder:
                 # If the `find_intermediate_order` fails with a
                 # `CannotCalculateIntermediateOrder`, it means that it's not possible
-                # calculate an intermediate fraction. Therefore, must reset all the
-                # orders of the table (while respecting their original order),
-                # so that we can then can find the fraction any many more after.
-                self.recalculate_row_orders(model.baserow_table, model)
-                # Refresh the row element as its order might have changed
-                before_row.refresh_from_db()
-                return get_unique_orders_before_item(
-                    before_row, queryset, amount=amount
-                )
+                # calculate an intermediate fraction. Instead of resetting the orders
+                # of the whole table, only the orders of the rows around the
+                # `before_row` are spread to make room for the new ones.
+                orders = spread_orders_before_item(before_row, queryset, amount=amount)
+                row_orders_recalculated.send(self, table=model.baserow_table)
+                return orders
         else:
             # If no `before` is provided, we can just find the highest value and
             # add one to it.
@@ -1231,7 +1233,10 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
 
         try:
             with transaction.atomic():
-                inserted_rows = model.objects.bulk_create(rows)
+                if self._can_insert_rows_with_copy(model, len(rows)):
+                    inserted_rows = self._insert_rows_with_copy(model, rows)
+                else:
+                    inserted_rows = model.objects.bulk_create(rows)
         except Exception:
             inserted_rows = []
             if not generate_error_report:
@@ -1316,6 +1321,60 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
 
         return CreatedRowsData(rows_to_return, report)
 
+    def _can_insert_rows_with_copy(
+        self, model: Type[GeneratedTableModel], rows_count: int
+    ) -> bool:
+        """
+        Checks if the new rows can be inserted with `COPY FROM` instead of a regular
+        `INSERT`. For a few rows, the extra query needed to reserve the ids makes it
+        slower, so it's only used when there are enough rows.
+        """
+
+        return rows_count >= COPY_ROWS_MIN_COUNT and all(
+            field_object["type"].can_insert_rows_with_copy
+            for field_object in model._field_objects.values()
+        )
+
+    def _insert_rows_with_copy(
+        self, model: Type[GeneratedTableModel], rows: List[GeneratedTableModel]
+    ) -> List[GeneratedTableModel]:
+        """
+        Inserts the provided unsaved row instances with `COPY FROM`, as an
+        alternative to `model.objects.bulk_create(rows)`. Because `COPY` can't
+        return the ids of the inserted rows, they're reserved from the sequence of
+        the table first.
+
+        :param model: The model of the table.
+        :param rows: The unsaved row instances.
+        :return: The inserted row instances with their id set.
+        """
+
+        table_name = model._meta.db_table
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT nextval(pg_get_serial_sequence(%s, 'id')) "
+                "FROM generate_series(1, %s)",
+                [table_name, len(rows)],
+            )
+            row_ids = sorted(row_id for (row_id,) in cursor.fetchall())
+
+        db_alias = router.db_for_write(model)
+        fields = model._meta.concrete_fields
+        rows_values = []
+        for row, row_id in zip(rows, row_ids):
+            row.id = row_id
+            rows_values.append(
+                [
+                    field.get_db_prep_save(field.pre_save(row, True), connection)
+                    for field in fields
+                ]
+            )
+            row._state.adding = False
+            row._state.db = db_alias
+
+        copy_rows_into_table(table_name, [f.column for f in fields], rows_values)
+        return rows
+
     def create_rows(
         self,
         user: AbstractUser,
@@ -1664,11 +1723,13 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
         self,
         user: AbstractUser,
         table: Table,
-        data: list[list[Any]],
+        data: Iterable[list[Any]],
         configuration: FileImportConfiguration | None = None,
         validate: bool = True,
         progress: Optional[Progress] = None,
         send_realtime_update: bool = True,
+        row_count: Optional[int] = None,
+        on_rows_created: Optional[Callable[[List[GeneratedTableModel]], None]] = None,
     ) -> Tuple[List[GeneratedTableModel], Dict[str, Dict[str, Any]]]:
         """
         Creates new rows for a given table if the user belongs to the related
@@ -1678,15 +1739,24 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
         stop the import. Instead an error report is created with the raised
         error for each field of each failing rows.
 
+        The data are consumed in chunks of `IMPORT_ROWS_CHUNK_SIZE` rows, so that
+        only one chunk is reshaped, validated and created at a time. This allows to
+        import large files from an iterator without loading them in memory.
+
         :param user: The user of whose behalf the rows are created.
         :param table: The table for which the rows should be created.
-        :param data: List of rows values for rows that need to be created.
+        :param data: List or iterable of rows values for rows that need to be created.
         :param configuration: Optional import configuration dict.
         :param validate: If True the data are validated before the import.
         :param progress: Give a progress instance to track the progress of the
             import.
         :param send_realtime_update: The parameter passed to the rows_created
             signal indicating if a realtime update should be send.
+        :param row_count: The number of rows in data. Must be provided if data
+            doesn't support `len()`.
+        :param on_rows_created: Optional callable called with the created rows of
+            every chunk. When provided, the created rows are not kept in memory and
+            an empty list is returned instead.
 
         :raises InvalidRowLength:
 
@@ -1702,7 +1772,10 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
         )
         model = table.get_model()
 
-        error_report = RowErrorReport(data)
+        if row_count is None:
+            row_count = len(data)
+
+        error_report = RowErrorReport()
         configuration = configuration or {}
         update_handler = UpsertRowsMappingHandler(
             table=table,
@@ -1713,6 +1786,11 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
         # Can raise InvalidRowLength
         update_handler.validate()
 
+        # Must be computed before creating any row, otherwise the rows created by the
+        # previous chunks could be matched. If there's no upsert field selected, this
+        # map is empty.
+        update_map = update_handler.process_map
+
         fields = [
             field_object["field"]
             for field_object in model._field_objects.values()
@@ -1723,122 +1801,143 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
         # Sort by order then by id
         fields.sort(key=lambda f: (f.order, f.id))
 
-        for index, row in enumerate(data):
-            # Check row length
-            if len(row) > len(fields):
-                error_report.add_error(
-                    index,
-                    {"non_field_errors": ["Too many values in this line."]},
-                )
-            else:
-                new_row = list(row)
-                # Fill incomplete rows with empty values
-                new_row.extend([None] * (len(fields) - len(row)))
-
-                # Reshape data by field as expected by the import
-                error_report.update_row(
-                    index,
-                    {
-                        f"field_{fields[index].id}": value
-                        for index, value in enumerate(new_row)
-                    },
+        validation_sub_progress = (
+            progress.create_child(50, row_count) if progress and validate else None
+        )
+        creation_sub_progress = (
+            progress.create_child(50 if validate else 100, row_count)
+            if progress
+            else None
+        )
+
+        all_created_rows = []
+        start_index = 0
+        for chunk in chunks(iter(data), IMPORT_ROWS_CHUNK_SIZE):
+            error_report.set_rows(chunk, start_index)
+            for index, row in enumerate(chunk, start=start_index):
+                # Check row length
+                if len(row) > len(fields):
+                    error_report.add_error(
+                        index,
+                        {"non_field_errors": ["Too many values in this line."]},
+                    )
+                else:
+                    new_row = list(row)
+                    # Fill incomplete rows with empty values
+                    new_row.extend([None] * (len(fields) - len(row)))
+
+                    # Reshape data by field as expected by the import
+                    error_report.update_row(
+                        index,
+                        {
+                            f"field_{fields[index].id}": value
+                            for index, value in enumerate(new_row)
+                        },
+                    )
+
+            # STEP 1: pre-validate data with serializer
+            if validate:
+                (
+                    valid_rows,
+                    original_row_index_mapping,
+                ) = error_report.get_valid_rows_and_mapping()
+
+                validation_report = self.validate_rows(
+                    table, valid_rows, progress=validation_sub_progress
                 )
 
-        # STEP 1: pre-validate data with serializer
-        if validate:
+                for index, error in validation_report.items():
+                    error_report.add_error(
+                        original_row_index_mapping[int(index)], error
+                    )
+
+                skipped_count = len(chunk) - len(valid_rows)
+                if validation_sub_progress and skipped_count:
+                    # The rows with a wrong length are never validated.
+                    validation_sub_progress.increment(skipped_count)
+
             (
                 valid_rows,
                 original_row_index_mapping,
             ) = error_report.get_valid_rows_and_mapping()
 
-            validation_sub_progress = (
-                progress.create_child(50, len(valid_rows)) if progress else None
-            )
+            # STEP 2: create rows in DB
 
-            validation_report = self.validate_rows(
-                table, valid_rows, progress=validation_sub_progress
+            # Make sure to exclude fields that cannot be written by the user.
+            # NOTE: all rows contain the same fields, so we can just check the first
+            # one
+            unwritable_fields = self._check_write_fields_values_permissions(
+                user, model, valid_rows[:1], raise_if_not_permitted=False
             )
+            unwritable_field_names = set(f.db_column for f in unwritable_fields)
+            valid_rows = [
+                {k: v for k, v in row.items() if k not in unwritable_field_names}
+                for row in valid_rows
+            ]
 
-            for index, error in validation_report.items():
-                error_report.add_error(original_row_index_mapping[int(index)], error)
-
-        (
-            valid_rows,
-            original_row_index_mapping,
-        ) = error_report.get_valid_rows_and_mapping()
-
-        # STEP 2: create rows in DB
-        creation_sub_progress = (
-            progress.create_child(50 if validate else 100, len(valid_rows))
-            if progress
-            else None
-        )
-
-        # Make sure to exclude fields that cannot be written by the user.
-        # NOTE: all rows contain the same fields, so we can just check the first one
-        unwritable_fields = self._check_write_fields_values_permissions(
-            user, model, valid_rows[:1], raise_if_not_permitted=False
-        )
-        unwritable_field_names = set(f.db_column for f in unwritable_fields)
-        valid_rows = [
-            {k: v for k, v in row.items() if k not in unwritable_field_names}
-            for row in valid_rows
-        ]
-
-        # split rows to insert and update lists. If there's no upsert field selected,
-        # this will not populate rows_values_to_update.
-        update_map = update_handler.process_map
-
-        rows_values_to_create = []
-        rows_values_to_update = []
-        if update_map:
-            for current_idx, import_idx in original_row_index_mapping.items():
-                row = valid_rows[current_idx]
-                if update_idx := update_map.get(import_idx):
-                    row["id"] = update_idx
-                    rows_values_to_update.append(row)
-                else:
-                    rows_values_to_create.append(row)
-        else:
-            rows_values_to_create = valid_rows
-
-        created_rows, creation_report = self.force_create_rows_by_batch(
-            user,
-            table,
-            rows_values_to_create,
-            progress=creation_sub_progress,
-            model=model,
-        )
+            # split rows to insert and update lists.
+            rows_values_to_create = []
+            rows_values_to_update = []
+            if update_map:
+                for current_idx, import_idx in original_row_index_mapping.items():
+                    row = valid_rows[current_idx]
+                    if update_idx := update_map.get(import_idx):
+                        row["id"] = update_idx
+                        rows_values_to_update.append(row)
+                    else:
+                        rows_values_to_create.append(row)
+            else:
+                rows_values_to_create = valid_rows
 
-        if rows_values_to_update:
-            updated_rows, updated_report = self.force_update_rows_by_batch(
+            created_rows, creation_report = self.force_create_rows_by_batch(
                 user,
                 table,
-                rows_values_to_update,
+                rows_values_to_create,
                 progress=creation_sub_progress,
                 model=model,
             )
 
-        # Add errors to global report
-        for index, error in creation_report.items():
-            error_report.add_error(
-                original_row_index_mapping[int(index)],
-                error,
-            )
+            if rows_values_to_update:
+                updated_rows, updated_report = self.force_update_rows_by_batch(
+                    user,
+                    table,
+                    rows_values_to_update,
+                    progress=creation_sub_progress,
+                    model=model,
+                )
 
-        if rows_values_to_update:
-            for index, error in updated_report.items():
+            skipped_count = len(chunk) - len(valid_rows)
+            if creation_sub_progress and skipped_count:
+                # The invalid rows are never created.
+                creation_sub_progress.increment(skipped_count)
+
+            # Add errors to global report
+            for index, error in creation_report.items():
                 error_report.add_error(
                     original_row_index_mapping[int(index)],
                     error,
                 )
 
+            if rows_values_to_update:
+                for index, error in updated_report.items():
+                    error_report.add_error(
+                        original_row_index_mapping[int(index)],
+                        error,
+                    )
+
+            if on_rows_created is not None:
+                on_rows_created(created_rows)
+            else:
+                all_created_rows += created_rows
+
+            start_index += len(chunk)
+
         if send_realtime_update:
             # Just send a single table_updated here as realtime update instead
             # of rows_created because we might import a lot of rows.
             table_updated.send(self, table=table, user=user, force_table_refresh=True)
 
-        return created_rows, error_report.to_dict()
+        return all_created_rows, error_report.to_dict()
 
     def get_fields_metadata_for_row_history(
         self,
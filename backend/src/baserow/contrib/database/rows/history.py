@@ -1,5 +1,4 @@
 from datetime import datetime
-from itertools import groupby
 
 from django.conf import settings
 from django.db import router
@@ -14,10 +13,11 @@ from baserow.contrib.database.rows.registries import (
     change_row_history_registry,
     row_history_provider_registry,
 )
-from baserow.contrib.database.rows.signals import rows_history_updated
 from baserow.contrib.database.rows.types import ActionData
 from baserow.core.action.signals import action_done
+from baserow.core.buffered_writes import buffered_write_type_registry
 from baserow.core.models import Workspace
+from baserow.core.partitioning import time_partitioned_model_type_registry
 from baserow.core.telemetry.utils import baserow_trace
 from baserow.core.types import AnyUser
 
@@ -36,15 +36,11 @@ class RowHistoryHandler:
         row_history_entries = row_history_provider.get_row_history(user, action)
 
         if row_history_entries:
-            row_history_entries = RowHistory.objects.bulk_create(row_history_entries)
-            for table_id, per_table_row_history_entries in groupby(
-                row_history_entries, lambda e: e.table_id
-            ):
-                rows_history_updated.send(
-                    RowHistoryHandler,
-                    table_id=table_id,
-                    row_history_entries=list(per_table_row_history_entries),
-                )
+            # The entries are inserted later in a batch if buffered writes are
+            # enabled. The `rows_history_updated` signal is sent once inserted.
+            buffered_write_type_registry.get_by_model(RowHistory).write(
+                row_history_entries
+            )
 
     @classmethod
     @baserow_trace(tracer)
@@ -71,10 +67,16 @@ class RowHistoryHandler:
     def delete_entries_older_than(cls, cutoff: datetime):
         """
         Deletes all row history entries that are older than the given cutoff date.
+        If the table is partitioned, the partitions only containing older entries
+        are dropped instead.
 
         :param cutoff: The date and time before which all entries will be deleted.
         """
 
+        time_partitioned_model_type_registry.get_by_model(
+            RowHistory
+        ).drop_partitions_older_than(cutoff)
+
         delete_qs = RowHistory.objects.filter(action_timestamp__lt=cutoff)
         delete_qs._raw_delete(using=router.db_for_write(delete_qs.model))
 
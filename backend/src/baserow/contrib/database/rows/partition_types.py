@@ -0,0 +1,8 @@
+from baserow.contrib.database.rows.models import RowHistory
+from baserow.core.partitioning import TimePartitionedModelType
+
+
+class RowHistoryTimePartitionedModelType(TimePartitionedModelType):
+    type = "row_history"
+    model_class = RowHistory
+    partition_field_name = "action_timestamp"
@@ -1,5 +1,5 @@
 import dataclasses
-from typing import Any, List, Optional
+from typing import Any, Collection, List, Optional
 
 from django.contrib.auth.models import AbstractUser
 from django.utils.translation import gettext_lazy as _
@@ -45,7 +45,7 @@ class CreateTableActionType(UndoableActionType):
         user: AbstractUser,
         database: Database,
         name: str,
-        data: Optional[List[List[Any]]] = None,
+        data: Optional[Collection[List[Any]]] = None,
         first_row_header: bool = True,
         progress: Optional[Progress] = None,
     ) -> Table:
@@ -12,23 +12,44 @@ When we construct a model we:
 3. Check if the version in the cache matches the latest table version in the db.
 4. If they differ, re-query for all the fields and save them in the cache.
 5. If they are the same use the cached field attrs.
+
+On top of that, every process keeps the most recently used fully generated model
+classes in memory in the `generated_model_classes_cache`, so that the model class
+doesn't have to be built again for every request.
 """
+import threading
 import typing
 import uuid
-from typing import Any, Dict, Optional
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple, Type
 
 from django.conf import settings
 from django.core.cache import caches
 from django.core.exceptions import ImproperlyConfigured
 
+from opentelemetry import metrics
+
 from baserow.core.cache import local_cache
 from baserow.version import VERSION as BASEROW_VERSION
 
 if typing.TYPE_CHECKING:
-    from baserow.contrib.database.table.models import Table
+    from baserow.contrib.database.table.models import GeneratedTableModel, Table
 
 generated_models_cache = caches[settings.GENERATED_MODEL_CACHE_NAME]
 
+meter = metrics.get_meter(__name__)
+model_class_cache_hits_counter = meter.create_counter(
+    "baserow.generated_model_class_cache_hits",
+    unit="1",
+    description="The number of table models found in the process model class cache.",
+)
+model_class_cache_misses_counter = meter.create_counter(
+    "baserow.generated_model_class_cache_misses",
+    unit="1",
+    description="The number of table models that had to be generated because they "
+    "were not in the process model class cache.",
+)
+
 
 def table_model_cache_entry_key(table_id: int) -> str:
     return f"full_table_model_{table_id}_{BASEROW_VERSION}"
@@ -53,8 +74,169 @@ def set_cached_model_field_attrs(table: "Table", field_attrs: Dict[str, Any]):
     )
 
 
+def get_request_table_cache_key(table_id: int) -> str:
+    return f"database_generated_model_table_{table_id}"
+
+
+def bind_table_to_request(table: "Table"):
+    """
+    Makes the provided table instance the `baserow_table` of the process cached
+    model classes of the table for the rest of the current request.
+    """
+
+    cache_key = get_request_table_cache_key(table.id)
+    local_cache.delete(cache_key)
+    local_cache.get(cache_key, table)
+
+
+class GeneratedModelTableDescriptor:
+    """
+    The `baserow_table` attribute of a model class kept in the process cache. The
+    table instance is used to get the workspace, for example for the current time of
+    the `now()` formulas, so it's resolved per request instead of being shared by
+    all the threads using the class. It's the instance that the model was requested
+    with in the current request, or an instance fetched once per request otherwise,
+    for example for the models of the linked tables.
+    """
+
+    def __init__(self, table_id: int):
+        self.table_id = table_id
+
+    def _fetch_table(self) -> "Table":
+        from baserow.contrib.database.table.models import Table
+
+        return Table.objects_and_trash.select_related("database__workspace").get(
+            id=self.table_id
+        )
+
+    def __get__(self, instance, owner) -> "Table":
+        return local_cache.get(
+            get_request_table_cache_key(self.table_id), self._fetch_table
+        )
+
+
+class GeneratedModelClassesCache:
+    """
+    A bounded and thread-safe least recently used cache of generated table model
+    classes kept in the memory of the process. The entries are keyed by the table
+    id, its version and the columns that are not part of the field attrs, so an
+    entry can't be used anymore as soon as the table is invalidated with
+    `invalidate_table_in_model_cache`. Because the model also contains the models of
+    the tables it links to, the versions of those tables are stored alongside and
+    checked when the entry is used.
+    """
+
+    def __init__(self):
+        # The values contain the model and the versions of the tables it links to.
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def get_key(table: "Table") -> Tuple:
+        return (
+            table.id,
+            table.version,
+            table.needs_background_update_column_added,
+            table.created_by_column_added,
+            table.last_modified_by_column_added,
+        )
+
+    @staticmethod
+    def _get_related_table_versions(
+        model: Type["GeneratedTableModel"],
+    ) -> Dict[int, str]:
+        return {
+            related_model.baserow_table_id: related_model.baserow_table.version
+            for related_model in model.baserow_models.values()
+            if getattr(related_model, "_generated_table_model", False)
+            and related_model.baserow_table_id != model.baserow_table_id
+        }
+
+    @staticmethod
+    def _related_tables_changed(related_table_versions: Dict[int, str]) -> bool:
+        from baserow.contrib.database.table.models import Table
+
+        current_versions = dict(
+            Table.objects_and_trash.filter(
+                id__in=related_table_versions.keys()
+            ).values_list("id", "version")
+        )
+        return current_versions != related_table_versions
+
+    def get(
+        self,
+        table: "Table",
+        generate_model: Callable[[], Type["GeneratedTableModel"]],
+    ) -> Type["GeneratedTableModel"]:
+        """
+        Returns the cached model class of the table or generates, caches and returns
+        it if it's not in the cache yet.
+
+        :param table: The table for which the model must be returned. Its version
+            must be up-to-date.
+        :param generate_model: Called to generate the model on a cache miss.
+        :return: The generated model class of the table.
+        """
+
+        max_size = settings.BASEROW_GENERATED_MODEL_CLASSES_CACHE_SIZE
+        if max_size <= 0 or settings.BASEROW_DISABLE_MODEL_CACHE:
+            return generate_model()
+
+        key = self.get_key(table)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+
+        if entry is not None:
+            model, related_table_versions = entry
+            if not related_table_versions or not self._related_tables_changed(
+                related_table_versions
+            ):
+                model_class_cache_hits_counter.add(1)
+                bind_table_to_request(table)
+                return model
+
+        model_class_cache_misses_counter.add(1)
+        model = generate_model()
+        entry = (model, self._get_related_table_versions(model))
+
+        # The model classes are shared by all the threads of the process, so they
+        # must not hold the table instance of the request that generated them.
+        for generated_model in model.baserow_models.values():
+            if getattr(generated_model, "_generated_table_model", False):
+                generated_model.baserow_table = GeneratedModelTableDescriptor(
+                    generated_model.baserow_table_id
+                )
+        bind_table_to_request(table)
+
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > max_size:
+                self._entries.popitem(last=False)
+
+        return model
+
+    def invalidate(self, table_id: int):
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == table_id]:
+                del self._entries[key]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+generated_model_classes_cache = GeneratedModelClassesCache()
+
+
 def clear_generated_model_cache():
     print("Clearing Baserow's internal generated model cache...")
+    generated_model_classes_cache.clear()
     if hasattr(generated_models_cache, "delete_pattern"):
         generated_models_cache.delete_pattern("full_table_model_*")
     elif settings.TESTS:
@@ -76,6 +258,7 @@ def invalidate_table_in_model_cache(table_id: int):
 
     # Delete model local cache
     local_cache.delete(f"database_table_model_{table_id}*")
+    generated_model_classes_cache.invalidate(table_id)
 
     if settings.BASEROW_DISABLE_MODEL_CACHE:
         return None
@@ -1,5 +1,5 @@
 import traceback
-from typing import Any, Dict, List, NewType, Optional, Tuple, cast
+from typing import Any, Collection, Dict, Iterator, List, NewType, Optional, Tuple, cast
 
 from django.conf import settings
 from django.contrib.auth.models import AbstractUser
@@ -109,6 +109,33 @@ class TableUsageHandler:
 
             raise integrity_exc
 
+    @classmethod
+    def get_table_row_count(cls, table_id: int) -> Optional[int]:
+        """
+        Returns the number of rows of the table without counting them. It's the
+        last calculated row count of the table usage plus the pending changes
+        registered when rows are created or deleted. Because these changes are
+        registered asynchronously, the result can briefly lag behind.
+
+        :param table_id: The id of the table.
+        :return: The number of rows or None if the usage of the table hasn't been
+            calculated yet.
+        """
+
+        row_count = (
+            TableUsage.objects.filter(table_id=table_id, row_count__isnull=False)
+            .values_list("row_count", flat=True)
+            .first()
+        )
+        if row_count is None:
+            return None
+
+        pending_row_count = TableUsageUpdate.objects.filter(
+            table_id=table_id, row_count__isnull=False
+        ).aggregate(total=Coalesce(Sum("row_count"), 0))["total"]
+
+        return max(row_count + pending_row_count, 0)
+
     @classmethod
     def create_tables_usage_for_new_database(cls, database_id: int):
         """
@@ -365,7 +392,7 @@ class TableHandler(metaclass=baserow_trace_methods(tracer)):
         user: AbstractUser,
         database: Database,
         name: str,
-        data: Optional[List[List[Any]]] = None,
+        data: Optional[Collection[List[Any]]] = None,
         first_row_header: bool = True,
         fill_example: bool = False,
         progress: Optional[Progress] = None,
@@ -379,8 +406,9 @@ class TableHandler(metaclass=baserow_trace_methods(tracer)):
         :param user: The user on whose behalf the table is created.
         :param database: The database that the table instance belongs to.
         :param name: The name of the table is created.
-        :param data: A list containing all the rows that need to be inserted is
-            expected. All the values will be inserted in the database.
+        :param data: A list, or any sized iterable that can be iterated over multiple
+            times, containing all the rows that need to be inserted is expected. All
+            the values will be inserted in the database.
         :param first_row_header: Indicates if the first row are the fields. The names
             of these rows are going to be used as fields. If `fields` is provided,
             this options is ignored.
@@ -400,7 +428,9 @@ class TableHandler(metaclass=baserow_trace_methods(tracer)):
         if progress:
             progress.increment(0, state=TABLE_CREATION)
 
+        row_count = None
         if data is not None:
+            row_count = len(data) - 1 if first_row_header else len(data)
             (
                 fields,
                 data,
@@ -422,6 +452,7 @@ class TableHandler(metaclass=baserow_trace_methods(tracer)):
             data=data,
             progress=progress,
             send_realtime_update=False,
+            row_count=row_count,
         )
 
         table_created.send(self, table=table, user=user)
@@ -494,13 +525,16 @@ class TableHandler(metaclass=baserow_trace_methods(tracer)):
         return table
 
     def normalize_initial_table_data(
-        self, data: List[List[Any]], first_row_header: bool
-    ) -> Tuple[List, List]:
+        self, data: Collection[List[Any]], first_row_header: bool
+    ) -> Tuple[List, Iterator[List[str]]]:
         """
         Normalizes the provided initial table data. The amount of columns will be made
-        equal for each row. The header and the rows will also be separated.
+        equal for each row. The header and the rows will also be separated. The data
+        is iterated over twice but never copied, the rows are lazily converted while
+        being consumed.
 
-        :param data: A list containing all the provided rows.
+        :param data: A sized iterable containing all the provided rows. It can be a
+            list or any object that can be iterated over multiple times.
         :param first_row_header: Indicates if the first row is the header. For each
             of these header columns a field is going to be created.
         :raises InvalidInitialTableData: When the data doesn't contain a column or row.
@@ -509,8 +543,8 @@ class TableHandler(metaclass=baserow_trace_methods(tracer)):
         :raises ReservedBaserowFieldNameException: When the field name is reserved by
             Baserow.
         :raises InvalidBaserowFieldName: When the field name is invalid (empty).
-        :return: A list containing the field names with a type and a list containing all
-            the rows.
+        :return: A list containing the field names with a type and an iterator over
+            all the rows.
         """
 
         if len(data) == 0:
@@ -528,7 +562,8 @@ class TableHandler(metaclass=baserow_trace_methods(tracer)):
         if largest_column_count == 0:
             raise InvalidInitialTableData("At least one column should be provided.")
 
-        fields = data.pop(0) if first_row_header else []
+        rows = iter(data)
+        fields = list(next(rows)) if first_row_header else []
 
         for i in range(len(fields), largest_column_count):
             fields.append(_("Field %d") % (i + 1,))
@@ -559,7 +594,7 @@ class TableHandler(metaclass=baserow_trace_methods(tracer)):
             raise InvalidBaserowFieldName()
 
         fields_with_type = [(field_name, "text", {}) for field_name in fields]
-        result = [[str(value) for value in row] for row in data]
+        result = ([str(value) for value in row] for row in rows)
 
         return fields_with_type, result
 
@@ -23,6 +23,9 @@ from baserow.contrib.database.fields.exceptions import (
     OrderByFieldNotFound,
     OrderByFieldNotPossible,
 )
+from baserow.contrib.database.fields.expressions import (
+    get_json_aggregation_annotation_name,
+)
 from baserow.contrib.database.fields.field_filters import (
     FILTER_TYPE_AND,
     FILTER_TYPE_OR,
@@ -43,6 +46,7 @@ from baserow.contrib.database.search.handler import (
     SearchMode,
 )
 from baserow.contrib.database.table.cache import (
+    generated_model_classes_cache,
     get_cached_model_field_attrs,
     set_cached_model_field_attrs,
 )
@@ -123,7 +127,10 @@ class TableModelQuerySet(MultiFieldPrefetchQuerysetMixin, BaserowCTEQuerySet):
             return super().count()
 
     def enhance_by_fields(
-        self, only_field_ids: Optional[List[int]] = None, **kwargs
+        self,
+        only_field_ids: Optional[List[int]] = None,
+        use_json_aggregation: bool = False,
+        **kwargs,
     ) -> QuerySet:
         """
         Enhances the queryset based on the `enhance_queryset_in_bulk` for each unique
@@ -134,6 +141,10 @@ class TableModelQuerySet(MultiFieldPrefetchQuerysetMixin, BaserowCTEQuerySet):
 
         :param only_field_ids: only apply the prefetch related for the field with ID
           included in the given list.
+        :param use_json_aggregation: if True, the cell values of the fields that
+          support it are selected as JSON arrays in the main query instead of being
+          prefetched, see `FieldType.get_json_aggregation_expression`. Only use this
+          if the rows are going to be serialized with the response serializers.
         :return: The enhanced queryset.
         """
 
@@ -144,11 +155,24 @@ class TableModelQuerySet(MultiFieldPrefetchQuerysetMixin, BaserowCTEQuerySet):
         )
 
         by_type = defaultdict(list)
+        json_aggregations = {}
         for field_object in selected_fields:
             field_type = field_object["type"]
+            if use_json_aggregation:
+                expression = field_type.get_json_aggregation_expression(
+                    field_object["field"], field_object["name"], self.model, **kwargs
+                )
+                if expression is not None:
+                    annotation_name = get_json_aggregation_annotation_name(
+                        field_object["name"]
+                    )
+                    json_aggregations[annotation_name] = expression
+                    continue
             by_type[field_type].append(field_object)
         for field_type, field_objects in by_type.items():
             self = field_type.enhance_queryset_in_bulk(self, field_objects, **kwargs)
+        if json_aggregations:
+            self = self.annotate(**json_aggregations)
         return self
 
     def search_all_fields(
@@ -906,16 +930,33 @@ class Table(
     @baserow_trace(tracer)
     def get_model(self, **kwargs):
         """
-        Get model from local cache if the kwargs are the default values.
+        Get model from local cache if the kwargs are the default values. If it's not
+        in the local cache yet, the model class generated by a previous request in
+        this process is reused if the table didn't change in the meantime.
         See `_get_model` doc for more information.
         """
 
         if are_kwargs_default(self._get_model, **kwargs):
             return local_cache.get(
-                f"database_table_model_{self.id}", lambda: self._get_model(**kwargs)
+                f"database_table_model_{self.id}", self._get_process_cached_model
             )
         return self._get_model(**kwargs)
 
+    def _get_process_cached_model(self) -> Type[GeneratedTableModel]:
+        if settings.BASEROW_DISABLE_MODEL_CACHE:
+            return self._get_model()
+
+        self._refresh_version()
+        return generated_model_classes_cache.get(self, self._get_model)
+
+    def _refresh_version(self):
+        # We don't need to refresh the version if it has already been refreshed for
+        # this session.
+        local_cache.get(
+            f"database_table_model_{self.id}_refreshed",
+            lambda: self.refresh_from_db(fields=["version"]),
+        )
+
     def _get_model(
         self,
         fields=None,
@@ -1043,12 +1084,7 @@ class Table(
         )
 
         if use_cache:
-            # We don't need to refresh the version if it has already been refreshed for
-            # this session.
-            local_cache.get(
-                f"database_table_model_{self.id}_refreshed",
-                lambda: self.refresh_from_db(fields=["version"]),
-            )
+            self._refresh_version()
             field_attrs = get_cached_model_field_attrs(self)
         else:
             field_attrs = None
@@ -3,8 +3,10 @@ import itertools
 import re
 import traceback
 from collections import defaultdict, namedtuple
+from contextlib import contextmanager
 from copy import deepcopy
 from dataclasses import dataclass
+from functools import partial
 from hashlib import shake_128
 from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Type, Union
 
@@ -15,7 +17,8 @@ from django.core.cache import cache
 from django.core.exceptions import FieldDoesNotExist, ValidationError
 from django.db import connection
 from django.db import models as django_models
-from django.db.models import Count, Q
+from django.db import transaction
+from django.db.models import Count, Exists, OuterRef, Q
 from django.db.models.expressions import OrderBy
 from django.db.models.query import QuerySet
 
@@ -84,7 +87,12 @@ from baserow.contrib.database.views.registries import (
     view_ownership_type_registry,
 )
 from baserow.contrib.database.views.view_filter_groups import ViewGroupedFiltersAdapter
-from baserow.core.db import specific_iterator, sql, transaction_atomic
+from baserow.core.db import (
+    get_estimated_count,
+    specific_iterator,
+    sql,
+    transaction_atomic,
+)
 from baserow.core.exceptions import PermissionDenied
 from baserow.core.handler import CoreHandler
 from baserow.core.models import Workspace
@@ -139,6 +147,7 @@ from .models import (
     ViewSubscription,
 )
 from .registries import (
+    ViewAggregationType,
     decorator_type_registry,
     decorator_value_provider_type_registry,
     view_aggregation_type_registry,
@@ -193,6 +202,32 @@ class UpdatedViewWithChangedAttributes:
     new_view_attributes: Dict[str, Any]
 
 
+@dataclass
+class ViewAggregationsSnapshot:
+    """
+    The cached aggregations of a view that can be updated incrementally, together
+    with the partial aggregation values of the rows before they changed.
+    """
+
+    view: View
+    aggregations: List[Tuple[Field, str]]
+    versions: Dict[str, int]
+    incremental_values_before: Dict[str, Dict[str, Any]]
+
+
+def _add_partial_aggregation_values(value: Any, added: Any, removed: Any) -> Any:
+    """
+    Adds and removes partial aggregation values. `None` is the result of an
+    aggregation over no values, so it's treated as the neutral element.
+    """
+
+    if added is not None:
+        value = added if value is None else value + added
+    if removed is not None:
+        value = -removed if value is None else value - removed
+    return value
+
+
 class ViewIndexingHandler(metaclass=baserow_trace_methods(tracer)):
     @classmethod
     def does_index_exist(cls, index_name: str) -> bool:
@@ -2776,6 +2811,7 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
         apply_sorts: bool = True,
         apply_filters: bool = True,
         search_mode: Optional[SearchMode] = None,
+        use_json_aggregation: bool = False,
     ) -> QuerySet:
         """
         Returns a queryset for the provided view which is appropriately sorted,
@@ -2796,6 +2832,9 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
         :param apply_sorts: Whether to apply view sorts to the resulting queryset.
         :param apply_filters: Whether to apply view filters to the resulting queryset.
         :param search_mode: The type of search to perform if a search term is provided.
+        :param use_json_aggregation: Whether the many to many cell values must be
+            selected as JSON in the main query instead of being prefetched. See
+            `TableModelQuerySet.enhance_by_fields`.
         :return: The appropriate queryset for the provided view.
         :raises ViewDoesNotSupportListingRows: When the view type does not support
             listing rows (i.e. a form view).
@@ -2804,7 +2843,9 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
         if model is None:
             model = view.table.get_model()
 
-        queryset = model.objects.all().enhance_by_fields()
+        queryset = model.objects.all().enhance_by_fields(
+            use_json_aggregation=use_json_aggregation
+        )
 
         view_type: ViewType = view_type_registry.get_by_model(view.specific_class)
         if not view_type.can_list_rows:
@@ -2827,6 +2868,37 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
             )
         return queryset
 
+    def get_approximate_queryset_count(self, queryset: QuerySet) -> int:
+        """
+        Returns the number of rows of the provided view queryset without running a
+        `COUNT(*)` over large tables. If the queryset isn't filtered, the row count
+        of the table usage is used. Otherwise, the number of rows estimated by the
+        query planner is returned. The rows of small tables are still counted
+        because it's fast and the estimates are the least accurate there.
+
+        :param queryset: The queryset of the rows of a view, as returned by
+            `get_queryset`.
+        :return: The approximate number of rows of the queryset.
+        """
+
+        from baserow.contrib.database.table.handler import TableUsageHandler
+
+        model = queryset.model
+        unfiltered_queryset = model.objects.all()
+        is_filtered = queryset.query.where != unfiltered_queryset.query.where
+
+        table_row_count = TableUsageHandler.get_table_row_count(model.baserow_table_id)
+        if table_row_count is None:
+            table_row_count = get_estimated_count(unfiltered_queryset)
+
+        if table_row_count < settings.BASEROW_APPROXIMATE_COUNT_MIN_ROWS:
+            return queryset.count()
+
+        if not is_filtered:
+            return table_row_count
+
+        return min(get_estimated_count(queryset.order_by()), table_row_count)
+
     def _get_aggregation_lock_cache_key(self, view: View):
         """
         Returns the aggregation lock cache key for the specified view.
@@ -2848,6 +2920,14 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
 
         return f"aggregation_version__{view.pk}_{name}"
 
+    def _get_table_incremental_aggregations_cache_key(self, table_id: int):
+        """
+        Returns the cache key indicating that incrementally updatable aggregation
+        values of the views of the specified table can be cached.
+        """
+
+        return f"aggregation_incremental__table_{table_id}"
+
     def clear_full_aggregation_cache(self, view: View):
         """
         Clears the cache key for the specified view.
@@ -2874,6 +2954,301 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
                 # No cache key, we create one
                 cache.set(cache_key, 2)
 
+    @contextmanager
+    def _aggregation_lock(self, view: View):
+        """
+        Acquires the aggregation lock of the view if the cache backend supports it.
+        Nothing happens otherwise.
+        """
+
+        if not hasattr(cache, "lock"):
+            yield
+            return
+
+        cache_lock = cache.lock(self._get_aggregation_lock_cache_key(view), timeout=10)
+        cache_lock.acquire()
+        try:
+            yield
+        finally:
+            try:
+                cache_lock.release()
+            except LockNotOwnedError:
+                # If the lock release fails, it might be because of the timeout
+                # and it's been stolen so we don't really care
+                pass
+
+    def get_aggregations_rows_snapshot(
+        self,
+        table: Table,
+        model: GeneratedTableModel,
+        row_ids: Optional[List[int]] = None,
+    ) -> List[ViewAggregationsSnapshot]:
+        """
+        Must be called before rows of the table are created, updated or deleted. It
+        collects the cached aggregations of all the views of the table that can be
+        updated incrementally and computes the partial aggregation values of the rows
+        that are about to change. After the change, the snapshot must be passed
+        into `apply_aggregations_rows_snapshot`, which applies the difference to the
+        cached values instead of recomputing them over the whole table.
+
+        :param table: The table where the rows are going to change.
+        :param model: The model of the table.
+        :param row_ids: The ids of the rows that are going to be updated or deleted,
+            or None if the rows are going to be created.
+        :return: A snapshot for every view having cached incremental aggregations.
+        """
+
+        # Most tables don't have any cached aggregation, so avoid querying the field
+        # options of their views on every row change. The marker is stored with the
+        # aggregation values, so it can't expire before them.
+        if not cache.get(self._get_table_incremental_aggregations_cache_key(table.id)):
+            return []
+
+        aggregations_by_view = {}
+        for view_type in view_type_registry.get_all():
+            if view_type.can_aggregate_field:
+                aggregations_by_view.update(
+                    view_type.get_visible_aggregations_of_table(table)
+                )
+
+        if not aggregations_by_view:
+            return []
+
+        keys = []
+        for view, aggregations in aggregations_by_view.items():
+            for field, _ in aggregations:
+                keys.append(
+                    self._get_aggregation_value_cache_key(view, field.db_column)
+                )
+                keys.append(
+                    self._get_aggregation_version_cache_key(view, field.db_column)
+                )
+        cached = cache.get_many(keys)
+
+        snapshots = []
+        for view, aggregations in aggregations_by_view.items():
+            versions = {}
+            cached_aggregations = []
+            for field, aggregation_type_name in aggregations:
+                name = field.db_column
+                cached_value = cached.get(
+                    self._get_aggregation_value_cache_key(view, name), {"version": 0}
+                )
+                version = cached.get(
+                    self._get_aggregation_version_cache_key(view, name), 1
+                )
+                # Only valid cached values computed from partial aggregations can be
+                # updated, the others are recomputed on the next request anyway.
+                if (
+                    cached_value["version"] == version
+                    and cached_value.get("incremental_values") is not None
+                    and field.id in model._field_objects
+                ):
+                    versions[name] = version
+                    cached_aggregations.append((field, aggregation_type_name))
+
+            if not cached_aggregations:
+                continue
+
+            incremental_values = {}
+            if row_ids:
+                self.get_field_aggregations(
+                    None,
+                    view,
+                    cached_aggregations,
+                    model,
+                    skip_perm_check=True,
+                    only_row_ids=row_ids,
+                    incremental_values=incremental_values,
+                )
+            snapshots.append(
+                ViewAggregationsSnapshot(
+                    view=view,
+                    aggregations=cached_aggregations,
+                    versions=versions,
+                    incremental_values_before=incremental_values,
+                )
+            )
+
+        return snapshots
+
+    def apply_aggregations_rows_snapshot(
+        self,
+        snapshots: List[ViewAggregationsSnapshot],
+        table: Table,
+        model: GeneratedTableModel,
+        row_ids: List[int],
+        updated_fields: List[Field],
+        dependant_fields: List[Field],
+    ):
+        """
+        Updates the cached aggregations collected by `get_aggregations_rows_snapshot`
+        with the difference between the partial aggregation values of the changed rows
+        before and after the change. Must be called after
+        `ViewHandler.field_value_updated` is called with the updated and dependant
+        fields. The new values are stored when the transaction commits, only if no
+        other change happened in the meantime. Otherwise, the aggregations are
+        invalidated and will be fully recomputed on the next request.
+
+        :param snapshots: The snapshots taken before the rows changed.
+        :param table: The table where the rows have changed.
+        :param model: The model of the table.
+        :param row_ids: The ids of the rows that have been created, updated or
+            deleted. Deleted rows don't match anymore, so their partial aggregation
+            value after the change is empty.
+        :param updated_fields: The fields of the table which values have changed.
+        :param dependant_fields: The fields depending on the updated fields which
+            values have changed.
+        """
+
+        if not snapshots:
+            return
+
+        # The values of fields depending on the changed rows via a link row field can
+        # have changed in other rows of the same table as well, so in that case we
+        # can't limit the difference to the changed rows.
+        has_link_row_fields = any(
+            isinstance(field_object["field"], LinkRowField)
+            for field_object in model._field_objects.values()
+        )
+        other_rows_can_have_changed = has_link_row_fields and any(
+            field.table_id == table.id for field in dependant_fields
+        )
+
+        # The versions of these fields have been incremented once by
+        # `field_value_updated`.
+        invalidated_names = {
+            field.db_column
+            for field in updated_fields + dependant_fields
+            if field.table_id == table.id
+        }
+
+        for snapshot in snapshots:
+            view = snapshot.view
+            incremental_values_after = {}
+            if row_ids and not other_rows_can_have_changed:
+                self.get_field_aggregations(
+                    None,
+                    view,
+                    snapshot.aggregations,
+                    model,
+                    skip_perm_check=True,
+                    only_row_ids=row_ids,
+                    incremental_values=incremental_values_after,
+                )
+
+            to_apply = {}
+            # Hold the lock while incrementing the versions, so that an aggregation
+            # that is being computed concurrently is stored before, and thus doesn't
+            # include the changes of this transaction.
+            with self._aggregation_lock(view):
+                for field, aggregation_type_name in snapshot.aggregations:
+                    name = field.db_column
+                    version = self._increment_aggregation_version(view, name)
+                    expected_version = snapshot.versions[name] + 1
+                    if name in invalidated_names:
+                        expected_version += 1
+
+                    # Another change happened in the meantime if the version doesn't
+                    # match, then the incremented version takes care of invalidating
+                    # the cached value.
+                    if version == expected_version and not other_rows_can_have_changed:
+                        to_apply[name] = (
+                            view_aggregation_type_registry.get(aggregation_type_name),
+                            version,
+                            snapshot.versions[name],
+                            snapshot.incremental_values_before.get(name, {}),
+                            incremental_values_after.get(name, {}),
+                        )
+
+            if to_apply:
+                transaction.on_commit(
+                    partial(self._store_incremental_aggregations, view, to_apply)
+                )
+
+    def _increment_aggregation_version(self, view: View, name: str) -> int:
+        """
+        Increments the aggregation version of the view/name and returns the new one.
+        """
+
+        cache_key = self._get_aggregation_version_cache_key(view, name)
+        try:
+            return cache.incr(cache_key, 1)
+        except ValueError:
+            # No cache key, we create one
+            cache.set(cache_key, 2)
+            return 2
+
+    def _store_incremental_aggregations(
+        self,
+        view: View,
+        to_apply: Dict[
+            str,
+            Tuple[ViewAggregationType, int, int, Dict[str, Any], Dict[str, Any]],
+        ],
+    ):
+        """
+        Applies the differences computed by `apply_aggregations_rows_snapshot` to the
+        cached aggregation values. If a cached value has been recomputed or another
+        change happened since the snapshot was taken, the value is invalidated
+        instead.
+        """
+
+        with self._aggregation_lock(view):
+            keys = [self._get_aggregation_value_cache_key(view, n) for n in to_apply]
+            keys += [self._get_aggregation_version_cache_key(view, n) for n in to_apply]
+            cached = cache.get_many(keys)
+
+            to_cache, to_invalidate = {}, []
+            for name, (
+                aggregation_type,
+                version,
+                previous_version,
+                values_before,
+                values_after,
+            ) in to_apply.items():
+                value_cache_key = self._get_aggregation_value_cache_key(view, name)
+                cached_value = cached.get(value_cache_key, {"version": 0})
+                current_version = cached.get(
+                    self._get_aggregation_version_cache_key(view, name), 1
+                )
+
+                if current_version != version:
+                    # Changed again in the meantime, nothing to do.
+                    continue
+
+                if (
+                    cached_value["version"] != previous_version
+                    or cached_value.get("incremental_values") is None
+                ):
+                    # The value has been recomputed after the snapshot, possibly
+                    # before this transaction was committed.
+                    to_invalidate.append(name)
+                    continue
+
+                values = {
+                    key: _add_partial_aggregation_values(
+                        value, values_after.get(key), values_before.get(key)
+                    )
+                    for key, value in cached_value["incremental_values"].items()
+                }
+                to_cache[value_cache_key] = {
+                    "value": aggregation_type.get_value_from_incremental_aggregations(
+                        values
+                    ),
+                    "version": version,
+                    "incremental_values": values,
+                }
+
+            if to_cache:
+                to_cache[
+                    self._get_table_incremental_aggregations_cache_key(view.table_id)
+                ] = True
+                cache.set_many(to_cache)
+
+        if to_invalidate:
+            self.clear_aggregation_cache(view, to_invalidate)
+
     def _get_aggregations_to_compute(
         self,
         view: View,
@@ -3033,6 +3408,7 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
 
         # Do we need to compute some aggregations?
         if need_computation or with_total:
+            incremental_values = {}
             db_result = self.get_field_aggregations(
                 user,
                 view,
@@ -3048,6 +3424,7 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
                 search_mode=search_mode,
                 skip_perm_check=skip_perm_check,
                 restrict_to_field_ids=visible_field_ids,
+                incremental_values=incremental_values,
             )
 
             if not search and not adhoc_filters.has_any_filters:
@@ -3058,8 +3435,18 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
                         to_cache[self._get_aggregation_value_cache_key(view, key)] = {
                             "value": value,
                             "version": need_computation[key]["version"],
+                            # Allows the value to be updated incrementally when
+                            # rows change, see `get_aggregations_rows_snapshot`.
+                            "incremental_values": incremental_values.get(key),
                         }
 
+                if incremental_values:
+                    to_cache[
+                        self._get_table_incremental_aggregations_cache_key(
+                            view.table_id
+                        )
+                    ] = True
+
                 # Let's cache the newly computed values
                 cache.set_many(to_cache)
 
@@ -3089,6 +3476,8 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
         search_mode: Optional[SearchMode] = None,
         skip_perm_check: bool = False,
         restrict_to_field_ids: Optional[Set[int]] = None,
+        only_row_ids: Optional[Iterable[int]] = None,
+        incremental_values: Optional[Dict[str, Dict[str, Any]]] = None,
     ) -> Dict[str, Any]:
         """
         Returns a dict of aggregation for given (field, aggregation_type) couple list.
@@ -3112,6 +3501,12 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
         :param skip_perm_check: Skips the permission check if not necessary.
         :param restrict_to_field_ids: Restrict the aggregations only to certain
             fields, for example if the aggregation is requested for public views.
+        :param only_row_ids: If provided, only the rows with these ids are
+            aggregated.
+        :param incremental_values: If a dict is provided, the aggregation types that
+            support it are computed using their incremental aggregations. The
+            results of the partial aggregations are added to this dict by field name
+            so that they can be cached and kept up to date later.
         :raises FieldAggregationNotSupported: When the view type doesn't support
             field aggregation.
         :raises FieldNotInTable: When one of the field doesn't belong to the specified
@@ -3160,8 +3555,12 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
                 search, restrict_to_field_ids, search_mode=search_mode
             )
 
+        if only_row_ids is not None:
+            queryset = queryset.filter(id__in=only_row_ids)
+
         aggregation_dict = {}
         distribution_dict = {}
+        incremental_aggregations = {}
 
         for field_instance, aggregation_type_name in aggregations:
             field_name = field_instance.db_column
@@ -3178,6 +3577,22 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
 
             aggregation_type = view_aggregation_type_registry.get(aggregation_type_name)
 
+            if incremental_values is not None:
+                partial_aggregations = aggregation_type.get_incremental_aggregations(
+                    field_name, model_field, field
+                )
+                if partial_aggregations is not None:
+                    incremental_aggregations[field_name] = aggregation_type
+                    for name, aggregation_object in partial_aggregations.items():
+                        if isinstance(aggregation_object, AnnotatedAggregation):
+                            queryset = queryset.annotate(
+                                **aggregation_object.annotations
+                            )
+                            aggregation_object = aggregation_object.aggregation
+                        alias = f"{field_name}_incremental_{name}"
+                        aggregation_dict[alias] = aggregation_object
+                    continue
+
             aggregation_object = aggregation_type.get_aggregation(
                 field_name, model_field, field
             )
@@ -3209,6 +3624,19 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
 
         aggregations = queryset.aggregate(**aggregation_dict)
         aggregations.update(distribution_dict)
+
+        for field_name, aggregation_type in incremental_aggregations.items():
+            prefix = f"{field_name}_incremental_"
+            values = {
+                alias[len(prefix) :]: aggregations.pop(alias)
+                for alias in list(aggregations.keys())
+                if alias.startswith(prefix)
+            }
+            incremental_values[field_name] = values
+            aggregations[
+                field_name
+            ] = aggregation_type.get_value_from_incremental_aggregations(values)
+
         return aggregations
 
     def rotate_view_slug(
@@ -3764,6 +4192,7 @@ class CachingPublicViewRowChecker:
             .prefetch_related("viewfilter_set", "filter_groups")
             .all()
         )
+        self._model = model
         self._updated_field_ids = updated_field_ids
         self._views_with_filters = []
         self._always_visible_views = []
@@ -3811,19 +4240,10 @@ class CachingPublicViewRowChecker:
         :return: A list of views where the row is visible for this checkers table.
         """
 
-        views = []
-        for view, filter_qs, can_use_cache in self._views_with_filters:
-            if can_use_cache:
-                if row.id not in self._view_row_check_cache[view.id]:
-                    self._view_row_check_cache[view.id][
-                        row.id
-                    ] = self._check_row_visible(filter_qs, row)
-                if self._view_row_check_cache[view.id][row.id]:
-                    views.append(view)
-            elif self._check_row_visible(filter_qs, row):
-                views.append(view)
-
-        return views + self._always_visible_views
+        return [
+            public_view_rows.view
+            for public_view_rows in self.get_public_views_where_rows_are_visible([row])
+        ]
 
     def get_public_views_where_rows_are_visible(self, rows) -> List[PublicViewRows]:
         """
@@ -3841,26 +4261,30 @@ class CachingPublicViewRowChecker:
             are visible for this checkers table.
         """
 
-        visible_views_rows = []
         row_ids = {row.id for row in rows}
-        for view, filter_qs, can_use_cache in self._views_with_filters:
-            if can_use_cache:
-                for id in row_ids:
-                    if id not in self._view_row_check_cache[view.id]:
-                        visible_ids = set(self._check_rows_visible(filter_qs, rows))
-                        for visible_id in visible_ids:
-                            self._view_row_check_cache[view.id][visible_id] = True
-                        break
-                else:
-                    visible_ids = row_ids
-
-                if len(visible_ids) > 0:
-                    visible_views_rows.append(PublicViewRows(view, visible_ids))
+        views_to_check = [
+            (view, filter_qs)
+            for view, filter_qs, can_use_cache in self._views_with_filters
+            if not can_use_cache
+            or any(id not in self._view_row_check_cache[view.id] for id in row_ids)
+        ]
+        visible_ids_per_view = self._check_rows_visible_in_views(
+            views_to_check, row_ids
+        )
 
+        visible_views_rows = []
+        for view, filter_qs, can_use_cache in self._views_with_filters:
+            view_row_check_cache = self._view_row_check_cache[view.id]
+            if view.id in visible_ids_per_view:
+                visible_ids = visible_ids_per_view[view.id]
+                if can_use_cache:
+                    for id in row_ids:
+                        view_row_check_cache[id] = id in visible_ids
             else:
-                visible_ids = set(self._check_rows_visible(filter_qs, rows))
-                if len(visible_ids) > 0:
-                    visible_views_rows.append(PublicViewRows(view, visible_ids))
+                visible_ids = {id for id in row_ids if view_row_check_cache[id]}
+
+            if len(visible_ids) > 0:
+                visible_views_rows.append(PublicViewRows(view, visible_ids))
 
         for visible_view in self._always_visible_views:
             visible_views_rows.append(
@@ -3869,15 +4293,39 @@ class CachingPublicViewRowChecker:
 
         return visible_views_rows
 
-    # noinspection PyMethodMayBeStatic
-    def _check_row_visible(self, filter_qs, row):
-        return filter_qs.filter(id=row.id).exists()
+    def _check_rows_visible_in_views(
+        self, views_with_filters: List[Tuple[View, QuerySet]], row_ids: Set[int]
+    ) -> Dict[int, Set[int]]:
+        """
+        Checks in which of the provided views the rows are visible using a single
+        query, regardless of the number of views. Every view filter queryset is
+        added as a boolean `EXISTS` column to a query selecting the rows.
+
+        :param views_with_filters: The views with their filtered querysets that must
+            be checked.
+        :param row_ids: The ids of the rows that must be checked.
+        :return: A dict containing the visible row ids per view id.
+        """
 
-    # noinspection PyMethodMayBeStatic
-    def _check_rows_visible(self, filter_qs, rows):
-        return filter_qs.filter(id__in=[row.id for row in rows]).values_list(
-            "id", flat=True
+        visible_ids_per_view = {view.id: set() for view, _ in views_with_filters}
+        if len(visible_ids_per_view) == 0 or len(row_ids) == 0:
+            return visible_ids_per_view
+
+        annotations = {
+            f"visible_in_view_{view.id}": Exists(filter_qs.filter(id=OuterRef("id")))
+            for view, filter_qs in views_with_filters
+        }
+        queryset = (
+            self._model.objects_and_trash.filter(id__in=row_ids)
+            .order_by()
+            .values("id", **annotations)
         )
+        for values in queryset:
+            for view, _ in views_with_filters:
+                if values[f"visible_in_view_{view.id}"]:
+                    visible_ids_per_view[view.id].add(values["id"])
+
+        return visible_ids_per_view
 
     def _view_row_checks_can_be_cached(self, view):
         if self._updated_field_ids is None:
@@ -6,6 +6,9 @@ from baserow.contrib.database.fields.signals import (
     field_updated,
 )
 from baserow.contrib.database.rows.signals import (
+    before_rows_create,
+    before_rows_delete,
+    before_rows_update,
     rows_created,
     rows_deleted,
     rows_updated,
@@ -22,7 +25,7 @@ from baserow.contrib.database.views.signals import (
     view_updated,
 )
 
-from .handler import ViewSubscriptionHandler
+from .handler import ViewHandler, ViewSubscriptionHandler
 
 
 def _notify_table_data_updated(table: Table, model: GeneratedTableModel | None = None):
@@ -61,6 +64,62 @@ def notify_rows_signals(sender, rows, user, table, model, dependant_fields, **kw
         _notify_table_data_updated(updated_table)
 
 
+@receiver(before_rows_create)
+def snapshot_aggregations_before_rows_create(sender, table, model, **kwargs):
+    return ViewHandler().get_aggregations_rows_snapshot(table, model)
+
+
+@receiver([before_rows_update, before_rows_delete])
+def snapshot_aggregations_before_rows_change(sender, rows, table, model, **kwargs):
+    return ViewHandler().get_aggregations_rows_snapshot(
+        table, model, [row.id for row in rows]
+    )
+
+
+def _apply_aggregations_rows_snapshot(snapshot_receiver, row_ids, table, **kwargs):
+    # The signal can be sent without a preceding `before_*` signal, in which case
+    # the aggregations are invalidated the regular way.
+    snapshots = dict(kwargs.get("before_return") or []).get(snapshot_receiver)
+    if snapshots:
+        ViewHandler().apply_aggregations_rows_snapshot(
+            snapshots,
+            table,
+            kwargs["model"],
+            row_ids,
+            kwargs.get("fields") or [],
+            kwargs.get("dependant_fields") or [],
+        )
+
+
+@receiver(rows_created)
+def update_aggregations_after_rows_created(sender, rows, table, **kwargs):
+    _apply_aggregations_rows_snapshot(
+        snapshot_aggregations_before_rows_create,
+        [row.id for row in rows],
+        table,
+        **kwargs,
+    )
+
+
+@receiver(rows_updated)
+def update_aggregations_after_rows_updated(sender, rows, table, **kwargs):
+    _apply_aggregations_rows_snapshot(
+        snapshot_aggregations_before_rows_change,
+        [row.id for row in rows],
+        table,
+        **kwargs,
+    )
+
+
+@receiver(rows_deleted)
+def update_aggregations_after_rows_deleted(sender, rows, table, **kwargs):
+    # The deleted rows don't match the view anymore, so there is no need to
+    # aggregate them again.
+    _apply_aggregations_rows_snapshot(
+        snapshot_aggregations_before_rows_change, [], table, **kwargs
+    )
+
+
 @receiver(view_updated)
 def notify_view_updated(sender, view, user, old_view, **kwargs):
     _notify_view_results_updated(view)
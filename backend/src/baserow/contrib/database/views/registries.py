@@ -682,6 +682,24 @@ class ViewType(
             "`get_aggregations` method."
         )
 
+    def get_visible_aggregations_of_table(
+        self, table: "Table"
+    ) -> Dict["View", List[Tuple[django_models.Field, str]]]:
+        """
+        Should return the aggregations of the visible fields of all the views of this
+        type in the provided table, preferably using a single query. This is used to
+        keep the cached aggregation values up to date when rows change.
+
+        :param table: The table to return the aggregations for.
+        :return: A dict with the view as key and the list of tuple
+            (Field, aggregation_type) as value.
+        """
+
+        raise NotImplementedError(
+            "If the view supports field aggregation it must implement "
+            "`get_visible_aggregations_of_table` method."
+        )
+
     def after_field_value_update(
         self, updated_fields: Union[Iterable["Field"], "Field"]
     ):
@@ -1090,6 +1108,43 @@ class ViewAggregationType(Instance):
             "Each aggregation type must have his own get_aggregation method."
         )
 
+    def get_incremental_aggregations(
+        self,
+        field_name: str,
+        model_field: django_models.Field,
+        field: "Field",
+    ) -> Optional[Dict[str, django_models.Aggregate]]:
+        """
+        Aggregation types that can be kept up to date when rows are created, updated
+        or deleted, without aggregating the whole table again, must return the
+        partial aggregations from which the value can be computed. The partial
+        aggregations must be additive, meaning that the result of a set of rows
+        equals the sum of the results of its subsets. This is for example true for a
+        count or a sum, but not for a median.
+
+        :param field_name: The name of the field that needs to be aggregated.
+        :param model_field: The field extracted from the model.
+        :param field: The instance of the underlying baserow field.
+        :return: A dict containing the partial aggregations by name, or None if the
+            aggregation can't be computed incrementally.
+        """
+
+        return None
+
+    def get_value_from_incremental_aggregations(self, values: Dict[str, Any]) -> Any:
+        """
+        Computes the aggregation value from the results of the partial aggregations
+        returned by `get_incremental_aggregations`.
+
+        :param values: The results of the partial aggregations by name.
+        :return: The aggregation value.
+        """
+
+        raise NotImplementedError(
+            "Each incremental aggregation type must implement "
+            "get_value_from_incremental_aggregations."
+        )
+
     def field_is_compatible(self, field: "Field") -> bool:
         """
         Given a particular instance of a field returns whether the field is supported
@@ -1,3 +1,4 @@
+from decimal import Decimal
 from typing import Dict
 
 from django.db.models import (
@@ -116,6 +117,12 @@ class CountViewAggregationType(ViewAggregationType):
             distinct=True,
         )
 
+    def get_incremental_aggregations(self, field_name, model_field, field):
+        return {"count": self.get_aggregation(field_name, model_field, field)}
+
+    def get_value_from_incremental_aggregations(self, values):
+        return values["count"]
+
 
 class EmptyCountViewAggregationType(ViewAggregationType):
     """
@@ -175,6 +182,12 @@ class EmptyCountViewAggregationType(ViewAggregationType):
                 filter=field_type.empty_query(field_name, model_field, field),
             )
 
+    def get_incremental_aggregations(self, field_name, model_field, field):
+        return {"count": self.get_aggregation(field_name, model_field, field)}
+
+    def get_value_from_incremental_aggregations(self, values):
+        return values["count"]
+
 
 class NotEmptyCountViewAggregationType(EmptyCountViewAggregationType):
     """
@@ -313,6 +326,14 @@ class SumViewAggregationType(ViewAggregationType):
     def get_aggregation(self, field_name, model_field, field):
         return Sum(field_name)
 
+    def get_incremental_aggregations(self, field_name, model_field, field):
+        # The count is needed to know whether the sum must be `None` because all the
+        # values are empty.
+        return {"sum": Sum(field_name), "count": Count(field_name)}
+
+    def get_value_from_incremental_aggregations(self, values):
+        return values["sum"] if values["count"] else None
+
 
 class AverageViewAggregationType(ViewAggregationType):
     """
@@ -337,6 +358,20 @@ class AverageViewAggregationType(ViewAggregationType):
             filter=~field_type.empty_query(field_name, model_field, field),
         )
 
+    def get_incremental_aggregations(self, field_name, model_field, field):
+        field_type = field_type_registry.get_by_model(field)
+        not_empty = ~field_type.empty_query(field_name, model_field, field)
+
+        return {
+            "sum": Sum(field_name, filter=not_empty),
+            "count": Count(field_name, filter=not_empty),
+        }
+
+    def get_value_from_incremental_aggregations(self, values):
+        if not values["count"]:
+            return None
+        return Decimal(values["sum"]) / values["count"]
+
 
 class StdDevViewAggregationType(ViewAggregationType):
     """
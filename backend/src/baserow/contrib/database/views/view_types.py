@@ -277,6 +277,20 @@ class GridViewType(ViewType):
         )
         return [(option.field, option.aggregation_raw_type) for option in field_options]
 
+    def get_visible_aggregations_of_table(self, table):
+        field_options = (
+            GridViewFieldOptions.objects.filter(grid_view__table=table, hidden=False)
+            .exclude(aggregation_raw_type="")
+            .select_related("grid_view", "field")
+        )
+
+        aggregations = defaultdict(list)
+        for options in field_options:
+            aggregations[options.grid_view].append(
+                (options.field, options.aggregation_raw_type)
+            )
+        return dict(aggregations)
+
     def after_field_value_update(self, updated_fields):
         """
         When a field value change, we need to invalidate the aggregation cache for this
@@ -51,7 +51,7 @@ def schedule_next_task_in_queue(webhook_id):
 @app.task(
     bind=True,
     max_retries=settings.BASEROW_WEBHOOKS_MAX_RETRIES_PER_CALL,
-    queue="export",
+    queue="webhooks",
 )
 def call_webhook(
     self,
@@ -1,4 +1,6 @@
+from functools import lru_cache
 from http.client import _is_illegal_header_value, _is_legal_header_name
+from http.cookiejar import DefaultCookiePolicy
 from socket import gaierror, timeout
 from typing import Callable
 from urllib.parse import urlparse
@@ -7,11 +9,14 @@ from django.conf import settings
 from django.core.exceptions import ValidationError
 from django.core.validators import URLValidator
 
-from advocate import AddrValidator, RequestsAPIWrapper
+from advocate import AddrValidator
+from advocate.adapters import ValidatingHTTPAdapter
 from advocate.connection import (
     UnacceptableAddressException,
     validating_create_connection,
 )
+from requests import Session
+from requests.adapters import HTTPAdapter
 
 INVALID_URL_CODE = "invalid_url"
 
@@ -23,19 +28,50 @@ def get_webhook_request_function() -> Callable:
     In production mode, the advocate library is used so that the internal
     network can't be reached. This can be disabled by changing the Django
     setting BASEROW_WEBHOOKS_ALLOW_PRIVATE_ADDRESS.
+    The function belongs to a new session that doesn't store any cookie, so that
+    nothing is shared between the calls of different webhooks. Only the adapter
+    is kept for the lifetime of the process, so that the connections to the
+    webhook endpoints are pooled and reused by the following calls.
     """
 
-    if settings.BASEROW_WEBHOOKS_ALLOW_PRIVATE_ADDRESS is True:
-        from requests import request
+    adapter = get_webhook_adapter(
+        settings.BASEROW_WEBHOOKS_ALLOW_PRIVATE_ADDRESS is True,
+        tuple(settings.BASEROW_WEBHOOKS_IP_BLACKLIST),
+        tuple(settings.BASEROW_WEBHOOKS_IP_WHITELIST),
+        tuple(settings.BASEROW_WEBHOOKS_URL_REGEX_BLACKLIST),
+    )
 
-        return request
-    else:
-        from advocate import request
+    session = Session()
+    session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+    session.adapters.clear()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session.request
+
+
+@lru_cache(maxsize=8)
+def get_webhook_adapter(
+    allow_private_address: bool,
+    ip_blacklist: tuple,
+    ip_whitelist: tuple,
+    hostname_blacklist: tuple,
+) -> HTTPAdapter:
+    """
+    Returns the process wide adapter holding the connection pools used to call
+    the webhooks. Contrary to a session, an adapter doesn't keep any state other
+    than the connections and can safely be shared by threads. A new adapter is
+    only created if the address validation settings change.
+    """
 
-        addr_validator = get_advocate_address_validator()
-        baserow_advocate = RequestsAPIWrapper(addr_validator)
+    if allow_private_address:
+        return HTTPAdapter()
 
-        return baserow_advocate.request
+    addr_validator = AddrValidator(
+        ip_blacklist=list(ip_blacklist),
+        ip_whitelist=list(ip_whitelist),
+        hostname_blacklist=list(hostname_blacklist),
+    )
+    return ValidatingHTTPAdapter(validator=addr_validator)
 
 
 def get_advocate_address_validator() -> AddrValidator:
@@ -0,0 +1,169 @@
+import json
+from typing import Any, Dict, List, Optional
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+
+from django_redis import get_redis_connection
+
+KEY_PREFIX = "rows_updated_broadcast_buffer"
+
+
+def _get_redis_client():
+    return get_redis_connection("default")
+
+
+class RowsUpdatedBroadcastBuffer:
+    """
+    Coalesces the `rows_updated` realtime messages of a table in Redis during a short
+    window. Updates of the same row are merged, so that many small updates result in
+    a single message containing the first version of the row before the updates, and
+    the latest version after. A buffer is kept per table and web socket id of the
+    sender because the sender must not receive the message.
+    """
+
+    # Safety net in case the scheduled flush never runs, the buffer must not be kept
+    # forever.
+    EXPIRES_SECONDS = 60
+
+    @classmethod
+    def is_enabled(cls) -> bool:
+        return settings.BASEROW_REALTIME_ROWS_UPDATED_DEBOUNCE_MS > 0
+
+    @classmethod
+    def _get_keys(cls, table_id: int, ignore_web_socket_id: Optional[str]):
+        base_key = f"{KEY_PREFIX}:{table_id}:{ignore_web_socket_id or ''}"
+        return (
+            f"{base_key}:before",
+            f"{base_key}:rows",
+            f"{base_key}:metadata",
+            f"{base_key}:fields",
+            f"{base_key}:scheduled",
+        )
+
+    @classmethod
+    def _get_web_socket_ids_key(cls, table_id: int):
+        return f"{KEY_PREFIX}:{table_id}:web_socket_ids"
+
+    @classmethod
+    def add(
+        cls,
+        table_id: int,
+        ignore_web_socket_id: Optional[str],
+        serialized_rows_before_update: List[Dict[str, Any]],
+        serialized_rows: List[Dict[str, Any]],
+        updated_field_ids: List[int],
+        metadata: Dict[int, Dict[str, Any]],
+    ) -> bool:
+        """
+        Merges the updated rows into the buffer of the table.
+
+        :param table_id: The table where the rows have been updated.
+        :param ignore_web_socket_id: The web socket id of the sender.
+        :param serialized_rows_before_update: The rows before they were updated.
+        :param serialized_rows: The updated rows.
+        :param updated_field_ids: The ids of the fields that have been updated.
+        :param metadata: The metadata of the updated rows.
+        :return: True if the buffer was empty, meaning that a flush must be
+            scheduled at the end of the window.
+        """
+
+        before_key, rows_key, metadata_key, fields_key, scheduled_key = cls._get_keys(
+            table_id, ignore_web_socket_id
+        )
+        expires = cls.EXPIRES_SECONDS
+
+        pipeline = _get_redis_client().pipeline()
+        for row in serialized_rows_before_update:
+            # Only the first version before the update must be kept.
+            pipeline.hsetnx(
+                before_key, row["id"], json.dumps(row, cls=DjangoJSONEncoder)
+            )
+        if serialized_rows:
+            pipeline.hset(
+                rows_key,
+                mapping={
+                    row["id"]: json.dumps(row, cls=DjangoJSONEncoder)
+                    for row in serialized_rows
+                },
+            )
+        if metadata:
+            pipeline.hset(
+                metadata_key,
+                mapping={
+                    row_id: json.dumps(row_metadata, cls=DjangoJSONEncoder)
+                    for row_id, row_metadata in metadata.items()
+                },
+            )
+        if updated_field_ids:
+            pipeline.sadd(fields_key, *updated_field_ids)
+        pipeline.sadd(cls._get_web_socket_ids_key(table_id), ignore_web_socket_id or "")
+        for key in (before_key, rows_key, metadata_key, fields_key):
+            pipeline.expire(key, expires)
+        pipeline.set(scheduled_key, 1, nx=True, ex=expires)
+        *_, is_first = pipeline.execute()
+        return bool(is_first)
+
+    @classmethod
+    def pop(
+        cls, table_id: int, ignore_web_socket_id: Optional[str]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Atomically removes and returns the merged updates of the buffer.
+
+        :param table_id: The table of the buffer.
+        :param ignore_web_socket_id: The web socket id of the sender.
+        :return: A dict with the `serialized_rows_before_update`, `serialized_rows`,
+            `updated_field_ids` and `metadata` keys or None if the buffer is empty.
+        """
+
+        keys = cls._get_keys(table_id, ignore_web_socket_id)
+        before_key, rows_key, metadata_key, fields_key, _ = keys
+
+        pipeline = _get_redis_client().pipeline()
+        pipeline.hgetall(before_key)
+        pipeline.hgetall(rows_key)
+        pipeline.hgetall(metadata_key)
+        pipeline.smembers(fields_key)
+        pipeline.delete(*keys)
+        pipeline.srem(cls._get_web_socket_ids_key(table_id), ignore_web_socket_id or "")
+        rows_before, rows, metadata, field_ids, *_ = pipeline.execute()
+
+        if not rows:
+            return None
+
+        def load_sorted_rows(serialized_rows_by_id):
+            return [
+                json.loads(serialized_rows_by_id[row_id])
+                for row_id in sorted(serialized_rows_by_id, key=int)
+            ]
+
+        return {
+            "serialized_rows_before_update": load_sorted_rows(rows_before),
+            "serialized_rows": load_sorted_rows(rows),
+            "updated_field_ids": sorted(int(field_id) for field_id in field_ids),
+            "metadata": {
+                int(row_id): json.loads(row_metadata)
+                for row_id, row_metadata in metadata.items()
+            },
+        }
+
+    @classmethod
+    def get_web_socket_ids(cls, table_id: int) -> List[Optional[str]]:
+        """
+        Returns the web socket ids of the senders that have pending updates in the
+        table.
+        """
+
+        web_socket_ids = _get_redis_client().smembers(
+            cls._get_web_socket_ids_key(table_id)
+        )
+        return [
+            (
+                web_socket_id.decode()
+                if isinstance(web_socket_id, bytes)
+                else web_socket_id
+            )
+            or None
+            for web_socket_id in web_socket_ids
+        ]
@@ -1,5 +1,6 @@
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
 
+from django.conf import settings
 from django.db import transaction
 from django.dispatch import receiver
 
@@ -9,11 +10,15 @@ from baserow.contrib.database.api.rows.serializers import (
     get_row_serializer_class,
     serialize_rows_for_response,
 )
+from baserow.contrib.database.api.tables.serializers import TableSerializer
 from baserow.contrib.database.rows import signals as row_signals
 from baserow.contrib.database.rows.registries import row_metadata_registry
-from baserow.contrib.database.table.models import GeneratedTableModel
+from baserow.contrib.database.table.models import GeneratedTableModel, Table
 from baserow.ws.registries import PageType, page_registry
 
+from .buffer import RowsUpdatedBroadcastBuffer
+from .tasks import flush_rows_updated_broadcast_buffer
+
 if TYPE_CHECKING:
     from baserow.contrib.database.rows.models import RowHistory
 
@@ -41,7 +46,8 @@ def rows_created(
         return
 
     table_page_type = page_registry.get("table")
-    transaction.on_commit(
+    broadcast_on_commit_after_buffered_rows_updated(
+        table.id,
         lambda: table_page_type.broadcast(
             RealtimeRowMessages.rows_created(
                 table_id=table.id,
@@ -55,7 +61,7 @@ def rows_created(
             ),
             getattr(user, "web_socket_id", None),
             table_id=table.id,
-        )
+        ),
     )
 
 
@@ -76,25 +82,112 @@ def rows_updated(
 
     table_page_type = page_registry.get("table")
     before_rows_values = dict(before_return)[serialize_rows_values]
-    transaction.on_commit(
-        lambda: table_page_type.broadcast(
+
+    def send_rows_updated():
+        web_socket_id = getattr(user, "web_socket_id", None)
+        serialized_rows = get_row_serializer_class(
+            model, RowSerializer, is_response=True
+        )(rows, many=True).data
+        metadata = row_metadata_registry.generate_and_merge_metadata_for_rows(
+            user, table, [row.id for row in rows]
+        )
+
+        if RowsUpdatedBroadcastBuffer.is_enabled():
+            is_first = RowsUpdatedBroadcastBuffer.add(
+                table.id,
+                web_socket_id,
+                serialized_rows_before_update=before_rows_values,
+                serialized_rows=serialized_rows,
+                updated_field_ids=list(updated_field_ids),
+                metadata=metadata,
+            )
+            if is_first:
+                flush_rows_updated_broadcast_buffer.apply_async(
+                    (table.id, web_socket_id),
+                    countdown=settings.BASEROW_REALTIME_ROWS_UPDATED_DEBOUNCE_MS / 1000,
+                )
+            return
+
+        table_page_type.broadcast(
             RealtimeRowMessages.rows_updated(
                 table_id=table.id,
                 serialized_rows_before_update=before_rows_values,
-                serialized_rows=get_row_serializer_class(
-                    model, RowSerializer, is_response=True
-                )(rows, many=True).data,
+                serialized_rows=serialized_rows,
                 # Broadcast a list of updated fields so that the listener can take
                 # action even if the value didn't change.
                 updated_field_ids=list(updated_field_ids),
-                metadata=row_metadata_registry.generate_and_merge_metadata_for_rows(
-                    user, table, [row.id for row in rows]
-                ),
+                metadata=metadata,
             ),
-            getattr(user, "web_socket_id", None),
+            web_socket_id,
             table_id=table.id,
         )
-    )
+
+    transaction.on_commit(send_rows_updated)
+
+
+def broadcast_buffered_rows_updated(table_id: int, ignore_web_socket_id: Optional[str]):
+    """
+    Broadcasts the `rows_updated` message containing the updates that have been
+    coalesced in the buffer of the table. If too many rows have been updated, then
+    the clients are asked to refresh the table instead.
+
+    :param table_id: The table where the rows have been updated.
+    :param ignore_web_socket_id: The web socket id of the sender.
+    """
+
+    buffered = RowsUpdatedBroadcastBuffer.pop(table_id, ignore_web_socket_id)
+    if buffered is None:
+        return
+
+    table_page_type = page_registry.get("table")
+    if (
+        len(buffered["serialized_rows"])
+        > settings.BASEROW_REALTIME_ROWS_UPDATED_REFRESH_THRESHOLD
+    ):
+        table = Table.objects.filter(id=table_id).first()
+        if table is None:
+            return
+        payload = RealtimeRowMessages.table_refresh(table)
+    else:
+        payload = RealtimeRowMessages.rows_updated(table_id=table_id, **buffered)
+
+    table_page_type.broadcast(payload, ignore_web_socket_id, table_id=table_id)
+
+
+def broadcast_all_buffered_rows_updated(table_id: int):
+    """
+    Immediately broadcasts the pending coalesced updates of every sender in the
+    table. This must be called before broadcasting another row message, so that
+    the clients receive the messages in the right order.
+
+    :param table_id: The table where the rows have been updated.
+    """
+
+    if not RowsUpdatedBroadcastBuffer.is_enabled():
+        return
+
+    for web_socket_id in RowsUpdatedBroadcastBuffer.get_web_socket_ids(table_id):
+        broadcast_buffered_rows_updated(table_id, web_socket_id)
+
+
+def broadcast_on_commit_after_buffered_rows_updated(
+    table_id: int, broadcast: Callable[[], None]
+):
+    """
+    Calls the provided broadcast function when the transaction commits, right after
+    the pending coalesced updates of the table have been broadcast. Every row
+    message of the table page must be sent this way, so that the clients receive
+    it after the updates that happened before it.
+
+    :param table_id: The table the message is related to.
+    :param broadcast: The function broadcasting the message.
+    """
+
+    def broadcast_after_buffered_rows_updated():
+        broadcast_all_buffered_rows_updated(table_id)
+        broadcast()
+
+    transaction.on_commit(broadcast_after_buffered_rows_updated)
 
 
 @receiver(row_signals.rows_ai_values_generation_error)
@@ -102,7 +195,8 @@ def rows_ai_values_generation_error(
     sender, user, rows, field, table, error_message, **kwargs
 ):
     table_page_type = page_registry.get("table")
-    transaction.on_commit(
+    broadcast_on_commit_after_buffered_rows_updated(
+        table.id,
         lambda: table_page_type.broadcast(
             {
                 "type": "rows_ai_values_generation_error",
@@ -113,7 +207,7 @@ def rows_ai_values_generation_error(
             },
             getattr(user, "web_socket_id", None),
             table_id=table.id,
-        )
+        ),
     )
 
 
@@ -132,7 +226,8 @@ def rows_deleted(
         return
 
     table_page_type = page_registry.get("table")
-    transaction.on_commit(
+    broadcast_on_commit_after_buffered_rows_updated(
+        table.id,
         lambda: table_page_type.broadcast(
             RealtimeRowMessages.rows_deleted(
                 table_id=table.id,
@@ -140,18 +235,19 @@ def rows_deleted(
             ),
             getattr(user, "web_socket_id", None),
             table_id=table.id,
-        )
+        ),
     )
 
 
 @receiver(row_signals.row_orders_recalculated)
 def row_orders_recalculated(sender, table, **kwargs):
     table_page_type = page_registry.get("table")
-    transaction.on_commit(
+    broadcast_on_commit_after_buffered_rows_updated(
+        table.id,
         lambda: table_page_type.broadcast(
             RealtimeRowMessages.row_orders_recalculated(table_id=table.id),
             table_id=table.id,
-        )
+        ),
     )
 
 
@@ -240,6 +336,15 @@ class RealtimeRowMessages:
             "updated_field_ids": updated_field_ids,
         }
 
+    @staticmethod
+    def table_refresh(table: Table) -> Dict[str, Any]:
+        return {
+            "type": "table_updated",
+            "table_id": table.id,
+            "table": TableSerializer(table).data,
+            "force_table_refresh": True,
+        }
+
     @staticmethod
     def row_orders_recalculated(table_id: int) -> Dict[str, Any]:
         return {
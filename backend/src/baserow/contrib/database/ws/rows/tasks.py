@@ -0,0 +1,17 @@
+from typing import Optional
+
+from baserow.config.celery import app
+
+
+@app.task(bind=True)
+def flush_rows_updated_broadcast_buffer(
+    self, table_id: int, ignore_web_socket_id: Optional[str]
+):
+    """
+    Broadcasts the `rows_updated` messages that have been coalesced during the
+    debounce window.
+    """
+
+    from .signals import broadcast_buffered_rows_updated
+
+    broadcast_buffered_rows_updated(table_id, ignore_web_socket_id)
@@ -1,7 +1,14 @@
+from django.db.models.signals import post_save
 from django.dispatch import receiver
 
 from baserow.contrib.database.table.signals import table_schema_changed
+from baserow.contrib.integrations.local_baserow.models import (
+    LocalBaserowRowsCreated,
+    LocalBaserowRowsDeleted,
+    LocalBaserowRowsUpdated,
+)
 from baserow.core.cache import global_cache, local_cache
+from baserow.core.services.registries import service_type_registry
 
 
 @receiver(table_schema_changed)
@@ -9,3 +16,13 @@ def invalidate_table_cache(sender, table_id, **kwargs):
     # Invalidate local cache when the table schema is updated
     global_cache.invalidate(invalidate_key=f"table_{table_id}__service_invalidate_key")
     local_cache.delete(f"integration_service_{table_id}_table_model")
+
+
+@receiver(post_save, sender=LocalBaserowRowsCreated)
+@receiver(post_save, sender=LocalBaserowRowsUpdated)
+@receiver(post_save, sender=LocalBaserowRowsDeleted)
+def invalidate_listened_table_ids(sender, instance, **kwargs):
+    # A trigger service could now listen to another table. Deleted services don't
+    # need to invalidate the cache because listening to a table without trigger
+    # only results in an unnecessary query.
+    service_type_registry.get_by_model(sender).invalidate_listened_table_ids()
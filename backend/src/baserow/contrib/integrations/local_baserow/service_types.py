@@ -7,6 +7,7 @@ from typing import (
     Generic,
     List,
     Optional,
+    Set,
     Tuple,
     Type,
     TypeVar,
@@ -28,6 +29,7 @@ from rest_framework.exceptions import ValidationError as DRFValidationError
 from baserow.contrib.database.api.fields.serializers import FieldSerializer
 from baserow.contrib.database.api.rows.serializers import (
     RowSerializer,
+    get_response_row_serializer_class,
     get_row_serializer_class,
 )
 from baserow.contrib.database.api.utils import extract_field_ids_from_list
@@ -2302,6 +2304,11 @@ class LocalBaserowSignalTriggerTypeMixin(Generic[T]):
     # the `type` is set to `array` instead of `object`.
     returns_list = True
 
+    # The ids of the tables having a trigger service of this type are cached, so that
+    # the events of the other tables can be ignored without executing any query.
+    # The cache is invalidated every time a service of this type is saved.
+    listened_table_ids_cache_ttl = 60 * 60
+
     def start_listening(self, on_event: Callable):
         self.on_event = on_event
         self.signal.connect(self.handler)
@@ -2309,17 +2316,51 @@ class LocalBaserowSignalTriggerTypeMixin(Generic[T]):
     def stop_listening(self):
         self.signal.disconnect(self.handler)
 
-    def handle_signal(self, sender, user, rows, table, model, **kwargs):
-        serializer = get_row_serializer_class(
-            model,
-            RowSerializer,
-            is_response=True,
+    def get_listened_table_ids_cache_key(self) -> str:
+        return f"{self.type}__listened_table_ids"
+
+    def get_listened_table_ids(self) -> Set[int]:
+        """
+        Returns the ids of the tables having at least one trigger service of this
+        type.
+        """
+
+        return global_cache.get(
+            self.get_listened_table_ids_cache_key(),
+            default=lambda: set(
+                self.model_class.objects.filter(table__isnull=False)
+                .values_list("table_id", flat=True)
+                .distinct()
+            ),
+            timeout=self.listened_table_ids_cache_ttl,
         )
-        serialized_rows = serializer(rows, many=True).data
+
+    def invalidate_listened_table_ids(self):
+        """
+        Invalidates the cached listened table ids. This is done right away and again
+        when the transaction commits, because another transaction could have cached
+        the previous table ids in the meantime.
+        """
+
+        def invalidate():
+            global_cache.invalidate(self.get_listened_table_ids_cache_key())
+
+        invalidate()
+        transaction.on_commit(invalidate)
+
+    def handle_signal(self, sender, user, rows, table, model, **kwargs):
+        if table.id not in self.get_listened_table_ids():
+            return
+
+        def serialize_rows():
+            # Only called if a workflow must actually run, the serialized rows are
+            # then shared by all the workflows triggered by this event.
+            serializer = get_response_row_serializer_class(model)
+            return serializer(rows, many=True).data
 
         self.process_event(
             self.model_class.objects.filter(table=table),
-            serialized_rows,
+            serialize_rows,
             user=user,
         )
 
@@ -1,6 +1,13 @@
-from baserow.contrib.integrations.local_baserow.receivers import invalidate_table_cache
+from baserow.contrib.integrations.local_baserow.receivers import (
+    invalidate_listened_table_ids,
+    invalidate_table_cache,
+)
 from baserow.contrib.integrations.local_baserow.signals import (
     handle_local_baserow_field_updated_changes,
 )
 
-__all__ = ["handle_local_baserow_field_updated_changes", "invalidate_table_cache"]
+__all__ = [
+    "handle_local_baserow_field_updated_changes",
+    "invalidate_listened_table_ids",
+    "invalidate_table_cache",
+]
@@ -0,0 +1,261 @@
+import json
+from typing import Dict, Iterable, List
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import IntegrityError, models, transaction
+
+from django_redis import get_redis_connection
+from loguru import logger
+from redis.exceptions import LockNotOwnedError, RedisError
+
+from baserow.core.registry import (
+    Instance,
+    ModelInstanceMixin,
+    ModelRegistryMixin,
+    Registry,
+)
+
+KEY_PREFIX = "buffered_writes"
+
+
+def _get_redis_client():
+    return get_redis_connection("default")
+
+
+class BufferedWriteType(ModelInstanceMixin, Instance):
+    """
+    Writes log like entries, for example the row history or the audit log, in a
+    buffer instead of inserting them in the request transaction. When the
+    `BASEROW_BUFFERED_WRITES_ENABLED` setting is enabled, the entries are
+    appended to a Redis list when the transaction commits and are inserted in
+    large batches by the `flush_buffered_writes` periodic task. An entry is only
+    removed from the buffer after it has been inserted, so that it's written at
+    least once, even if the worker crashes.
+    """
+
+    batch_size = 1000
+    """The maximum number of entries inserted in a single query."""
+
+    max_batches_per_flush = 100
+    """
+    The maximum number of batches inserted by a single flush, so that a flush ends
+    even if entries keep being buffered. The remaining ones are inserted by the next
+    flush.
+    """
+
+    @classmethod
+    def is_enabled(cls) -> bool:
+        return settings.BASEROW_BUFFERED_WRITES_ENABLED
+
+    @property
+    def buffer_key(self) -> str:
+        return f"{KEY_PREFIX}:{self.type}"
+
+    @property
+    def dead_letter_key(self) -> str:
+        """The list where the buffered entries that can't be deserialized are moved."""
+
+        return f"{KEY_PREFIX}:{self.type}:dead_letter"
+
+    def after_insert(self, instances: List[models.Model]):
+        """
+        Hook called in the transaction inserting the entries. Can for example be
+        used to send signals that need the ids of the entries.
+
+        :param instances: The inserted instances.
+        """
+
+    def write(self, instances: List[models.Model]):
+        """
+        Writes the provided unsaved instances. They are inserted right away if
+        buffered writes are disabled and appended to the buffer when the current
+        transaction commits otherwise.
+
+        :param instances: The unsaved instances to write.
+        """
+
+        if not instances:
+            return
+
+        if not self.is_enabled():
+            self.insert(instances)
+            return
+
+        serialized_instances = [self.serialize(instance) for instance in instances]
+
+        def append_to_buffer():
+            try:
+                _get_redis_client().rpush(self.buffer_key, *serialized_instances)
+            except RedisError:
+                logger.exception(
+                    f"Could not buffer {self.type} entries, inserting them instead."
+                )
+                with transaction.atomic():
+                    self.insert(
+                        [self.deserialize(data) for data in serialized_instances]
+                    )
+
+        transaction.on_commit(append_to_buffer)
+
+    def insert(self, instances: List[models.Model]) -> List[models.Model]:
+        """
+        Inserts the instances in the database in batches.
+
+        :param instances: The unsaved instances to insert.
+        :return: The inserted instances.
+        """
+
+        instances = self.model_class.objects.bulk_create(
+            instances, batch_size=self.batch_size
+        )
+        self.after_insert(instances)
+        return instances
+
+    def _get_fields(self) -> Iterable[models.Field]:
+        return [
+            field
+            for field in self.model_class._meta.concrete_fields
+            if not field.primary_key
+        ]
+
+    def serialize(self, instance: models.Model) -> str:
+        """
+        Serializes an unsaved instance to a JSON string that can be stored in the
+        buffer. The JSON fields are encoded with their own encoder, so that their
+        value is stored the same way as when the instance is saved directly.
+
+        :param instance: The instance to serialize.
+        :return: The serialized instance.
+        """
+
+        data = {}
+        for field in self._get_fields():
+            value = field.value_from_object(instance)
+            if isinstance(field, models.JSONField):
+                value = json.dumps(value, cls=field.encoder)
+            data[field.attname] = value
+        return json.dumps(data, default=str)
+
+    def deserialize(self, serialized_instance: str) -> models.Model:
+        """
+        Creates an unsaved instance from a serialized one.
+
+        :param serialized_instance: The instance serialized with `serialize`.
+        :return: The unsaved instance.
+        """
+
+        data = json.loads(serialized_instance)
+        values = {}
+        for field in self._get_fields():
+            if field.attname not in data:
+                continue
+            value = data[field.attname]
+            if isinstance(field, models.JSONField):
+                value = json.loads(value, cls=field.decoder)
+            elif value is not None:
+                value = field.to_python(value)
+            values[field.attname] = value
+        return self.model_class(**values)
+
+    def flush(self) -> int:
+        """
+        Inserts the buffered entries in batches. Only one flush can run at the same
+        time per type. The entries of a batch are removed from the buffer after
+        they've been inserted, and the lock is renewed before every batch so that
+        it can't expire and let another flush insert the same entries.
+
+        :return: The number of inserted entries.
+        """
+
+        redis_client = _get_redis_client()
+        lock = cache.lock(f"{self.buffer_key}:lock", timeout=60 * 5)
+        if not lock.acquire(blocking=False):
+            return 0
+
+        inserted = 0
+        try:
+            for _ in range(self.max_batches_per_flush):
+                lock.reacquire()
+                serialized_instances = redis_client.lrange(
+                    self.buffer_key, 0, self.batch_size - 1
+                )
+                if not serialized_instances:
+                    break
+
+                instances = self._deserialize_batch(serialized_instances)
+                if instances:
+                    self._insert_batch(instances)
+                redis_client.ltrim(self.buffer_key, len(serialized_instances), -1)
+                inserted += len(instances)
+        except LockNotOwnedError:
+            logger.warning(f"Lost the lock while flushing the {self.type} buffer.")
+        finally:
+            try:
+                lock.release()
+            except LockNotOwnedError:
+                pass
+
+        return inserted
+
+    def _deserialize_batch(self, serialized_instances: List[str]) -> List[models.Model]:
+        instances, invalid = [], []
+        for serialized_instance in serialized_instances:
+            try:
+                instances.append(self.deserialize(serialized_instance))
+            except Exception:
+                # An entry that can't be deserialized, for example because the model
+                # has changed since it was buffered, would otherwise block the
+                # buffer forever.
+                logger.exception(f"Could not deserialize a buffered {self.type} entry.")
+                invalid.append(serialized_instance)
+
+        if invalid:
+            _get_redis_client().rpush(self.dead_letter_key, *invalid)
+
+        return instances
+
+    def _insert_batch(self, instances: List[models.Model]):
+        try:
+            with transaction.atomic():
+                self.insert(instances)
+        except IntegrityError:
+            # An entry can reference an object that has been deleted in the
+            # meantime. Insert the entries one by one to only skip the invalid ones,
+            # instead of keeping the whole batch in the buffer forever.
+            for instance in instances:
+                try:
+                    with transaction.atomic():
+                        self.insert([instance])
+                except IntegrityError:
+                    logger.warning(f"Skipping invalid buffered {self.type} entry.")
+
+    def get_buffer_length(self) -> int:
+        return _get_redis_client().llen(self.buffer_key)
+
+
+class BufferedWriteTypeRegistry(
+    ModelRegistryMixin[models.Model, BufferedWriteType],
+    Registry[BufferedWriteType],
+):
+    """
+    Contains the types of the models whose instances can be written through the
+    buffer.
+    """
+
+    name = "buffered_write"
+
+    def flush_all(self) -> Dict[str, int]:
+        """
+        Flushes the buffer of every registered type.
+
+        :return: The number of inserted entries per type.
+        """
+
+        return {
+            buffered_write_type.type: buffered_write_type.flush()
+            for buffered_write_type in self.get_all()
+        }
+
+
+buffered_write_type_registry: BufferedWriteTypeRegistry = BufferedWriteTypeRegistry()
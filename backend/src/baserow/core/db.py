@@ -1,8 +1,10 @@
 import contextlib
+import io
+import json
 import random
 import time
 from collections import defaultdict
-from decimal import Decimal
+from decimal import ROUND_DOWN, Decimal, localcontext
 from functools import cache, wraps
 from math import ceil
 from typing import (
@@ -11,6 +13,7 @@ from typing import (
     Dict,
     Generic,
     Iterable,
+    Iterator,
     List,
     Optional,
     Set,
@@ -21,7 +24,21 @@ from typing import (
 from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
 from django.db import DEFAULT_DB_ALIAS, OperationalError, connection, transaction
-from django.db.models import ForeignKey, ManyToManyField, Max, Model, Prefetch, QuerySet
+from django.db.models import (
+    BooleanField,
+    Expression,
+    F,
+    ForeignKey,
+    Func,
+    ManyToManyField,
+    Max,
+    Model,
+    Prefetch,
+    Q,
+    QuerySet,
+    Value,
+)
+from django.db.models.expressions import OrderBy
 from django.db.models.functions import Collate
 from django.db.models.query import ModelIterable
 from django.db.models.sql.query import LOOKUP_SEP
@@ -30,7 +47,7 @@ from django.db.transaction import Atomic, get_connection
 from loguru import logger
 
 from baserow.core.exceptions import DeadlockException
-from baserow.core.psycopg import is_deadlock_error, sql
+from baserow.core.psycopg import is_deadlock_error, is_psycopg3, sql
 
 from .utils import find_intermediate_order
 
@@ -332,6 +349,99 @@ def get_unique_orders_before_item(
     return new_orders
 
 
+def spread_orders_before_item(
+    before: Model,
+    queryset: QuerySet,
+    amount: int = 1,
+    field: str = "order",
+    min_gap: Decimal = Decimal("0.001"),
+) -> List[Decimal]:
+    """
+    Makes room for `amount` orders before the provided `before` item when there is
+    no intermediate order left between it and its previous item. Instead of
+    recalculating the orders of all the items, only the items of a window around
+    `before` get new orders, evenly spread between the orders of the two items
+    surrounding the window. The window is doubled until the orders can be at least
+    `min_gap` apart, so that only a few items are updated unless a large part of
+    the items have been packed together.
+
+    id     old_order                 new_order
+    1      1.00000000000000000000    1.00000000000000000000
+    2      1.99999999999999999999    1.50000000000000000000
+    -                                2.00000000000000000000  <- returned
+    3      2.00000000000000000000    2.50000000000000000000  <- before
+    4      3.00000000000000000000    3.00000000000000000000
+
+    :param before: The model instance where the before orders must be
+        calculated for. Its order is updated in place.
+    :param queryset: The base queryset containing the items to reorder.
+    :param amount: The number of orders that must be requested.
+    :param field: The order field name.
+    :param min_gap: The minimum gap between two spread orders.
+    :return: A list of decimals containing safe to use orders before `before`.
+    """
+
+    before_order = getattr(before, field)
+    before_filter = Q(**{f"{field}__lt": before_order}) | Q(
+        **{field: before_order, "id__lt": before.id}
+    )
+    window_size = 1
+
+    # The default precision isn't enough for orders with 20 decimal places.
+    with localcontext() as context:
+        context.prec = 60
+
+        while True:
+            lower_items = list(
+                queryset.filter(before_filter).order_by(f"-{field}", "-id")[
+                    : window_size + 1
+                ]
+            )
+            upper_items = list(
+                queryset.exclude(before_filter).order_by(field, "id")[: window_size + 1]
+            )
+
+            lower_order = Decimal("0")
+            if len(lower_items) > window_size:
+                lower_order = getattr(lower_items.pop(), field)
+            lower_items.reverse()
+
+            slots = len(lower_items) + amount + len(upper_items)
+            if len(upper_items) > window_size:
+                upper_order = getattr(upper_items.pop(), field)
+                slots -= 1
+            else:
+                # There are no items after the window, so the orders can be spread
+                # until beyond the last one.
+                last_order = max(
+                    [lower_order, before_order]
+                    + [getattr(item, field) for item in upper_items]
+                )
+                upper_order = ceil(last_order) + slots + 1
+
+            gap = ((upper_order - lower_order) / (slots + 1)).quantize(
+                Decimal("0.00000000000000000001"), rounding=ROUND_DOWN
+            )
+            if gap >= min_gap:
+                break
+            window_size *= 2
+
+        new_orders = [lower_order + gap * (index + 1) for index in range(slots)]
+
+    items_to_update = []
+    for item, new_order in zip(lower_items, new_orders):
+        setattr(item, field, new_order)
+        items_to_update.append(item)
+    for item, new_order in zip(upper_items, new_orders[len(lower_items) + amount :]):
+        setattr(item, field, new_order)
+        items_to_update.append(item)
+        if item.id == before.id:
+            setattr(before, field, new_order)
+    queryset.bulk_update(items_to_update, [field])
+
+    return new_orders[len(lower_items) : len(lower_items) + amount]
+
+
 def get_highest_order_of_queryset(
     queryset: QuerySet,
     amount: int = 1,
@@ -418,6 +528,267 @@ def recalculate_full_orders(
         cursor.execute(sql_query)
 
 
+def get_estimated_count(queryset: QuerySet) -> int:
+    """
+    Returns the number of rows the query planner expects the queryset to return.
+    In contrast to `queryset.count()`, the rows are not actually counted, which
+    makes it constant time, but the result can be off, especially for tables that
+    haven't been analyzed yet.
+
+    :param queryset: The queryset to estimate the number of rows of.
+    :return: The estimated number of rows, at least 1.
+    """
+
+    plan = json.loads(queryset.explain(format="json"))
+    return max(int(plan[0]["Plan"]["Plan Rows"]), 1)
+
+
+class RowValueGreaterThan(Func):
+    """
+    Compares two row values with each other, e.g. `(col_a, col_b) > (1, 2)`. Postgres
+    can answer such a comparison with a single index range scan, in contrast to the
+    equivalent expanded `a > 1 OR (a = 1 AND b > 2)` condition.
+    """
+
+    arg_joiner = ", "
+    output_field = BooleanField()
+    conditional = True
+
+    def __init__(self, lhs: List[Expression], rhs: List[Expression], less=False):
+        self.lhs_count = len(lhs)
+        self.operator = "<" if less else ">"
+        super().__init__(*lhs, *rhs)
+
+    def as_sql(self, compiler, connection, **extra_context):
+        sql_parts, params = [], []
+        for expression in self.get_source_expressions():
+            arg_sql, arg_params = compiler.compile(expression)
+            sql_parts.append(arg_sql)
+            params.extend(arg_params)
+        lhs = self.arg_joiner.join(sql_parts[: self.lhs_count])
+        rhs = self.arg_joiner.join(sql_parts[self.lhs_count :])
+        return f"({lhs}) {self.operator} ({rhs})", params
+
+
+class KeysetQuerysetPaginator:
+    """
+    Pages through a queryset by resuming from the sort key of the last row of the
+    previous page instead of skipping rows with an OFFSET. Every page therefore costs
+    the same, no matter how deep into the queryset it is, and the database is able to
+    use an index matching the ordering of the queryset.
+
+    The ordering of the queryset must end with a unique column (e.g. `id`), which is
+    appended automatically if missing.
+    """
+
+    @staticmethod
+    def get_keyset_order(queryset: QuerySet) -> List[OrderBy]:
+        """
+        Returns the ordering of the queryset as a list of `OrderBy` expressions with
+        explicit nulls placement. The primary key is appended if the ordering does
+        not end with it, so that the resulting sort key is always unique.
+        """
+
+        ordering = list(queryset.query.order_by or queryset.model._meta.ordering or [])
+        order_bys = []
+        for order in ordering:
+            if isinstance(order, str):
+                if order == "?":
+                    raise ValueError("Random ordering can't be paginated by keyset.")
+                descending = order.startswith("-")
+                order = F(order.lstrip("-")).desc() if descending else F(order).asc()
+            elif not isinstance(order, OrderBy):
+                order = order.asc()
+
+            order = order.copy()
+            # Postgres sorts NULL values as if they are larger than any other value
+            # if nothing else has been specified.
+            if not order.nulls_first and not order.nulls_last:
+                order.nulls_first = order.descending
+                order.nulls_last = not order.descending
+            order_bys.append(order)
+
+        last = order_bys[-1].expression if order_bys else None
+        if not isinstance(last, F) or last.name not in ("id", "pk"):
+            order_bys.append(F("id").asc(nulls_last=True))
+
+        return order_bys
+
+    def _get_after_condition(self, queryset, aliases, order_bys, values) -> Q:
+        """
+        Builds the condition that selects all the rows that come after the provided
+        sort key values. The trailing non-nullable columns sharing the same
+        direction are compared as a single row value, the leading ones are expanded
+        into the equivalent `a > x OR (a = x AND b > y)` form because they can
+        have mixed directions and NULL placements.
+        """
+
+        model_fields = {
+            f.name: f for f in queryset.model._meta.concrete_fields if not f.null
+        }
+        model_fields["pk"] = queryset.model._meta.pk
+
+        row_value_start = len(order_bys)
+        for index in range(len(order_bys) - 1, -1, -1):
+            order = order_bys[index]
+            if (
+                not isinstance(order.expression, F)
+                or order.expression.name not in model_fields
+                or order.descending != order_bys[-1].descending
+                or values[index] is None
+            ):
+                break
+            row_value_start = index
+
+        # Matches nothing until the conditions of the individual columns are added.
+        condition = Q(pk__in=[])
+        equal = Q()
+        for alias, order, value in zip(
+            aliases[:row_value_start],
+            order_bys[:row_value_start],
+            values[:row_value_start],
+        ):
+            if value is None:
+                after = Q(**{f"{alias}__isnull": False}) if order.nulls_first else None
+                equal_to_value = Q(**{f"{alias}__isnull": True})
+            else:
+                lookup = "lt" if order.descending else "gt"
+                after = Q(**{f"{alias}__{lookup}": value})
+                if order.nulls_last:
+                    after |= Q(**{f"{alias}__isnull": True})
+                equal_to_value = Q(**{alias: value})
+
+            if after is not None:
+                condition |= equal & after
+            equal &= equal_to_value
+
+        if row_value_start < len(order_bys):
+            fields = [
+                model_fields[order.expression.name]
+                for order in order_bys[row_value_start:]
+            ]
+            condition |= equal & Q(
+                RowValueGreaterThan(
+                    [F(order.expression.name) for order in order_bys[row_value_start:]],
+                    [
+                        Value(field.to_python(value), output_field=field)
+                        for field, value in zip(fields, values[row_value_start:])
+                    ],
+                    less=order_bys[-1].descending,
+                )
+            )
+
+        return condition
+
+    def _prepare_queryset(
+        self, queryset: QuerySet
+    ) -> Tuple[QuerySet, List[str], List[OrderBy]]:
+        """
+        Annotates the values of the order by expressions to the queryset, so that
+        they can be read from the last row of a page.
+
+        :raises ValueError: If the queryset can't be paginated by keyset.
+        """
+
+        order_bys = self.get_keyset_order(queryset)
+        aliases = [f"keyset_{index}" for index in range(len(order_bys))]
+        queryset = queryset.annotate(
+            **{alias: order.expression for alias, order in zip(aliases, order_bys)}
+        )
+        return queryset, aliases, order_bys
+
+    def _get_page(
+        self,
+        queryset: QuerySet,
+        aliases: List[str],
+        order_bys: List[OrderBy],
+        values: Optional[List[Any]],
+        page_size: int,
+    ) -> Tuple[List[Any], Optional[List[Any]]]:
+        """
+        Fetches the page of rows that comes after the provided sort key values. One
+        extra row is requested to find out whether there is a next page.
+
+        :return: The rows of the page and the sort key values of the last row, or
+            None if there is no next page.
+        """
+
+        if values is not None:
+            queryset = queryset.filter(
+                self._get_after_condition(queryset, aliases, order_bys, values)
+            )
+
+        page = list(queryset.order_by(*order_bys)[: page_size + 1])
+        if len(page) <= page_size:
+            return page, None
+
+        page = page[:page_size]
+        return page, [getattr(page[-1], alias) for alias in aliases]
+
+    def iterate_queryset(
+        self, queryset: QuerySet, chunk_size: int
+    ) -> Iterator[Tuple[List[Any], bool]]:
+        """
+        Iterates over all the rows of the queryset in chunks of `chunk_size` rows
+        without ever using an OFFSET, so that every chunk costs the same, no matter
+        how many rows have already been fetched.
+
+        :param queryset: The queryset to iterate over.
+        :param chunk_size: The maximum number of rows per chunk.
+        :raises ValueError: If the queryset can't be paginated by keyset.
+        :return: A generator yielding the rows of every chunk and whether it's
+            the last one.
+        """
+
+        queryset, aliases, order_bys = self._prepare_queryset(queryset)
+        values = None
+        while True:
+            page, values = self._get_page(
+                queryset, aliases, order_bys, values, chunk_size
+            )
+            yield page, values is None
+            if values is None:
+                break
+
+
+def _get_csv_value(value: Any) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        value = "t" if value else "f"
+    return '"' + str(value).replace('"', '""') + '"'
+
+
+def copy_rows_into_table(
+    table_name: str, column_names: List[str], rows: Iterable[Iterable[Any]]
+):
+    """
+    Inserts the provided rows into the table using `COPY FROM` in the CSV format,
+    which is a lot faster than a multi values `INSERT` for many rows. The values
+    must already be prepared for the database and have a text representation that
+    Postgres can parse. `None` values are inserted as `NULL`.
+
+    :param table_name: The name of the database table to insert the rows into.
+    :param column_names: The columns names, in the same order as the row values.
+    :param rows: An iterable of rows, every row being an iterable of values.
+    """
+
+    query = sql.SQL("COPY {} ({}) FROM STDIN WITH (FORMAT csv)").format(
+        sql.Identifier(table_name),
+        sql.SQL(", ").join(sql.Identifier(name) for name in column_names),
+    )
+    data = "".join(
+        ",".join(_get_csv_value(value) for value in row) + "\n" for row in rows
+    )
+
+    with connection.cursor() as cursor:
+        if is_psycopg3:
+            with cursor.copy(query) as copy:
+                copy.write(data)
+        else:
+            cursor.copy_expert(query.as_string(cursor.cursor), io.StringIO(data))
+
+
 @cache
 def get_collation_name() -> Optional[str]:
     """
@@ -0,0 +1,40 @@
+from django.core.management.base import BaseCommand
+
+from baserow.core.partitioning import time_partitioned_model_type_registry
+
+
+class Command(BaseCommand):
+    help = (
+        "Converts the row history and audit log tables to tables partitioned by "
+        "range of time, so that the old entries are removed by dropping partitions. "
+        "The tables are locked during the conversion."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "types",
+            nargs="*",
+            help="The types of the tables to convert. All tables are converted if "
+            "not provided. Choices: "
+            f"{', '.join(time_partitioned_model_type_registry.get_types())}.",
+        )
+
+    def handle(self, *args, **options):
+        types = options["types"] or time_partitioned_model_type_registry.get_types()
+
+        for type_name in types:
+            time_partitioned_model_type = time_partitioned_model_type_registry.get(
+                type_name
+            )
+            if time_partitioned_model_type.convert_to_partitioned_table():
+                self.stdout.write(
+                    self.style.SUCCESS(
+                        f"The {time_partitioned_model_type.db_table} table is now "
+                        "partitioned."
+                    )
+                )
+            else:
+                self.stdout.write(
+                    f"The {time_partitioned_model_type.db_table} table is already "
+                    "partitioned."
+                )
@@ -0,0 +1,514 @@
+"""
+Log like tables, for example the row history or the audit log, can become huge and
+their retention used to be implemented with large `DELETE` statements, which bloat
+the table and produce a lot of WAL. This module allows to store them as a native
+PostgreSQL table partitioned by range of time, so that the entries older than the
+retention period can be removed by dropping whole partitions.
+
+Converting a table is opt-in because it must lock the table, see the
+`partition_tables` management command. The existing table is attached as the first
+partition without copying the rows, and is dropped once all its entries are older
+than the retention period. Every other method is a no-op if the table isn't
+partitioned, so that the retention keeps working with `DELETE` statements.
+"""
+
+import re
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional
+
+from django.conf import settings
+from django.db import OperationalError, connection, models, transaction
+from django.utils.dateparse import parse_datetime
+
+from loguru import logger
+
+from baserow.core.psycopg import is_lock_not_available_error, sql
+from baserow.core.registry import (
+    Instance,
+    ModelInstanceMixin,
+    ModelRegistryMixin,
+    Registry,
+)
+
+PARTITION_INTERVAL_MONTH = "month"
+PARTITION_INTERVAL_DAY = "day"
+
+PARTITION_BOUND_REGEX = re.compile(r"FROM \((.+)\) TO \((.+)\)")
+
+# An insert fails if there is no partition for its time, so daily partitions are
+# always created at least two weeks ahead, which leaves time to notice and restart
+# the periodic task creating them.
+MIN_DAY_PARTITIONS_AHEAD = 14
+
+# Creating or detaching a partition locks the parent table. The inserts would queue
+# behind the lock while it waits for long running transactions, so it gives up
+# quickly instead and is retried by the next run of the periodic task.
+PARTITION_LOCK_TIMEOUT = "5s"
+
+
+def get_partition_start(value: datetime, interval: str) -> datetime:
+    """
+    Returns the start of the partition containing the provided datetime.
+    """
+
+    value = value.astimezone(timezone.utc).replace(
+        hour=0, minute=0, second=0, microsecond=0
+    )
+    if interval == PARTITION_INTERVAL_MONTH:
+        value = value.replace(day=1)
+    return value
+
+
+def get_next_partition_start(start: datetime, interval: str) -> datetime:
+    """
+    Returns the start of the partition following the one starting at the provided
+    datetime.
+    """
+
+    if interval == PARTITION_INTERVAL_MONTH:
+        return (start.replace(day=28) + timedelta(days=4)).replace(day=1)
+    return start + timedelta(days=1)
+
+
+def _check_pending_constraints(cursor):
+    # A table can't be altered while it has pending deferred foreign key checks in
+    # the same transaction.
+    cursor.execute("SET CONSTRAINTS ALL IMMEDIATE")
+
+
+def _set_partition_lock_timeout(cursor):
+    cursor.execute(
+        sql.SQL("SET LOCAL lock_timeout = {}").format(
+            sql.Literal(PARTITION_LOCK_TIMEOUT)
+        )
+    )
+
+
+def _parse_partition_bound(value: str) -> Optional[datetime]:
+    if value == "MINVALUE":
+        return None
+    return parse_datetime(value.strip("'"))
+
+
+@dataclass
+class TimePartition:
+    name: str
+    start: Optional[datetime]
+    """The start of the range of the partition or None if it's unbounded."""
+    end: datetime
+    """The exclusive end of the range of the partition."""
+
+
+class TimePartitionedModelType(ModelInstanceMixin, Instance):
+    """
+    Describes a model whose table can be partitioned by range of the datetime field
+    named `partition_field_name`.
+    """
+
+    partition_field_name: str
+
+    @property
+    def db_table(self) -> str:
+        return self.model_class._meta.db_table
+
+    @property
+    def partition_column(self) -> str:
+        return self.model_class._meta.get_field(self.partition_field_name).column
+
+    @property
+    def interval(self) -> str:
+        return settings.BASEROW_TIME_PARTITION_INTERVAL
+
+    @property
+    def partitions_ahead(self) -> int:
+        partitions_ahead = settings.BASEROW_TIME_PARTITIONS_AHEAD
+        if self.interval == PARTITION_INTERVAL_DAY:
+            partitions_ahead = max(partitions_ahead, MIN_DAY_PARTITIONS_AHEAD)
+        return partitions_ahead
+
+    def is_partitioned(self) -> bool:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT EXISTS(SELECT 1 FROM pg_partitioned_table "
+                "WHERE partrelid = to_regclass(%s))",
+                [self.db_table],
+            )
+            return cursor.fetchone()[0]
+
+    def get_partitions(self) -> List[TimePartition]:
+        """
+        Returns the partitions of the table ordered by their range.
+        """
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                """
+                SELECT c.relname, pg_get_expr(c.relpartbound, c.oid)
+                FROM pg_inherits i
+                INNER JOIN pg_class c ON c.oid = i.inhrelid
+                WHERE i.inhparent = to_regclass(%s)
+                """,
+                [self.db_table],
+            )
+            rows = cursor.fetchall()
+
+        partitions = []
+        for name, bound in rows:
+            start, end = PARTITION_BOUND_REGEX.search(bound).groups()
+            partitions.append(
+                TimePartition(
+                    name=name,
+                    start=_parse_partition_bound(start),
+                    end=_parse_partition_bound(end),
+                )
+            )
+        return sorted(partitions, key=lambda partition: partition.end)
+
+    def get_partition_name(self, start: datetime) -> str:
+        return f"{self.db_table}_p{start:%Y%m%d}"
+
+    def create_partitions(self, until: Optional[datetime] = None) -> List[str]:
+        """
+        Creates the partitions needed to store the entries up to the provided
+        datetime, so that an insert never fails because there is no partition for
+        its time. Nothing is locked if the partitions already exist. Otherwise, the
+        workers creating partitions are serialized with an advisory lock, which
+        doesn't block the inserts, and the creation is skipped until the next run if
+        the table can't be locked quickly.
+
+        :param until: The partitions are created until this datetime. Defaults to
+            `partitions_ahead` partitions after the current one.
+        :return: The names of the created partitions.
+        """
+
+        if not self.is_partitioned():
+            return []
+
+        now = datetime.now(tz=timezone.utc)
+        current_partition_end = get_next_partition_start(
+            get_partition_start(now, self.interval), self.interval
+        )
+        if until is None:
+            until = now
+            for _ in range(self.partitions_ahead):
+                until = get_next_partition_start(
+                    get_partition_start(until, self.interval), self.interval
+                )
+
+        partitions = self.get_partitions()
+        if partitions and partitions[-1].end > until:
+            return []
+
+        if partitions and partitions[-1].end <= current_partition_end:
+            logger.error(
+                f"The last partition of {self.db_table} ends at "
+                f"{partitions[-1].end.isoformat()}, inserts will fail after that. "
+                f"Make sure that the `create_time_partitions` periodic task runs."
+            )
+
+        created = []
+        try:
+            with transaction.atomic(), connection.cursor() as cursor:
+                _check_pending_constraints(cursor)
+                # Prevents another worker from creating the same partitions.
+                cursor.execute(
+                    "SELECT pg_advisory_xact_lock(hashtext(%s))", [self.db_table]
+                )
+                _set_partition_lock_timeout(cursor)
+                partitions = self.get_partitions()
+                if partitions:
+                    start = partitions[-1].end
+                else:
+                    start = get_partition_start(now, self.interval)
+
+                while start <= until:
+                    end = get_next_partition_start(start, self.interval)
+                    name = self.get_partition_name(start)
+                    cursor.execute(
+                        sql.SQL(
+                            "CREATE TABLE {partition} PARTITION OF {table} "
+                            "FOR VALUES FROM ({start}) TO ({end})"
+                        ).format(
+                            partition=sql.Identifier(name),
+                            table=sql.Identifier(self.db_table),
+                            start=sql.Literal(start.isoformat()),
+                            end=sql.Literal(end.isoformat()),
+                        )
+                    )
+                    created.append(name)
+                    start = end
+        except OperationalError as exc:
+            if not is_lock_not_available_error(exc):
+                raise
+            logger.warning(
+                f"Could not lock {self.db_table} to create its partitions, they "
+                f"will be created by the next run."
+            )
+            return []
+
+        return created
+
+    def drop_partitions_older_than(self, cutoff: datetime) -> List[str]:
+        """
+        Detaches and drops the partitions only containing entries older than the
+        cutoff. The entries of the partition containing the cutoff must still be
+        deleted with a `DELETE` statement, which only scans that partition.
+
+        Outside of a transaction, the partitions are detached concurrently, which
+        doesn't block the inserts. Otherwise, or before PostgreSQL 14, the parent
+        table is exclusively locked, so the partitions that can't be detached
+        quickly are dropped by the next run instead.
+
+        :param cutoff: The date and time before which the entries can be removed.
+        :return: The names of the dropped partitions.
+        """
+
+        if not self.is_partitioned():
+            return []
+
+        concurrently = (
+            connection.pg_version >= 140000 and not connection.in_atomic_block
+        )
+
+        dropped = []
+        for partition in self.get_partitions():
+            if partition.end > cutoff:
+                break
+
+            try:
+                if concurrently:
+                    self._detach_partition_concurrently(partition.name)
+                    with connection.cursor() as cursor:
+                        cursor.execute(
+                            sql.SQL("DROP TABLE {}").format(
+                                sql.Identifier(partition.name)
+                            )
+                        )
+                else:
+                    with transaction.atomic(), connection.cursor() as cursor:
+                        _check_pending_constraints(cursor)
+                        _set_partition_lock_timeout(cursor)
+                        cursor.execute(
+                            sql.SQL(
+                                "ALTER TABLE {table} DETACH PARTITION {partition}"
+                            ).format(
+                                table=sql.Identifier(self.db_table),
+                                partition=sql.Identifier(partition.name),
+                            )
+                        )
+                        cursor.execute(
+                            sql.SQL("DROP TABLE {}").format(
+                                sql.Identifier(partition.name)
+                            )
+                        )
+            except OperationalError as exc:
+                if not is_lock_not_available_error(exc):
+                    raise
+                logger.warning(
+                    f"Could not lock {self.db_table} to detach the partition "
+                    f"{partition.name}, it will be dropped by the next run."
+                )
+                break
+
+            dropped.append(partition.name)
+
+        if dropped:
+            logger.info(f"Dropped the partitions {', '.join(dropped)}.")
+
+        return dropped
+
+    def _detach_partition_concurrently(self, name: str):
+        """
+        Detaches the partition without blocking the queries on the parent table. If
+        a previous concurrent detach has been interrupted, it's finalized instead.
+        Can't be executed in a transaction.
+        """
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT inhdetachpending FROM pg_inherits "
+                "WHERE inhrelid = to_regclass(%s)",
+                [name],
+            )
+            detach_pending = cursor.fetchone()[0]
+            cursor.execute(
+                sql.SQL(
+                    "ALTER TABLE {table} DETACH PARTITION {partition} {mode}"
+                ).format(
+                    table=sql.Identifier(self.db_table),
+                    partition=sql.Identifier(name),
+                    mode=sql.SQL("FINALIZE" if detach_pending else "CONCURRENTLY"),
+                )
+            )
+
+    def convert_to_partitioned_table(self) -> bool:
+        """
+        Converts the existing table to a table partitioned by range of the partition
+        column. The existing table is renamed and attached as the partition
+        containing all the entries until the end of the current partition interval,
+        so that the rows don't have to be copied. The indexes and foreign keys are
+        recreated on the partitioned table with the same names and the existing ones
+        are reused for the old partition. Because a primary key of a partitioned
+        table must contain the partition column, the primary key is (id, column).
+
+        :return: False if the table was already partitioned.
+        """
+
+        table = self.db_table
+        legacy_table = f"{table}_legacy"
+        column = self.partition_column
+        sequence = f"{table}_partitioned_id_seq"
+
+        def legacy_name(name: str) -> str:
+            return f"{name[:55]}_legacy"
+
+        with transaction.atomic(), connection.cursor() as cursor:
+            if self.is_partitioned():
+                return False
+
+            _check_pending_constraints(cursor)
+            cursor.execute(
+                sql.SQL("LOCK TABLE {} IN ACCESS EXCLUSIVE MODE").format(
+                    sql.Identifier(table)
+                )
+            )
+            cursor.execute(
+                """
+                SELECT i.relname, pg_get_indexdef(i.oid)
+                FROM pg_index x
+                INNER JOIN pg_class i ON i.oid = x.indexrelid
+                WHERE x.indrelid = to_regclass(%s) AND NOT x.indisunique
+                """,
+                [table],
+            )
+            indexes = cursor.fetchall()
+            cursor.execute(
+                """
+                SELECT conname, contype, pg_get_constraintdef(oid)
+                FROM pg_constraint
+                WHERE conrelid = to_regclass(%s) AND contype IN ('p', 'f')
+                """,
+                [table],
+            )
+            constraints = cursor.fetchall()
+            cursor.execute(
+                sql.SQL(
+                    "SELECT COALESCE(MAX(id), 0), MAX({column}) FROM {table}"
+                ).format(column=sql.Identifier(column), table=sql.Identifier(table))
+            )
+            max_id, max_value = cursor.fetchone()
+
+            cursor.execute(
+                sql.SQL("ALTER TABLE {} RENAME TO {}").format(
+                    sql.Identifier(table), sql.Identifier(legacy_table)
+                )
+            )
+            for name, _ in indexes:
+                cursor.execute(
+                    sql.SQL("ALTER INDEX {} RENAME TO {}").format(
+                        sql.Identifier(name), sql.Identifier(legacy_name(name))
+                    )
+                )
+            for name, _, _ in constraints:
+                cursor.execute(
+                    sql.SQL("ALTER TABLE {} RENAME CONSTRAINT {} TO {}").format(
+                        sql.Identifier(legacy_table),
+                        sql.Identifier(name),
+                        sql.Identifier(legacy_name(name)),
+                    )
+                )
+            # The old identity or serial sequence would be dropped together with the
+            # old partition, so the partitioned table gets its own sequence.
+            cursor.execute(
+                sql.SQL(
+                    "ALTER TABLE {} ALTER COLUMN id DROP IDENTITY IF EXISTS"
+                ).format(sql.Identifier(legacy_table))
+            )
+            cursor.execute(
+                sql.SQL("ALTER TABLE {} ALTER COLUMN id DROP DEFAULT").format(
+                    sql.Identifier(legacy_table)
+                )
+            )
+
+            cursor.execute(
+                sql.SQL(
+                    "CREATE TABLE {table} (LIKE {legacy_table} INCLUDING DEFAULTS "
+                    "INCLUDING CONSTRAINTS INCLUDING STORAGE) "
+                    "PARTITION BY RANGE ({column})"
+                ).format(
+                    table=sql.Identifier(table),
+                    legacy_table=sql.Identifier(legacy_table),
+                    column=sql.Identifier(column),
+                )
+            )
+            cursor.execute(
+                sql.SQL("CREATE SEQUENCE {sequence} OWNED BY {table}.id").format(
+                    sequence=sql.Identifier(sequence), table=sql.Identifier(table)
+                )
+            )
+            cursor.execute("SELECT setval(%s, %s, false)", [sequence, max_id + 1])
+            cursor.execute(
+                sql.SQL(
+                    "ALTER TABLE {table} ALTER COLUMN id SET DEFAULT nextval({sequence})"
+                ).format(table=sql.Identifier(table), sequence=sql.Literal(sequence))
+            )
+            cursor.execute(
+                sql.SQL("ALTER TABLE {table} ADD PRIMARY KEY (id, {column})").format(
+                    table=sql.Identifier(table), column=sql.Identifier(column)
+                )
+            )
+            for _, definition in indexes:
+                cursor.execute(definition)
+            for name, contype, definition in constraints:
+                if contype == "f":
+                    cursor.execute(
+                        sql.SQL("ALTER TABLE {} ADD CONSTRAINT {} {}").format(
+                            sql.Identifier(table),
+                            sql.Identifier(name),
+                            sql.SQL(definition),
+                        )
+                    )
+
+            now = datetime.now(tz=timezone.utc)
+            last_value = max(max_value, now) if max_value else now
+            end = get_next_partition_start(
+                get_partition_start(last_value, self.interval), self.interval
+            )
+            cursor.execute(
+                sql.SQL(
+                    "ALTER TABLE {table} ATTACH PARTITION {legacy_table} "
+                    "FOR VALUES FROM (MINVALUE) TO ({end})"
+                ).format(
+                    table=sql.Identifier(table),
+                    legacy_table=sql.Identifier(legacy_table),
+                    end=sql.Literal(end.isoformat()),
+                )
+            )
+
+        self.create_partitions()
+        return True
+
+
+class TimePartitionedModelTypeRegistry(
+    ModelRegistryMixin[models.Model, TimePartitionedModelType],
+    Registry[TimePartitionedModelType],
+):
+    """
+    Contains the models whose table can be partitioned by range of time.
+    """
+
+    name = "time_partitioned_model"
+
+    def create_partitions(self):
+        """
+        Creates the upcoming partitions of every partitioned table.
+        """
+
+        for time_partitioned_model_type in self.get_all():
+            time_partitioned_model_type.create_partitions()
+
+
+time_partitioned_model_type_registry: TimePartitionedModelTypeRegistry = (
+    TimePartitionedModelTypeRegistry()
+)
@@ -12,3 +12,7 @@ else:
 
 def is_deadlock_error(exc: DatabaseError) -> bool:
     return isinstance(exc.__cause__, errors.DeadlockDetected)
+
+
+def is_lock_not_available_error(exc: DatabaseError) -> bool:
+    return isinstance(exc.__cause__, errors.LockNotAvailable)
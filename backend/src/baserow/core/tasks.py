@@ -1,5 +1,9 @@
+from datetime import timedelta
+
 from django.conf import settings
 
+from celery.signals import worker_shutting_down
+
 from baserow.config.celery import app
 
 from .action.tasks import cleanup_old_actions, setup_periodic_action_tasks
@@ -28,6 +32,47 @@ def sync_templates_task(self):
     CoreHandler().sync_templates(pattern=settings.BASEROW_SYNC_TEMPLATES_PATTERN)
 
 
+@app.task(bind=True)
+def flush_buffered_writes(self):
+    from baserow.core.buffered_writes import buffered_write_type_registry
+
+    buffered_write_type_registry.flush_all()
+
+
+# noinspection PyUnusedLocal
+@app.on_after_finalize.connect
+def setup_periodic_buffered_writes_tasks(sender, **kwargs):
+    if settings.BASEROW_BUFFERED_WRITES_ENABLED:
+        sender.add_periodic_task(
+            timedelta(seconds=settings.BASEROW_BUFFERED_WRITES_FLUSH_INTERVAL_SECONDS),
+            flush_buffered_writes.s(),
+        )
+
+
+@app.task(bind=True, queue="export")
+def create_time_partitions(self):
+    from baserow.core.partitioning import time_partitioned_model_type_registry
+
+    time_partitioned_model_type_registry.create_partitions()
+
+
+# noinspection PyUnusedLocal
+@app.on_after_finalize.connect
+def setup_periodic_time_partitions_tasks(sender, **kwargs):
+    sender.add_periodic_task(timedelta(hours=1), create_time_partitions.s())
+
+
+# noinspection PyUnusedLocal
+@worker_shutting_down.connect
+def flush_buffered_writes_on_shutdown(sender, **kwargs):
+    # Insert the remaining entries, so that they don't wait in the buffer until a
+    # worker is started again.
+    if settings.BASEROW_BUFFERED_WRITES_ENABLED:
+        from baserow.core.buffered_writes import buffered_write_type_registry
+
+        buffered_write_type_registry.flush_all()
+
+
 __all__ = [
     "permanently_delete_marked_trash",
     "mark_old_trash_for_permanent_deletion",
@@ -40,4 +85,8 @@ __all__ = [
     "delete_expired_snapshots",
     "initialize_otel",
     "share_onboarding_details_with_baserow",
+    "flush_buffered_writes",
+    "setup_periodic_buffered_writes_tasks",
+    "create_time_partitions",
+    "setup_periodic_time_partitions_tasks",
 ]
@@ -1,8 +1,5 @@
-import json
-
-from django.core.files.base import ContentFile
-
 from baserow.contrib.database.file_import.models import FileImportJob
+from baserow.contrib.database.file_import.utils import serialize_file_import_data
 
 data = [["test-1"]]
 
@@ -37,7 +34,9 @@ class FileImportFixtures:
         else:
             data = kwargs.pop("data")
 
-        data_file = kwargs.get("data_file", ContentFile(json.dumps(data)))
+        data_file = kwargs.pop("data_file", None) or serialize_file_import_data(
+            data["data"], data.get("configuration")
+        )
 
         job = FileImportJob.objects.create(**kwargs)
 
@@ -114,6 +114,11 @@ def clear_cache():
     _generate_search_table_model.cache_clear()
     _workspace_search_table_exists.cache_clear()
 
+    # Process wide generated model classes cache
+    from baserow.contrib.database.table.cache import generated_model_classes_cache
+
+    generated_model_classes_cache.clear()
+
     # Thread-local cache
     with local_cache.context():
         yield
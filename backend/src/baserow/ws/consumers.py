@@ -6,6 +6,7 @@ from channels.db import database_sync_to_async
 from channels.generic.websocket import AsyncJsonWebsocketConsumer
 
 from baserow.ws.registries import PageType, page_registry
+from baserow.ws.tasks import get_user_channel_group_name
 
 if TYPE_CHECKING:
     from django.contrib.auth.models import AbstractUser
@@ -148,10 +149,18 @@ class CoreConsumer(AsyncJsonWebsocketConsumer):
 
         self.scope["pages"] = SubscribedPages()
         await self.channel_layer.group_add("users", self.channel_name)
+        await self.channel_layer.group_add(
+            get_user_channel_group_name(user.id), self.channel_name
+        )
 
     async def disconnect(self, message):
         await self._remove_all_page_scopes(send_confirmation=False)
         await self.channel_layer.group_discard("users", self.channel_name)
+        user = self.scope.get("user")
+        if user:
+            await self.channel_layer.group_discard(
+                get_user_channel_group_name(user.id), self.channel_name
+            )
 
     async def receive_json(self, content, **parameters):
         """
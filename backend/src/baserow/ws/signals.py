@@ -34,6 +34,7 @@ from .tasks import (
     broadcast_to_permitted_users,
     broadcast_to_users,
     force_disconnect_users,
+    invalidate_permitted_users_cache,
 )
 
 
@@ -378,3 +379,37 @@ def user_job_started(sender, job, user, **kwargs):
         },
         getattr(user, "web_socket_id", None),
     )
+
+
+# Users permitted to receive the messages of an object
+
+
+@receiver(signals.workspace_user_added)
+@receiver(signals.workspace_user_updated)
+@receiver(signals.workspace_user_deleted)
+@receiver(signals.workspace_restored)
+def invalidate_permitted_users_when_workspace_user_changed(
+    sender, workspace_user, **kwargs
+):
+    invalidate_permitted_users_cache([workspace_user.workspace_id])
+
+
+@receiver(signals.permissions_updated)
+def invalidate_permitted_users_when_permissions_updated(sender, workspace, **kwargs):
+    invalidate_permitted_users_cache([workspace.id])
+
+
+@receiver(signals.user_updated)
+@receiver(signals.user_deleted)
+@receiver(signals.user_restored)
+def invalidate_permitted_users_when_user_changed(sender, user, **kwargs):
+    invalidate_permitted_users_cache(
+        WorkspaceUser.objects.filter(user=user).values_list("workspace_id", flat=True)
+    )
+
+
+@receiver(signals.user_permanently_deleted)
+def invalidate_permitted_users_when_user_permanently_deleted(
+    sender, workspace_ids, **kwargs
+):
+    invalidate_permitted_users_cache(workspace_ids)
@@ -1,6 +1,11 @@
-from typing import Any, Dict, Iterable, List, Optional
+import asyncio
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from django.conf import settings
+from django.db import transaction
 
 from baserow.config.celery import app
+from baserow.core.cache import global_cache
 
 
 @app.task(bind=True)
@@ -20,14 +25,19 @@ def force_disconnect_users(
     from channels.layers import get_channel_layer
 
     channel_layer = get_channel_layer()
-    async_to_sync(send_message_to_channel_group)(
+    async_to_sync(send_messages_to_channel_groups)(
         channel_layer,
-        "users",
-        {
-            "type": "force_disconnect_users",
-            "user_ids": user_ids,
-            "ignore_web_socket_ids": ignore_web_socket_ids,
-        },
+        [
+            (
+                get_user_channel_group_name(user_id),
+                {
+                    "type": "force_disconnect_users",
+                    "user_ids": [user_id],
+                    "ignore_web_socket_ids": ignore_web_socket_ids,
+                },
+            )
+            for user_id in set(user_ids)
+        ],
     )
 
 
@@ -47,7 +57,41 @@ async def send_message_to_channel_group(
     :param messsage: JSON to send.
     """
 
-    await channel_layer.group_send(channel_group_name, message)
+    await send_messages_to_channel_groups(
+        channel_layer, [(channel_group_name, message)]
+    )
+
+
+def get_user_channel_group_name(user_id: int) -> str:
+    """
+    Returns the name of the channel group that all the web socket connections of
+    the user join.
+
+    :param user_id: The id of the user.
+    :return: The channel group name of the user.
+    """
+
+    return f"user_{user_id}"
+
+
+async def send_messages_to_channel_groups(
+    channel_layer, messages: Iterable[Tuple[str, dict]]
+):
+    """
+    Sends the messages to their channel groups concurrently and only closes the
+    pools once, so that messages targeting many groups, like one per user, don't
+    have to wait on each other.
+
+    :param channel_layer: The channel layer instance to use.
+    :param messages: Pairs of channel group name and JSON message to send to it.
+    """
+
+    await asyncio.gather(
+        *[
+            channel_layer.group_send(channel_group_name, message)
+            for channel_group_name, message in messages
+        ]
+    )
     if hasattr(channel_layer, "close_pools"):
         # The inmemory channel layer in tests does not have this function.
         await channel_layer.close_pools()
@@ -79,16 +123,38 @@ def broadcast_to_users(
     from channels.layers import get_channel_layer
 
     channel_layer = get_channel_layer()
-    async_to_sync(send_message_to_channel_group)(
+
+    if send_to_all_users:
+        async_to_sync(send_message_to_channel_group)(
+            channel_layer,
+            "users",
+            {
+                "type": "broadcast_to_users",
+                "user_ids": [],
+                "payload": payload,
+                "ignore_web_socket_id": ignore_web_socket_id,
+                "send_to_all_users": True,
+            },
+        )
+        return
+
+    # Only the connections of the users receive the message, instead of all the
+    # connections having to check whether it's meant for them.
+    async_to_sync(send_messages_to_channel_groups)(
         channel_layer,
-        "users",
-        {
-            "type": "broadcast_to_users",
-            "user_ids": user_ids,
-            "payload": payload,
-            "ignore_web_socket_id": ignore_web_socket_id,
-            "send_to_all_users": send_to_all_users,
-        },
+        [
+            (
+                get_user_channel_group_name(user_id),
+                {
+                    "type": "broadcast_to_users",
+                    "user_ids": [user_id],
+                    "payload": payload,
+                    "ignore_web_socket_id": ignore_web_socket_id,
+                    "send_to_all_users": False,
+                },
+            )
+            for user_id in set(user_ids)
+        ],
     )
 
 
@@ -118,6 +184,43 @@ def broadcast_to_permitted_users(
     :return:
     """
 
+    def get_user_ids():
+        return get_permitted_user_ids(
+            workspace_id, operation_type, scope_name, scope_id
+        )
+
+    if settings.BASEROW_WS_PERMITTED_USERS_CACHE_TTL_SECONDS > 0:
+        user_ids = global_cache.get(
+            f"workspace_{workspace_id}_ws_permitted_users_{operation_type}_"
+            f"{scope_name}_{scope_id}",
+            default=get_user_ids,
+            invalidate_key=get_permitted_users_invalidate_key(workspace_id),
+            timeout=settings.BASEROW_WS_PERMITTED_USERS_CACHE_TTL_SECONDS,
+        )
+    else:
+        user_ids = get_user_ids()
+
+    if user_ids is None:
+        return  # trashed or deleted in the meantime
+
+    broadcast_to_users(user_ids, payload, ignore_web_socket_id=ignore_web_socket_id)
+
+
+def get_permitted_user_ids(
+    workspace_id: int, operation_type: str, scope_name: str, scope_id: int
+) -> Optional[List[int]]:
+    """
+    Returns the ids of the users of the workspace that are permitted to perform the
+    operation on the scope.
+
+    :param workspace_id: The workspace the users are in.
+    :param operation_type: The operation that should be checked for.
+    :param scope_name: The name of the scope that the operation is executed on.
+    :param scope_id: The id of the scope instance.
+    :return: The ids of the permitted users or None if the workspace or the scope
+        doesn't exist anymore.
+    """
+
     from baserow.core.handler import CoreHandler
     from baserow.core.mixins import TrashableModelMixin
     from baserow.core.models import Workspace, WorkspaceUser
@@ -126,7 +229,7 @@ def broadcast_to_permitted_users(
     try:
         workspace = Workspace.objects.get(id=workspace_id)
     except Workspace.DoesNotExist:
-        return  # trashed in the meantime
+        return None  # trashed in the meantime
 
     users_in_workspace = [
         workspace_user.user
@@ -147,9 +250,9 @@ def broadcast_to_permitted_users(
     try:
         scope = objects.get(id=scope_id)
     except scope_model_class.DoesNotExist:
-        return  # trashed or deleted in the meantime
+        return None  # trashed or deleted in the meantime
 
-    user_ids = [
+    return [
         u.id
         for u in CoreHandler().check_permission_for_multiple_actors(
             users_in_workspace,
@@ -159,7 +262,34 @@ def broadcast_to_permitted_users(
         )
     ]
 
-    broadcast_to_users(user_ids, payload, ignore_web_socket_id=ignore_web_socket_id)
+
+def get_permitted_users_invalidate_key(workspace_id: int) -> str:
+    return f"workspace_{workspace_id}__ws_permitted_users_invalidate_key"
+
+
+def invalidate_permitted_users_cache(workspace_ids: Iterable[int]):
+    """
+    Invalidates the cached users permitted to receive the messages of the
+    workspaces. Must be called when the members, their roles or their teams
+    change. The cache is invalidated right away and again when the transaction
+    commits, because a broadcast could have cached the old users in the meantime.
+
+    :param workspace_ids: The ids of the workspaces where the permissions changed.
+    """
+
+    if settings.BASEROW_WS_PERMITTED_USERS_CACHE_TTL_SECONDS <= 0:
+        return
+
+    workspace_ids = set(workspace_ids)
+
+    def invalidate():
+        for workspace_id in workspace_ids:
+            global_cache.invalidate(
+                invalidate_key=get_permitted_users_invalidate_key(workspace_id)
+            )
+
+    invalidate()
+    transaction.on_commit(invalidate)
 
 
 @app.task(bind=True)
@@ -181,14 +311,19 @@ def broadcast_to_users_individual_payloads(
     from channels.layers import get_channel_layer
 
     channel_layer = get_channel_layer()
-    async_to_sync(send_message_to_channel_group)(
+    async_to_sync(send_messages_to_channel_groups)(
         channel_layer,
-        "users",
-        {
-            "type": "broadcast_to_users_individual_payloads",
-            "payload_map": payload_map,
-            "ignore_web_socket_id": ignore_web_socket_id,
-        },
+        [
+            (
+                get_user_channel_group_name(user_id),
+                {
+                    "type": "broadcast_to_users_individual_payloads",
+                    "payload_map": {user_id: payload},
+                    "ignore_web_socket_id": ignore_web_socket_id,
+                },
+            )
+            for user_id, payload in payload_map.items()
+        ],
     )
 
 
@@ -169,6 +169,21 @@ def test_celery_queue_size_exceed_export_queue_name(
     mock_get_size.assert_called_with("export")
 
 
+@pytest.mark.django_db
+@override_settings(BASEROW_MAX_HEALTHY_CELERY_QUEUE_SIZE=10)
+@patch("baserow.api.health.views.get_celery_queue_size", kwargs={"queue": "celery"})
+def test_celery_queue_size_exceed_webhooks_queue_name(
+    mock_get_size, data_fixture, api_client
+):
+    mock_get_size.return_value = 0
+    response = api_client.get(
+        reverse("api:health:celery_queue_size_exceeded") + "?queue=webhooks",
+        content_type="application/json",
+    )
+    assert response.status_code == HTTP_200_OK
+    mock_get_size.assert_called_with("webhooks")
+
+
 @pytest.mark.django_db
 @override_settings(BASEROW_MAX_HEALTHY_CELERY_QUEUE_SIZE=10)
 @patch("baserow.api.health.views.get_celery_queue_size", kwargs={"queue": "celery"})
@@ -3,6 +3,7 @@ from unittest.mock import patch
 
 from django.http import HttpRequest
 from django.shortcuts import reverse
+from django.test.utils import override_settings
 
 import pytest
 
@@ -12,6 +13,7 @@ from baserow.contrib.builder.data_sources.builder_dispatch_context import (
 from baserow.contrib.builder.data_sources.exceptions import DataSourceDoesNotExist
 from baserow.contrib.builder.data_sources.handler import DataSourceHandler
 from baserow.contrib.builder.data_sources.models import DataSource
+from baserow.contrib.database.rows.handler import RowHandler
 from baserow.contrib.integrations.local_baserow.models import (
     LocalBaserowGetRow,
     LocalBaserowListRows,
@@ -349,6 +351,117 @@ def test_dispatch_data_sources(data_fixture):
     assert isinstance(result[data_source3.id], Exception)
 
 
+@pytest.mark.django_db(transaction=True)
+@override_settings(BUILDER_DATA_SOURCES_DISPATCH_MAX_WORKERS=3)
+def test_dispatch_data_sources_concurrently(data_fixture):
+    user = data_fixture.create_user()
+    table, fields, rows = data_fixture.build_table(
+        user=user,
+        columns=[
+            ("Name", "text"),
+            ("Row", "text"),
+        ],
+        rows=[
+            ["BMW", "3"],
+            ["Audi", "1"],
+            ["Volkswagen", "2"],
+        ],
+    )
+    view = data_fixture.create_grid_view(user, table=table)
+    builder = data_fixture.create_builder_application(user=user)
+    integration = data_fixture.create_local_baserow_integration(
+        user=user, application=builder
+    )
+    page = data_fixture.create_builder_page(user=user, builder=builder)
+    data_source = data_fixture.create_builder_local_baserow_get_row_data_source(
+        user=user,
+        page=page,
+        integration=integration,
+        view=view,
+        table=table,
+        row_id="2",
+    )
+    # References the first data source, so it must wait for its result.
+    data_source2 = data_fixture.create_builder_local_baserow_get_row_data_source(
+        user=user,
+        page=page,
+        integration=integration,
+        view=view,
+        table=table,
+        row_id=f"get('data_source.{data_source.id}.{fields[1].db_column}')",
+    )
+    data_source3 = data_fixture.create_builder_local_baserow_get_row_data_source(
+        user=user,
+        page=page,
+        integration=integration,
+        view=view,
+        table=table,
+        row_id="b",
+    )
+
+    dispatch_context = BuilderDispatchContext(
+        HttpRequest(), page, only_expose_public_allowed_properties=False
+    )
+    with patch.object(
+        DataSourceHandler,
+        "_dispatch_data_sources_concurrently",
+        wraps=DataSourceHandler()._dispatch_data_sources_concurrently,
+    ) as dispatch_concurrently:
+        result = DataSourceHandler().dispatch_data_sources(
+            [data_source, data_source2, data_source3], dispatch_context
+        )
+
+    dispatch_concurrently.assert_called_once()
+    assert result[data_source.id][fields[0].db_column] == "Audi"
+    assert result[data_source2.id][fields[0].db_column] == "BMW"
+    assert isinstance(result[data_source3.id], Exception)
+
+
+@pytest.mark.django_db
+def test_dispatch_published_data_source_with_cache_ttl(
+    data_fixture, django_capture_on_commit_callbacks
+):
+    user = data_fixture.create_user()
+    table, fields, rows = data_fixture.build_table(
+        user=user,
+        columns=[("Name", "text")],
+        rows=[["BMW"], ["Audi"]],
+    )
+    builder = data_fixture.create_builder_application(workspace=None)
+    integration = data_fixture.create_local_baserow_integration(
+        user=user, application=builder
+    )
+    page = data_fixture.create_builder_page(builder=builder)
+    data_source = data_fixture.create_builder_local_baserow_get_row_data_source(
+        page=page,
+        integration=integration,
+        table=table,
+        row_id=str(rows[0].id),
+    )
+    data_source.cache_ttl = 60
+    data_source.save()
+
+    def dispatch():
+        dispatch_context = BuilderDispatchContext(
+            HttpRequest(), page, only_expose_public_allowed_properties=False
+        )
+        return DataSourceHandler().dispatch_data_source(data_source, dispatch_context)
+
+    assert dispatch()[fields[0].db_column] == "BMW"
+
+    # The row is changed without sending any signal, so the cached result is kept.
+    table.get_model().objects.filter(id=rows[0].id).update(
+        **{fields[0].db_column: "Tesla"}
+    )
+    assert dispatch()[fields[0].db_column] == "BMW"
+
+    with django_capture_on_commit_callbacks(execute=True):
+        RowHandler().update_row_by_id(
+            user, table, rows[0].id, {fields[0].db_column: "Volvo"}
+        )
+    assert dispatch()[fields[0].db_column] == "Volvo"
+
+
 @pytest.mark.django_db
 def test_update_data_source_invalid_values(data_fixture):
     data_source = data_fixture.create_builder_local_baserow_get_row_data_source()
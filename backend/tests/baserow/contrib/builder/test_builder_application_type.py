@@ -207,6 +207,7 @@ def test_builder_application_export(data_fixture):
             {
                 "id": datasource2.id,
                 "name": "source 2",
+                "cache_ttl": 0,
                 "order": "1.00000000000000000000",
                 "service": {
                     "id": datasource2.service.id,
@@ -223,6 +224,7 @@ def test_builder_application_export(data_fixture):
             {
                 "id": datasource3.id,
                 "name": "source 3",
+                "cache_ttl": 0,
                 "order": "2.00000000000000000000",
                 "service": {
                     "id": datasource3.service.id,
@@ -360,6 +362,7 @@ def test_builder_application_export(data_fixture):
                     {
                         "id": shared_datasource.id,
                         "name": shared_datasource.name,
+                        "cache_ttl": 0,
                         "order": "1.00000000000000000000",
                         "service": {
                             "id": shared_datasource.service.id,
@@ -403,6 +406,7 @@ def test_builder_application_export(data_fixture):
                     {
                         "id": datasource1.id,
                         "name": "source 1",
+                        "cache_ttl": 0,
                         "order": "1.00000000000000000000",
                         "service": {
                             "id": datasource1.service.id,
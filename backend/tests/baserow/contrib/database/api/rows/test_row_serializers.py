@@ -7,6 +7,7 @@ from rest_framework import serializers
 from baserow.contrib.database.api.rows.serializers import (
     RowSerializer,
     get_example_row_serializer_class,
+    get_response_row_serializer_class,
     get_row_serializer_class,
     remap_serialized_row_to_user_field_names,
 )
@@ -569,6 +570,40 @@ def test_get_row_serializer_with_user_field_names(
     assert test_result == expected_result
 
 
+@pytest.mark.django_db
+def test_compiled_row_representation_matches_serializer(data_fixture):
+    table, user, row, _, context = setup_interesting_test_table(data_fixture)
+    model = table.get_model()
+    blank_row = model.objects.create()
+    rows = list(model.objects.all().enhance_by_fields().order_by("id"))
+
+    for user_field_names in [False, True]:
+        serializer = get_row_serializer_class(
+            model, RowSerializer, is_response=True, user_field_names=user_field_names
+        )(rows, many=True)
+        compiled_data = serializer.data
+        assert serializer.child._compiled_fields is not None
+        assert compiled_data == [
+            serializers.ModelSerializer.to_representation(serializer.child, instance)
+            for instance in rows
+        ]
+        assert [row["id"] for row in compiled_data] == [row.id, blank_row.id]
+
+
+@pytest.mark.django_db
+def test_get_response_row_serializer_class_is_cached_on_model(data_fixture):
+    table = data_fixture.create_database_table()
+    data_fixture.create_text_field(table=table, name="Name", primary=True)
+    model = table.get_model()
+
+    serializer_class = get_response_row_serializer_class(model)
+    assert get_response_row_serializer_class(model) is serializer_class
+    assert (
+        get_response_row_serializer_class(model, user_field_names=True)
+        is not serializer_class
+    )
+
+
 @pytest.mark.django_db
 def test_remap_serialized_row_to_user_field_names(data_fixture):
     user = data_fixture.create_user()
@@ -489,6 +489,59 @@ def test_list_rows_order_by_type(api_client, data_fixture):
     assert response_json["results"][2]["id"] == row_1.id
 
 
+@pytest.mark.django_db
+def test_list_rows_with_cursor_pagination(api_client, data_fixture):
+    user, jwt_token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    field_1 = data_fixture.create_text_field(name="Name", table=table, primary=True)
+    select_1 = data_fixture.create_single_select_field(name="Select", table=table)
+    option_1 = data_fixture.create_select_option(field=select_1, value="A", order=3)
+    option_2 = data_fixture.create_select_option(field=select_1, value="B", order=1)
+
+    model = table.get_model(attribute_names=True)
+    row_1 = model.objects.create(name="Product 1", select_id=option_1.id)
+    row_2 = model.objects.create(name="Product 2", select_id=option_2.id)
+    row_3 = model.objects.create(name="Product 3", select_id=option_1.id)
+    row_4 = model.objects.create(name="Product 4", select_id=None)
+
+    url = reverse("api:database:rows:list", kwargs={"table_id": table.id})
+    response = api_client.get(
+        f"{url}?cursor=&size=3", format="json", HTTP_AUTHORIZATION=f"JWT {jwt_token}"
+    )
+    response_json = response.json()
+    assert response.status_code == HTTP_200_OK
+    assert "count" not in response_json
+    assert [r["id"] for r in response_json["results"]] == [row_1.id, row_2.id, row_3.id]
+
+    response = api_client.get(
+        f"{url}?cursor={response_json['next_cursor']}&size=3",
+        format="json",
+        HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+    )
+    response_json = response.json()
+    assert response.status_code == HTTP_200_OK
+    assert [r["id"] for r in response_json["results"]] == [row_4.id]
+    assert response_json["next_cursor"] is None
+
+    ids, cursor = [], ""
+    while cursor is not None:
+        response = api_client.get(
+            f"{url}?cursor={cursor}&size=1&order_by=field_{select_1.id}[order]",
+            format="json",
+            HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+        )
+        assert response.status_code == HTTP_200_OK
+        ids += [r["id"] for r in response.json()["results"]]
+        cursor = response.json()["next_cursor"]
+    assert ids == [row_4.id, row_2.id, row_1.id, row_3.id]
+
+    response = api_client.get(
+        f"{url}?cursor=&size=201", format="json", HTTP_AUTHORIZATION=f"JWT {jwt_token}"
+    )
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["error"] == "ERROR_PAGE_SIZE_LIMIT"
+
+
 @pytest.mark.django_db
 def test_list_rows_adhoc_filtering_query_param_null_character(api_client, data_fixture):
     user, token = data_fixture.create_user_and_token()
@@ -5321,3 +5321,77 @@ def test_list_rows_with_page_and_invalid_numbers(api_client, data_fixture):
         assert response_json["results"][0][f"field_{text_field.id}"] == "0"
         assert response_json["results"][99][f"field_{text_field.id}"] == "99"
         assert count_calls == 0  # count is not called again
+
+
+@pytest.mark.django_db
+def test_list_rows_with_cursor_pagination(api_client, data_fixture):
+    user, token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table)
+    number_field = data_fixture.create_number_field(table=table)
+    grid_view = data_fixture.create_grid_view(table=table)
+    data_fixture.create_view_sort(view=grid_view, field=text_field, order="ASC")
+    data_fixture.create_view_sort(view=grid_view, field=number_field, order="DESC")
+
+    RowHandler().force_create_rows(
+        user,
+        table,
+        rows_values=[
+            {
+                f"field_{text_field.id}": ["a", "b", None][i % 3],
+                f"field_{number_field.id}": [1, None, 2, 3][i % 4],
+            }
+            for i in range(25)
+        ],
+    )
+
+    url = reverse("api:database:views:grid:list", kwargs={"view_id": grid_view.id})
+    response = api_client.get(f"{url}?size=25", HTTP_AUTHORIZATION=f"JWT {token}")
+    assert response.status_code == HTTP_200_OK
+    expected_ids = [row["id"] for row in response.json()["results"]]
+
+    ids, cursor, pages = [], "", 0
+    while cursor is not None:
+        response = api_client.get(
+            f"{url}?cursor={cursor}&size=4", HTTP_AUTHORIZATION=f"JWT {token}"
+        )
+        assert response.status_code == HTTP_200_OK
+        response_json = response.json()
+        assert "count" not in response_json
+        assert len(response_json["results"]) <= 4
+        ids += [row["id"] for row in response_json["results"]]
+        cursor = response_json["next_cursor"]
+        pages += 1
+
+    assert pages == 7
+    assert ids == expected_ids
+
+
+@pytest.mark.django_db
+def test_list_rows_with_invalid_cursor(api_client, data_fixture):
+    user, token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    grid_view = data_fixture.create_grid_view(table=table)
+    RowHandler().force_create_rows(user, table, rows_values=[{}, {}])
+
+    url = reverse("api:database:views:grid:list", kwargs={"view_id": grid_view.id})
+    response = api_client.get(
+        f"{url}?cursor=invalid", HTTP_AUTHORIZATION=f"JWT {token}"
+    )
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["error"] == "ERROR_INVALID_PAGINATION_CURSOR"
+
+    response = api_client.get(
+        f"{url}?cursor=&size=1", HTTP_AUTHORIZATION=f"JWT {token}"
+    )
+    cursor = response.json()["next_cursor"]
+    assert cursor is not None
+
+    # The cursor doesn't match the ordering anymore when an additional sort is added.
+    field = data_fixture.create_text_field(table=table)
+    response = api_client.get(
+        f"{url}?cursor={cursor}&order_by=field_{field.id}",
+        HTTP_AUTHORIZATION=f"JWT {token}",
+    )
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["error"] == "ERROR_INVALID_PAGINATION_CURSOR"
@@ -20,6 +20,7 @@ from baserow.contrib.database.data_sync.ical_data_sync_type import (
 )
 from baserow.contrib.database.data_sync.models import (
     DataSync,
+    DataSyncRowHash,
     DataSyncSyncedProperty,
     ICalCalendarDataSync,
 )
@@ -27,6 +28,7 @@ from baserow.contrib.database.data_sync.registries import DataSyncTypeRegistry
 from baserow.contrib.database.fields.exceptions import CannotDeletePrimaryField
 from baserow.contrib.database.fields.handler import FieldHandler
 from baserow.contrib.database.fields.models import Field, LongTextField, TextField
+from baserow.contrib.database.rows.handler import RowHandler
 from baserow.contrib.database.views.models import GridView
 from baserow.core.db import specific_iterator
 from baserow.core.exceptions import UserNotInWorkspace
@@ -950,6 +952,79 @@ def test_sync_data_sync_table_without_all_fields_rows_updated(data_fixture):
     assert data_sync.last_sync
 
 
+@pytest.mark.django_db
+@responses.activate
+def test_sync_data_sync_table_only_updates_rows_with_changed_hash(data_fixture):
+    responses.add(
+        responses.GET,
+        "https://baserow.io/ical.ics",
+        status=200,
+        body=ICAL_FEED_WITH_TWO_ITEMS,
+    )
+
+    user = data_fixture.create_user()
+    database = data_fixture.create_database_application(user=user)
+
+    handler = DataSyncHandler()
+    data_sync = handler.create_data_sync_table(
+        user=user,
+        database=database,
+        table_name="Test",
+        type_name="ical_calendar",
+        synced_properties=["uid", "dtstart", "summary"],
+        ical_url="https://baserow.io/ical.ics",
+    )
+    handler.sync_data_sync_table(user=user, data_sync=data_sync)
+
+    model = data_sync.table.get_model()
+    row_ids = list(model.objects.order_by("id").values_list("id", flat=True))
+    row_hashes = dict(
+        DataSyncRowHash.objects.filter(data_sync=data_sync).values_list(
+            "row_id", "hash"
+        )
+    )
+    assert sorted(row_hashes.keys()) == row_ids
+
+    with patch(
+        "baserow.contrib.database.data_sync.handler.RowHandler.update_rows"
+    ) as mock_update_rows:
+        handler.sync_data_sync_table(user=user, data_sync=data_sync)
+    mock_update_rows.assert_not_called()
+
+    # The first event has changed in this feed.
+    responses.add(
+        responses.GET,
+        "https://baserow.io/ical.ics",
+        status=200,
+        body=ICAL_FEED_WITH_THREE_ITEMS,
+    )
+    with patch(
+        "baserow.contrib.database.data_sync.handler.RowHandler.update_rows",
+        wraps=RowHandler().update_rows,
+    ) as mock_update_rows:
+        handler.sync_data_sync_table(user=user, data_sync=data_sync)
+    mock_update_rows.assert_called_once()
+    assert [r["id"] for r in mock_update_rows.call_args.kwargs["rows_values"]] == [
+        row_ids[0]
+    ]
+
+    new_row_hashes = dict(
+        DataSyncRowHash.objects.filter(data_sync=data_sync).values_list(
+            "row_id", "hash"
+        )
+    )
+    assert len(new_row_hashes) == 3
+    assert new_row_hashes[row_ids[0]] != row_hashes[row_ids[0]]
+    assert new_row_hashes[row_ids[1]] == row_hashes[row_ids[1]]
+
+    # Changing the synced properties must invalidate the hashes because the cell
+    # values might not match the source anymore.
+    handler.set_data_sync_synced_properties(
+        user=user, data_sync=data_sync, synced_properties=["uid", "dtstart"]
+    )
+    assert DataSyncRowHash.objects.filter(data_sync=data_sync).count() == 0
+
+
 @pytest.mark.django_db
 @responses.activate
 def test_sync_data_sync_table_without_permissions(data_fixture):
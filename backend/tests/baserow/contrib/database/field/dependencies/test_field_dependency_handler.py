@@ -1,4 +1,6 @@
 from django.contrib.contenttypes.models import ContentType
+from django.db import connection
+from django.test.utils import CaptureQueriesContext, override_settings
 
 import pytest
 from pytest_unordered import unordered
@@ -422,6 +424,54 @@ def test_get_all_dependant_fields_with_type_num_queries(
         )
 
 
+@pytest.mark.django_db
+@override_settings(BASEROW_FIELD_DEPENDENCIES_CACHE_TTL_SECONDS=60)
+def test_group_all_dependent_fields_by_level_is_cached_until_dependencies_change(
+    data_fixture,
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table, name="text")
+    handler = FieldHandler()
+    formula_a = handler.create_field(
+        user, table, "formula", name="a", formula="field('text')"
+    )
+    formula_b = handler.create_field(
+        user, table, "formula", name="b", formula="field('a')"
+    )
+
+    def get_dependants_by_level():
+        field_cache = FieldCache()
+        field_cache.cache_model(table.get_model())
+        ContentType.objects.get_for_model(LinkRowField)
+        with CaptureQueriesContext(connection) as captured:
+            levels = FieldDependencyHandler.group_all_dependent_fields_by_level(
+                table.id,
+                [text_field.id],
+                field_cache,
+                associated_relations_changed=True,
+                database_id_prefilter=table.database_id,
+            )
+        return [[field.id for field, _, _ in level] for level in levels], captured
+
+    levels, captured = get_dependants_by_level()
+    assert levels == [[formula_a.id], [formula_b.id]]
+    assert len(captured) == 1
+
+    # The traversal is cached and all the dependants are already in the field cache.
+    levels, captured = get_dependants_by_level()
+    assert levels == [[formula_a.id], [formula_b.id]]
+    assert len(captured) == 0
+
+    formula_c = handler.create_field(
+        user, table, "formula", name="c", formula="field('b')"
+    )
+
+    levels, captured = get_dependants_by_level()
+    assert levels == [[formula_a.id], [formula_b.id], [formula_c.id]]
+    assert len(captured) == 1
+
+
 @pytest.mark.django_db
 @pytest.mark.field_link_row
 def test_get_all_dependant_fields_with_type_via_field_num_queries(
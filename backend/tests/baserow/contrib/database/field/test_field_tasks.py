@@ -1,12 +1,14 @@
-from datetime import datetime, timedelta, timezone
+from datetime import date, datetime, timedelta, timezone
 from unittest.mock import patch
 
+from django.db import connection
 from django.test import override_settings
 
 import pytest
 from freezegun import freeze_time
 
 from baserow.contrib.database.fields.field_types import FormulaFieldType
+from baserow.contrib.database.fields.handler import FieldHandler
 from baserow.contrib.database.fields.periodic_field_update_handler import (
     PeriodicFieldUpdateHandler,
 )
@@ -378,6 +380,145 @@ def test_all_formula_that_needs_updates_are_periodically_updated(data_fixture):
         assert FormulaFieldType().get_fields_needing_periodic_update().count() == 2
 
 
+@pytest.mark.django_db
+def test_time_dependent_formulas_evaluated_at_query_time(data_fixture, settings):
+    settings.BASEROW_EVALUATE_TIME_DEPENDENT_FORMULAS_AT_QUERY_TIME = True
+    user = data_fixture.create_user()
+    workspace = data_fixture.create_workspace(user=user)
+    database = data_fixture.create_database_application(workspace=workspace)
+    table = data_fixture.create_database_table(database=database)
+
+    with freeze_time("2023-02-27 10:00"):
+        date_field = data_fixture.create_date_field(table=table, date_include_time=True)
+        now_field = data_fixture.create_formula_field(
+            table=table, formula="now()", date_include_time=True
+        )
+        is_past_field = data_fixture.create_formula_field(
+            table=table, formula=f"now() > field('{date_field.name}')"
+        )
+        reference_field = data_fixture.create_formula_field(
+            table=table,
+            formula=f"field('{now_field.name}')",
+            date_include_time=True,
+        )
+        row = RowHandler().create_row(
+            user=user,
+            table=table,
+            values={date_field.db_column: "2023-02-27T10:30:00Z"},
+        )
+
+    model = table.get_model()
+    assert model._meta.get_field(now_field.db_column).is_evaluated_at_query_time()
+    assert not model._meta.get_field(
+        reference_field.db_column
+    ).is_evaluated_at_query_time()
+
+    with freeze_time("2023-02-27 11:00"):
+        row = model.objects.get(id=row.id)
+        assert getattr(row, now_field.db_column) == datetime(
+            2023, 2, 27, 11, 0, tzinfo=timezone.utc
+        )
+        assert getattr(row, is_past_field.db_column) is True
+        assert model.objects.filter(**{is_past_field.db_column: True}).count() == 1
+        # The field referencing the time dependent field is stored, so it's only
+        # updated periodically.
+        assert getattr(row, reference_field.db_column) == datetime(
+            2023, 2, 27, 10, 0, tzinfo=timezone.utc
+        )
+
+        with patch(
+            "baserow.contrib.database.fields.field_types.FormulaFieldType"
+            "._update_field_values"
+        ) as update_field_values:
+            run_periodic_fields_updates(workspace_id=workspace.id)
+
+    updated_fields = [call.args[0] for call in update_field_values.call_args_list]
+    assert reference_field in updated_fields
+    assert now_field not in updated_fields
+    assert is_past_field not in updated_fields
+
+
+@pytest.mark.django_db
+def test_formulas_evaluated_at_query_time_are_not_indexed(data_fixture, settings):
+    settings.BASEROW_EVALUATE_TIME_DEPENDENT_FORMULAS_AT_QUERY_TIME = True
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    now_field = FieldHandler().create_field(
+        user, table, "formula", name="now", formula="now()", db_index=True
+    )
+    reference_field = FieldHandler().create_field(
+        user,
+        table,
+        "formula",
+        name="reference",
+        formula="field('now')",
+        db_index=True,
+    )
+
+    model = table.get_model()
+    assert model._meta.get_field(now_field.db_column).db_index is False
+    assert model._meta.get_field(reference_field.db_column).db_index is True
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT indexname FROM pg_indexes WHERE tablename = %s",
+            [model._meta.db_table],
+        )
+        index_names = [row[0] for row in cursor.fetchall()]
+
+    def has_index(field):
+        prefix = f"database_table_{table.id}_{field.db_column}_"
+        return any(index_name.startswith(prefix) for index_name in index_names)
+
+    assert not has_index(now_field)
+    assert has_index(reference_field)
+
+
+@pytest.mark.django_db
+def test_periodic_update_skips_fields_until_their_values_can_change(data_fixture):
+    user = data_fixture.create_user()
+    workspace = data_fixture.create_workspace(user=user)
+    database = data_fixture.create_database_application(workspace=workspace)
+    table = data_fixture.create_database_table(database=database)
+
+    with freeze_time("2023-02-27 10:00"):
+        today_field = data_fixture.create_formula_field(table=table, formula="today()")
+        now_field = data_fixture.create_formula_field(
+            table=table, formula="now()", date_include_time=True
+        )
+        row = RowHandler().create_row(user=user, table=table)
+        run_periodic_fields_updates(workspace_id=workspace.id)
+
+    today_field.refresh_from_db()
+    now_field.refresh_from_db()
+    assert today_field.next_periodic_update == datetime(
+        2023, 2, 28, tzinfo=timezone.utc
+    )
+    assert now_field.next_periodic_update is None
+
+    with freeze_time("2023-02-27 23:50"):
+        assert list(FormulaFieldType().get_fields_needing_periodic_update()) == [
+            now_field
+        ]
+
+    with freeze_time("2023-02-28 00:10"):
+        assert list(
+            FormulaFieldType().get_fields_needing_periodic_update().order_by("id")
+        ) == [today_field, now_field]
+        run_periodic_fields_updates(workspace_id=workspace.id)
+
+    row.refresh_from_db()
+    assert getattr(row, today_field.db_column) == date(2023, 2, 28)
+    today_field.refresh_from_db()
+    assert today_field.next_periodic_update == datetime(2023, 3, 1, tzinfo=timezone.utc)
+
+    # Changing the formula must reset the next update.
+    today_field = FieldHandler().update_field(
+        user, today_field, formula="datetime_format(now(), 'YYYY')"
+    )
+    assert today_field.next_periodic_update is None
+
+
 @pytest.mark.django_db
 def test_run_periodic_field_type_doesnt_update_trashed_table(data_fixture):
     user = data_fixture.create_user()
@@ -1,8 +1,10 @@
 import json
 from datetime import datetime, timedelta, timezone
 from typing import NamedTuple
+from unittest.mock import patch
 
 from django.conf import settings
+from django.core.files.base import ContentFile
 from django.test.utils import override_settings
 
 import pytest
@@ -529,6 +531,70 @@ def test_run_file_import_test_chunk(data_fixture, patch_filefield_storage):
     assert job.progress_percentage == 100
 
 
+@pytest.mark.django_db(transaction=True)
+@patch("baserow.contrib.database.rows.handler.IMPORT_ROWS_CHUNK_SIZE", 4)
+def test_run_file_import_streams_rows_in_chunks(data_fixture, patch_filefield_storage):
+    user = data_fixture.create_user()
+    table, _, _ = data_fixture.build_table(
+        columns=[("col1", "text"), ("col2", "number")], rows=[], user=user
+    )
+
+    data = [[f"row {i}", i] for i in range(10)]
+    data[2] = ["bad", "bad"]
+    data[5] = ["too", 1, "many"]
+    data[9] = ["bad", "bad"]
+
+    with patch_filefield_storage():
+        job = data_fixture.create_file_import_job(
+            table=table, data={"data": data}, user=user
+        )
+        run_async_job(job.id)
+
+    job.refresh_from_db()
+    assert job.state == JOB_FINISHED
+    assert job.progress_percentage == 100
+    assert sorted(job.report["failing_rows"].keys()) == ["2", "5", "9"]
+
+    model = table.get_model()
+    text_field = table.field_set.get(name="col1")
+    assert list(
+        model.objects.order_by("id").values_list(f"field_{text_field.id}", flat=True)
+    ) == [
+        "row 0",
+        "row 1",
+        "row 3",
+        "row 4",
+        "row 6",
+        "row 7",
+        "row 8",
+    ]
+
+
+@pytest.mark.django_db(transaction=True)
+def test_run_file_import_task_with_single_json_data_file(
+    data_fixture, patch_filefield_storage
+):
+    user = data_fixture.create_user()
+    database = data_fixture.create_database_application(user=user)
+    data = {"data": [["Name"], ["a"], ["b"]], "configuration": None}
+
+    with patch_filefield_storage():
+        job = data_fixture.create_file_import_job(
+            user=user,
+            database=database,
+            data_file=ContentFile(json.dumps(data)),
+        )
+        run_async_job(job.id)
+
+    job.refresh_from_db()
+    assert job.state == JOB_FINISHED
+    model = job.table.get_model()
+    name_field = job.table.field_set.get(name="Name")
+    assert list(
+        model.objects.order_by("id").values_list(f"field_{name_field.id}", flat=True)
+    ) == ["a", "b"]
+
+
 @pytest.mark.django_db()
 def test_run_file_import_limit(data_fixture, patch_filefield_storage):
     row_count = 2000
@@ -107,6 +107,35 @@ def test_csv_is_sorted_by_sorts(get_storage_mock, data_fixture):
     assert contents == expected
 
 
+@pytest.mark.django_db
+@patch("baserow.core.storage.get_default_storage")
+def test_csv_is_written_in_sorted_chunks(get_storage_mock, data_fixture):
+    storage_mock = MagicMock()
+    get_storage_mock.return_value = storage_mock
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table, name="text_field")
+    grid_view = data_fixture.create_grid_view(table=table)
+    model = table.get_model()
+    for value in ["B", "A", "B", "C", "A"]:
+        model.objects.create(**{f"field_{text_field.id}": value})
+    data_fixture.create_view_sort(view=grid_view, field=text_field, order="DESC")
+
+    with patch(
+        "baserow.contrib.database.export.file_writer."
+        "PaginatedExportJobFileWriter.ROWS_PER_CHUNK",
+        2,
+    ):
+        job, contents = run_export_job_with_mock_storage(
+            table, grid_view, storage_mock, user
+        )
+
+    bom = "\ufeff"
+    expected = bom + "id,text_field\r\n4,C\r\n1,B\r\n3,B\r\n2,A\r\n5,A\r\n"
+    assert contents == expected
+    assert job.progress_percentage == 100.0
+
+
 @pytest.mark.django_db
 @patch("baserow.core.storage.get_default_storage")
 def test_csv_is_filtered_by_filters(get_storage_mock, data_fixture):
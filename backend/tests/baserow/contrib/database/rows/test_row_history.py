@@ -4,7 +4,11 @@ from datetime import date, datetime, timedelta, timezone
 from typing import Any, Callable
 from unittest.mock import patch
 
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
 import pytest
+from django_redis import get_redis_connection
 from freezegun import freeze_time
 
 from baserow.api.sessions import get_untrusted_client_session_id
@@ -28,6 +32,8 @@ from baserow.contrib.database.rows.registries import (
 from baserow.contrib.database.trash.trash_types import RowTrashableItemType
 from baserow.core.action.handler import ActionHandler
 from baserow.core.action.registries import ActionType, action_type_registry
+from baserow.core.buffered_writes import buffered_write_type_registry
+from baserow.core.partitioning import time_partitioned_model_type_registry
 from baserow.core.trash.actions import RestoreFromTrashActionType
 from baserow.test_utils.helpers import setup_interesting_test_table
 
@@ -108,6 +114,129 @@ def test_update_rows_insert_multiple_entries_in_row_history(data_fixture):
     ]
 
 
+@pytest.fixture
+def row_history_buffer():
+    # The buffer is stored in Redis, which isn't reset between the tests.
+    redis_client = get_redis_connection("default")
+    buffered_write_type = buffered_write_type_registry.get_by_model(RowHistory)
+    keys = [buffered_write_type.buffer_key, buffered_write_type.dead_letter_key]
+    redis_client.delete(*keys)
+    yield
+    redis_client.delete(*keys)
+
+
+@pytest.mark.django_db
+@pytest.mark.row_history
+@patch("baserow.contrib.database.rows.buffered_write_types.rows_history_updated")
+def test_update_rows_buffers_row_history_entries_until_flushed(
+    mock_rows_history_updated,
+    row_history_buffer,
+    settings,
+    data_fixture,
+    django_capture_on_commit_callbacks,
+):
+    settings.BASEROW_BUFFERED_WRITES_ENABLED = True
+
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    name_field = data_fixture.create_text_field(table=table, name="Name")
+
+    row_handler = RowHandler()
+    row_one = row_handler.force_create_row(user, table, {name_field.id: "Original 1"})
+    row_two = row_handler.force_create_row(user, table, {name_field.id: "Original 2"})
+
+    with django_capture_on_commit_callbacks(execute=True), freeze_time(
+        "2021-01-01 12:00"
+    ):
+        action_type_registry.get_by_type(UpdateRowsActionType).do(
+            user,
+            table,
+            [
+                {"id": row_one.id, f"field_{name_field.id}": "New 1"},
+                {"id": row_two.id, f"field_{name_field.id}": "New 2"},
+            ],
+        )
+
+    assert RowHistory.objects.count() == 0
+    mock_rows_history_updated.send.assert_not_called()
+
+    row_history_buffered_write_type = buffered_write_type_registry.get_by_model(
+        RowHistory
+    )
+    assert row_history_buffered_write_type.get_buffer_length() == 2
+    assert row_history_buffered_write_type.flush() == 2
+    assert row_history_buffered_write_type.get_buffer_length() == 0
+
+    history_entries = RowHistory.objects.order_by("row_id").values(
+        "user_id", "table_id", "row_id", "action_timestamp", "after_values"
+    )
+    assert list(history_entries) == [
+        {
+            "user_id": user.id,
+            "table_id": table.id,
+            "row_id": row_one.id,
+            "action_timestamp": datetime(2021, 1, 1, 12, 0, tzinfo=timezone.utc),
+            "after_values": {f"field_{name_field.id}": "New 1"},
+        },
+        {
+            "user_id": user.id,
+            "table_id": table.id,
+            "row_id": row_two.id,
+            "action_timestamp": datetime(2021, 1, 1, 12, 0, tzinfo=timezone.utc),
+            "after_values": {f"field_{name_field.id}": "New 2"},
+        },
+    ]
+    mock_rows_history_updated.send.assert_called_once()
+    assert mock_rows_history_updated.send.call_args[1]["table_id"] == table.id
+    assert all(
+        entry.id
+        for entry in mock_rows_history_updated.send.call_args[1]["row_history_entries"]
+    )
+
+
+@pytest.mark.django_db
+@pytest.mark.row_history
+def test_flush_row_history_buffer_skips_invalid_entries_and_limits_batches(
+    row_history_buffer, settings, data_fixture, django_capture_on_commit_callbacks
+):
+    settings.BASEROW_BUFFERED_WRITES_ENABLED = True
+
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    name_field = data_fixture.create_text_field(table=table, name="Name")
+    row = RowHandler().force_create_row(user, table, {name_field.id: "Original"})
+
+    row_history_buffered_write_type = buffered_write_type_registry.get_by_model(
+        RowHistory
+    )
+    invalid_entry = json.dumps({"action_timestamp": "not a date"})
+    redis_client = get_redis_connection("default")
+    redis_client.rpush(row_history_buffered_write_type.buffer_key, invalid_entry)
+
+    for value in ["New 1", "New 2"]:
+        with django_capture_on_commit_callbacks(execute=True):
+            action_type_registry.get_by_type(UpdateRowsActionType).do(
+                user, table, [{"id": row.id, f"field_{name_field.id}": value}]
+            )
+
+    assert row_history_buffered_write_type.get_buffer_length() == 3
+
+    with patch.object(row_history_buffered_write_type, "batch_size", 1), patch.object(
+        row_history_buffered_write_type, "max_batches_per_flush", 2
+    ):
+        assert row_history_buffered_write_type.flush() == 1
+        assert row_history_buffered_write_type.get_buffer_length() == 1
+        assert row_history_buffered_write_type.flush() == 1
+        assert row_history_buffered_write_type.get_buffer_length() == 0
+
+    assert list(
+        RowHistory.objects.order_by("id").values_list("after_values", flat=True)
+    ) == [{f"field_{name_field.id}": "New 1"}, {f"field_{name_field.id}": "New 2"}]
+    assert redis_client.lrange(
+        row_history_buffered_write_type.dead_letter_key, 0, -1
+    ) == [invalid_entry.encode()]
+
+
 @pytest.mark.django_db
 @pytest.mark.row_history
 def test_history_handler_only_save_changed_fields(data_fixture):
@@ -335,6 +464,111 @@ def test_row_history_handler_delete_entries_older_than(data_fixture):
     assert RowHistory.objects.count() == 2
 
 
+@pytest.mark.django_db
+@pytest.mark.row_history
+def test_row_history_handler_delete_entries_older_than_drops_partitions(
+    settings, data_fixture
+):
+    settings.BASEROW_TIME_PARTITION_INTERVAL = "month"
+    settings.BASEROW_TIME_PARTITIONS_AHEAD = 3
+
+    table = data_fixture.create_database_table()
+    common_params = {
+        "table": table,
+        "row_id": 999,
+        "action_uuid": "uuid",
+        "action_command_type": "cmd",
+        "action_type": "type",
+        "field_names": [],
+        "fields_metadata": {},
+        "before_values": {},
+        "after_values": {},
+    }
+    old_entry = RowHistory.objects.create(
+        **common_params, action_timestamp=datetime(2021, 1, 1, tzinfo=timezone.utc)
+    )
+
+    time_partitioned_model_type = time_partitioned_model_type_registry.get_by_model(
+        RowHistory
+    )
+    with freeze_time("2026-10-18 12:00"):
+        assert time_partitioned_model_type.convert_to_partitioned_table() is True
+        assert time_partitioned_model_type.convert_to_partitioned_table() is False
+
+    assert time_partitioned_model_type.is_partitioned()
+    assert [
+        (partition.name, partition.start, partition.end)
+        for partition in time_partitioned_model_type.get_partitions()
+    ] == [
+        (
+            "database_rowhistory_legacy",
+            None,
+            datetime(2026, 11, 1, tzinfo=timezone.utc),
+        ),
+        (
+            "database_rowhistory_p20261101",
+            datetime(2026, 11, 1, tzinfo=timezone.utc),
+            datetime(2026, 12, 1, tzinfo=timezone.utc),
+        ),
+        (
+            "database_rowhistory_p20261201",
+            datetime(2026, 12, 1, tzinfo=timezone.utc),
+            datetime(2027, 1, 1, tzinfo=timezone.utc),
+        ),
+        (
+            "database_rowhistory_p20270101",
+            datetime(2027, 1, 1, tzinfo=timezone.utc),
+            datetime(2027, 2, 1, tzinfo=timezone.utc),
+        ),
+    ]
+
+    new_entry = RowHistory.objects.create(
+        **common_params, action_timestamp=datetime(2026, 12, 5, tzinfo=timezone.utc)
+    )
+    assert new_entry.id > old_entry.id
+
+    RowHistoryHandler.delete_entries_older_than(
+        datetime(2026, 12, 1, tzinfo=timezone.utc)
+    )
+
+    assert [
+        partition.name for partition in time_partitioned_model_type.get_partitions()
+    ] == ["database_rowhistory_p20261201", "database_rowhistory_p20270101"]
+    assert list(RowHistory.objects.values_list("id", flat=True)) == [new_entry.id]
+
+
+@pytest.mark.django_db
+@pytest.mark.row_history
+def test_create_row_history_partitions_only_locks_when_partitions_are_missing(
+    settings,
+):
+    settings.BASEROW_TIME_PARTITION_INTERVAL = "day"
+    settings.BASEROW_TIME_PARTITIONS_AHEAD = 3
+
+    time_partitioned_model_type = time_partitioned_model_type_registry.get_by_model(
+        RowHistory
+    )
+    with freeze_time("2026-10-18 12:00"):
+        assert time_partitioned_model_type.convert_to_partitioned_table() is True
+
+        # Daily partitions are always created at least two weeks ahead.
+        partitions = time_partitioned_model_type.get_partitions()
+        assert partitions[-1].end == datetime(2026, 11, 2, tzinfo=timezone.utc)
+
+        with CaptureQueriesContext(connection) as captured:
+            assert time_partitioned_model_type.create_partitions() == []
+        assert not any(
+            "LOCK" in query["sql"] or "pg_advisory" in query["sql"]
+            for query in captured.captured_queries
+        )
+
+    with freeze_time("2026-10-20 12:00"):
+        assert time_partitioned_model_type.create_partitions() == [
+            "database_rowhistory_p20261102",
+            "database_rowhistory_p20261103",
+        ]
+
+
 @pytest.mark.django_db
 @pytest.mark.row_history
 def test_row_history_not_recorded_with_retention_zero_days(settings, data_fixture):
@@ -16,9 +16,11 @@ from baserow.contrib.database.api.utils import (
     extract_user_field_names_from_params,
     get_include_exclude_fields,
 )
+from baserow.contrib.database.fields.handler import FieldHandler
 from baserow.contrib.database.fields.models import SelectOption
 from baserow.contrib.database.rows.exceptions import RowDoesNotExist
-from baserow.contrib.database.rows.handler import RowHandler
+from baserow.contrib.database.rows.handler import COPY_ROWS_MIN_COUNT, RowHandler
+from baserow.core.db import copy_rows_into_table
 from baserow.core.exceptions import UserNotInWorkspace
 from baserow.core.trash.handler import TrashHandler
 
@@ -867,6 +869,98 @@ def test_create_rows_last_modified_by(data_fixture):
     assert rows[1].last_modified_by == user
 
 
+@pytest.mark.django_db
+def test_create_rows_with_copy(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(name="Car", user=user)
+    other_table = data_fixture.create_database_table(database=table.database)
+    other_row = other_table.get_model().objects.create()
+    text_field = data_fixture.create_text_field(table=table)
+    number_field = data_fixture.create_number_field(
+        table=table, number_decimal_places=2
+    )
+    boolean_field = data_fixture.create_boolean_field(table=table)
+    date_field = data_fixture.create_date_field(table=table, date_include_time=True)
+    single_select_field = data_fixture.create_single_select_field(table=table)
+    option = data_fixture.create_select_option(field=single_select_field)
+    link_field = FieldHandler().create_field(
+        user, table, "link_row", name="Link", link_row_table=other_table
+    )
+
+    rows_values = [
+        {
+            text_field.db_column: f'Text "{index}",\nmultiline',
+            number_field.db_column: Decimal(f"{index}.25"),
+            boolean_field.db_column: index % 2 == 0,
+            date_field.db_column: "2020-01-01T12:00:00Z",
+            single_select_field.db_column: option.id,
+            link_field.db_column: [other_row.id] if index == 0 else [],
+        }
+        for index in range(COPY_ROWS_MIN_COUNT)
+    ]
+    rows_values[1][text_field.db_column] = None
+
+    with patch(
+        "baserow.contrib.database.rows.handler.copy_rows_into_table",
+        wraps=copy_rows_into_table,
+    ) as mock_copy_rows_into_table:
+        rows = RowHandler().create_rows(user, table, rows_values).created_rows
+
+    mock_copy_rows_into_table.assert_called_once()
+    assert len(rows) == COPY_ROWS_MIN_COUNT
+
+    model = table.get_model()
+    db_rows = list(model.objects.order_by("id"))
+    assert [r.id for r in db_rows] == sorted(r.id for r in rows)
+    assert getattr(db_rows[0], text_field.db_column) == 'Text "0",\nmultiline'
+    assert getattr(db_rows[1], text_field.db_column) is None
+    assert getattr(db_rows[2], number_field.db_column) == Decimal("2.25")
+    assert getattr(db_rows[2], boolean_field.db_column) is True
+    assert getattr(db_rows[3], boolean_field.db_column) is False
+    assert getattr(db_rows[0], date_field.db_column) == datetime(
+        2020, 1, 1, 12, 0, tzinfo=timezone.utc
+    )
+    assert getattr(db_rows[0], single_select_field.db_column).id == option.id
+    assert [r.id for r in getattr(db_rows[0], link_field.db_column).all()] == [
+        other_row.id
+    ]
+    assert db_rows[0].last_modified_by == user
+    assert db_rows[0].created_on is not None
+    assert db_rows[0].updated_on == db_rows[0].created_on
+    assert [r.order for r in db_rows] == sorted(r.order for r in db_rows)
+
+    # The sequence must have been used, so that new rows don't conflict.
+    new_row = RowHandler().create_row(user, table, {})
+    assert new_row.id > db_rows[-1].id
+
+
+@pytest.mark.django_db
+def test_create_rows_without_copy_if_not_supported_by_a_field(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table)
+    formula_field = FieldHandler().create_field(
+        user, table, "formula", name="Formula", formula=f"field('{text_field.name}')"
+    )
+
+    with patch(
+        "baserow.contrib.database.rows.handler.copy_rows_into_table"
+    ) as mock_copy_rows_into_table:
+        rows = (
+            RowHandler()
+            .create_rows(
+                user,
+                table,
+                [{text_field.db_column: "a"}] * COPY_ROWS_MIN_COUNT,
+            )
+            .created_rows
+        )
+
+    mock_copy_rows_into_table.assert_not_called()
+    assert len(rows) == COPY_ROWS_MIN_COUNT
+    assert getattr(rows[0], formula_field.db_column) == "a"
+
+
 @pytest.mark.django_db
 def test_update_rows_created_on_and_last_modified(data_fixture):
     user = data_fixture.create_user()
@@ -1442,7 +1536,10 @@ def test_get_unique_orders_first_before_row(data_fixture):
 
 
 @pytest.mark.django_db
-def test_get_unique_orders_before_row_triggering_full_table_order_reset(data_fixture):
+@patch("baserow.contrib.database.rows.signals.row_orders_recalculated.send")
+def test_get_unique_orders_before_row_spreading_the_orders_around_the_row(
+    send_mock, data_fixture
+):
     user = data_fixture.create_user()
     database = data_fixture.create_database_application(user=user)
     table = data_fixture.create_database_table(
@@ -1457,19 +1554,52 @@ def test_get_unique_orders_before_row_triggering_full_table_order_reset(data_fix
 
     handler = RowHandler()
     assert handler.get_unique_orders_before_row(row_3, model, 2) == [
-        Decimal("3.50000000000000000000"),
-        Decimal("3.66666666666666651864"),
+        Decimal("3.80000000000000000600"),
+        Decimal("5.20000000000000000400"),
     ]
+    assert row_3.order == Decimal("6.60000000000000000200")
 
     row_1.refresh_from_db()
     row_2.refresh_from_db()
     row_3.refresh_from_db()
     row_4.refresh_from_db()
 
+    # Only the rows next to `row_3` get a new order.
     assert row_1.order == Decimal("1.00000000000000000000")
-    assert row_2.order == Decimal("2.00000000000000000000")
-    assert row_3.order == Decimal("4.00000000000000000000")
-    assert row_4.order == Decimal("3.00000000000000000000")
+    assert row_2.order == Decimal("1.00000000000000001000")
+    assert row_3.order == Decimal("6.60000000000000000200")
+    assert row_4.order == Decimal("2.40000000000000000800")
+
+    send_mock.assert_called_once()
+    assert send_mock.call_args[1]["table"].id == table.id
+
+
+@pytest.mark.django_db
+def test_get_unique_orders_before_row_only_updates_the_orders_of_nearby_rows(
+    data_fixture,
+):
+    table = data_fixture.create_database_table()
+    model = table.get_model()
+    rows = [model.objects.create(order=Decimal(order)) for order in range(1, 11)]
+    packed_row = model.objects.create(order=Decimal("5.99999999999999999999"))
+
+    assert RowHandler().get_unique_orders_before_row(rows[5], model) == [
+        Decimal("6.00000000000000000000")
+    ]
+
+    assert list(model.objects.values_list("id", "order")) == [
+        (rows[0].id, Decimal("1.00000000000000000000")),
+        (rows[1].id, Decimal("2.00000000000000000000")),
+        (rows[2].id, Decimal("3.00000000000000000000")),
+        (rows[3].id, Decimal("4.00000000000000000000")),
+        (rows[4].id, Decimal("5.00000000000000000000")),
+        (packed_row.id, Decimal("5.50000000000000000000")),
+        (rows[5].id, Decimal("6.50000000000000000000")),
+        (rows[6].id, Decimal("7.00000000000000000000")),
+        (rows[7].id, Decimal("8.00000000000000000000")),
+        (rows[8].id, Decimal("9.00000000000000000000")),
+        (rows[9].id, Decimal("10.00000000000000000000")),
+    ]
 
 
 @pytest.mark.django_db
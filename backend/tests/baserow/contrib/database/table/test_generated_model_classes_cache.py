@@ -0,0 +1,92 @@
+from datetime import datetime, timezone
+
+import pytest
+from freezegun import freeze_time
+
+from baserow.contrib.database.fields.handler import FieldHandler
+from baserow.contrib.database.fields.tasks import run_periodic_fields_updates
+from baserow.contrib.database.rows.handler import RowHandler
+from baserow.contrib.database.table.cache import generated_model_classes_cache
+from baserow.core.cache import local_cache
+
+# Every `local_cache.context()` block below simulates a separate request, so that
+# the model classes are reused from the process wide cache like in production.
+
+
+@pytest.fixture(autouse=True)
+def enable_generated_model_classes_cache(settings):
+    settings.BASEROW_GENERATED_MODEL_CLASSES_CACHE_SIZE = 128
+    generated_model_classes_cache.clear()
+    yield
+    generated_model_classes_cache.clear()
+
+
+@pytest.mark.django_db
+def test_row_and_field_flows_with_generated_model_classes_cache(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table, name="text")
+
+    with local_cache.context():
+        row = RowHandler().create_row(user, table, {text_field.id: "a"})
+    with local_cache.context():
+        number_field = FieldHandler().create_field(user, table, "number", name="number")
+    with local_cache.context():
+        RowHandler().update_row_by_id(user, table, row.id, {number_field.id: 1})
+    with local_cache.context():
+        FieldHandler().delete_field(user, text_field)
+
+    with local_cache.context():
+        model = table.get_model()
+        assert len(generated_model_classes_cache) == 1
+        row = model.objects.get(id=row.id)
+        assert getattr(row, f"field_{number_field.id}") == 1
+        assert not hasattr(row, f"field_{text_field.id}")
+
+
+@pytest.mark.django_db
+def test_formula_flows_with_generated_model_classes_cache(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table, name="text")
+
+    with local_cache.context():
+        formula_field = FieldHandler().create_field(
+            user, table, "formula", name="formula", formula="concat(field('text'), '!')"
+        )
+    with local_cache.context():
+        row = RowHandler().create_row(user, table, {text_field.id: "a"})
+    with local_cache.context():
+        formula_field = FieldHandler().update_field(
+            user, formula_field, formula="concat(field('text'), '?')"
+        )
+    with local_cache.context():
+        RowHandler().update_row_by_id(user, table, row.id, {text_field.id: "b"})
+
+    with local_cache.context():
+        row = table.get_model().objects.get(id=row.id)
+        assert getattr(row, f"field_{formula_field.id}") == "b?"
+
+
+@pytest.mark.django_db
+def test_periodic_formula_update_with_generated_model_classes_cache(data_fixture):
+    user = data_fixture.create_user()
+    workspace = data_fixture.create_workspace(user=user)
+    database = data_fixture.create_database_application(workspace=workspace)
+    table = data_fixture.create_database_table(database=database)
+
+    with freeze_time("2020-01-01 00:00"):
+        formula_field = data_fixture.create_formula_field(
+            table=table, formula="now()", date_include_time=True
+        )
+        with local_cache.context():
+            row = RowHandler().create_row(user, table, {})
+
+    with freeze_time("2020-01-01 12:00"), local_cache.context():
+        run_periodic_fields_updates(workspace_id=workspace.id)
+
+    with local_cache.context():
+        row = table.get_model().objects.get(id=row.id)
+        assert getattr(row, f"field_{formula_field.id}") == datetime(
+            2020, 1, 1, 12, 0, tzinfo=timezone.utc
+        )
@@ -3,7 +3,12 @@ from django.test.utils import override_settings
 import pytest
 
 from baserow.contrib.database.fields.handler import FieldHandler
-from baserow.contrib.database.table.cache import get_cached_model_field_attrs
+from baserow.contrib.database.table.cache import (
+    generated_model_classes_cache,
+    get_cached_model_field_attrs,
+)
+from baserow.contrib.database.table.models import Table
+from baserow.core.cache import local_cache
 from baserow.core.trash.handler import TrashHandler
 
 
@@ -204,3 +209,68 @@ def test_deleting_field_invalidates_tables_model_cache(data_fixture):
 
     table.refresh_from_db()
     assert get_cached_model_field_attrs(table) is None
+
+
+@pytest.mark.django_db
+@override_settings(BASEROW_GENERATED_MODEL_CLASSES_CACHE_SIZE=2)
+def test_generated_model_classes_are_reused_across_requests(data_fixture):
+    generated_model_classes_cache.clear()
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    data_fixture.create_text_field(table=table, name="text")
+
+    with local_cache.context():
+        model = table.get_model()
+        assert model.baserow_table is table
+    other_table_instance = Table.objects.get(id=table.id)
+    with local_cache.context():
+        assert other_table_instance.get_model() is model
+        assert model.baserow_table is other_table_instance
+    with local_cache.context():
+        # The table is fetched again in a request that didn't request the model.
+        assert model.baserow_table.id == table.id
+        assert model.baserow_table is not table
+        assert model.baserow_table is not other_table_instance
+
+    FieldHandler().create_field(user, table, "text", name="new")
+
+    with local_cache.context():
+        new_model = table.get_model()
+    assert new_model is not model
+    assert len(new_model._field_objects) == 2
+
+    # The least recently used model is evicted when the cache is full.
+    other_tables = [data_fixture.create_database_table(user=user) for _ in range(2)]
+    for other_table in other_tables:
+        with local_cache.context():
+            other_table.get_model()
+    assert len(generated_model_classes_cache) == 2
+    with local_cache.context():
+        assert table.get_model() is not new_model
+
+
+@pytest.mark.django_db
+@override_settings(BASEROW_GENERATED_MODEL_CLASSES_CACHE_SIZE=10)
+def test_generated_model_class_is_regenerated_if_linked_table_changes(data_fixture):
+    generated_model_classes_cache.clear()
+    user = data_fixture.create_user()
+    table_a, table_b, link_field = data_fixture.create_two_linked_tables(user=user)
+
+    with local_cache.context():
+        model_a = table_a.get_model()
+        model_b = next(
+            model
+            for model in model_a.baserow_models.values()
+            if getattr(model, "baserow_table_id", None) == table_b.id
+        )
+    with local_cache.context():
+        assert table_a.get_model() is model_a
+        # The linked table model doesn't keep the table instance of the request that
+        # generated it.
+        assert model_b.baserow_table.id == table_b.id
+        assert model_b.baserow_table is not table_b
+
+    FieldHandler().create_field(user, table_b, "text", name="new in b")
+
+    with local_cache.context():
+        assert table_a.get_model() is not model_a
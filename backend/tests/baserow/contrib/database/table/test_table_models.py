@@ -11,6 +11,10 @@ from django.db.models import Field
 import pytest
 from pytest_unordered import unordered
 
+from baserow.contrib.database.api.rows.serializers import (
+    RowSerializer,
+    get_row_serializer_class,
+)
 from baserow.contrib.database.fields.exceptions import (
     FilterFieldNotFound,
     OrderByFieldNotFound,
@@ -221,6 +225,79 @@ def test_enhance_by_fields_queryset(data_fixture):
     mocked_type.enhance_queryset_in_bulk.assert_called()
 
 
+@pytest.mark.django_db
+def test_enhance_by_fields_queryset_with_json_aggregation(
+    data_fixture, django_assert_num_queries
+):
+    workspace = data_fixture.create_workspace()
+    user = data_fixture.create_user(workspace=workspace)
+    user_2 = data_fixture.create_user(workspace=workspace, first_name="Other")
+    database = data_fixture.create_database_application(workspace=workspace)
+    table = data_fixture.create_database_table(database=database)
+    related_table = data_fixture.create_database_table(database=database)
+    related_primary = data_fixture.create_text_field(table=related_table, primary=True)
+    field_handler = FieldHandler()
+    link_row_field = field_handler.create_field(
+        user, table, "link_row", name="Link", link_row_table=related_table
+    )
+    multiple_select_field = data_fixture.create_multiple_select_field(table=table)
+    option_a = data_fixture.create_select_option(
+        field=multiple_select_field, value="A", color="red"
+    )
+    option_b = data_fixture.create_select_option(
+        field=multiple_select_field, value="B", color="blue"
+    )
+    collaborators_field = data_fixture.create_multiple_collaborators_field(table=table)
+
+    related_rows = (
+        RowHandler()
+        .force_create_rows(
+            user,
+            related_table,
+            [{related_primary.db_column: "a"}, {related_primary.db_column: None}, {}],
+        )
+        .created_rows
+    )
+    RowHandler().force_create_rows(
+        user,
+        table,
+        [
+            {
+                link_row_field.db_column: [related_rows[1].id, related_rows[0].id],
+                multiple_select_field.db_column: [option_b.id, option_a.id],
+                collaborators_field.db_column: [{"id": user_2.id}, {"id": user.id}],
+            },
+            {},
+        ],
+    )
+    RowHandler().delete_row(user, related_table, related_rows[1])
+
+    model = table.get_model()
+    serializer_class = get_row_serializer_class(model, RowSerializer, is_response=True)
+    expected = serializer_class(
+        model.objects.all().enhance_by_fields().order_by("id"), many=True
+    ).data
+
+    queryset = model.objects.all().enhance_by_fields(use_json_aggregation=True)
+    with django_assert_num_queries(1):
+        serialized = serializer_class(queryset.order_by("id"), many=True).data
+
+    assert serialized == expected
+    assert [
+        (link["id"], link["value"]) for link in serialized[0][link_row_field.db_column]
+    ] == [(related_rows[0].id, "a")]
+    assert [
+        option["id"] for option in serialized[0][multiple_select_field.db_column]
+    ] == [option_b.id, option_a.id]
+    assert [
+        collaborator["id"]
+        for collaborator in serialized[0][collaborators_field.db_column]
+    ] == [user_2.id, user.id]
+    assert serialized[1][link_row_field.db_column] == []
+    assert serialized[1][multiple_select_field.db_column] == []
+    assert serialized[1][collaborators_field.db_column] == []
+
+
 @pytest.mark.django_db
 @patch("baserow.contrib.database.table.models.TableModelQuerySet.pg_search")
 @patch("baserow.contrib.database.table.models.TableModelQuerySet.compat_search")
@@ -8,6 +8,7 @@ import pytest
 from freezegun import freeze_time
 
 from baserow.contrib.database.application_types import DatabaseApplicationType
+from baserow.contrib.database.fields.handler import FieldHandler
 from baserow.contrib.database.fields.models import FormulaField, TextField
 from baserow.contrib.database.rows.handler import RowHandler
 from baserow.contrib.database.table.handler import TableHandler
@@ -145,6 +146,90 @@ def test_import_export_database(data_fixture):
     assert row_3.id == 3
 
 
+@pytest.mark.django_db
+def test_duplicate_database_copies_rows_in_database(data_fixture):
+    user = data_fixture.create_user()
+    workspace = data_fixture.create_workspace(user=user)
+    database = data_fixture.create_database_application(workspace=workspace)
+    table_a = data_fixture.create_database_table(database=database, name="A")
+    table_b = data_fixture.create_database_table(database=database, name="B")
+    text_field = data_fixture.create_text_field(table=table_a, name="text")
+    single_select_field = data_fixture.create_single_select_field(
+        table=table_a, name="single"
+    )
+    multiple_select_field = data_fixture.create_multiple_select_field(
+        table=table_a, name="multiple"
+    )
+    option_1 = data_fixture.create_select_option(field=single_select_field)
+    option_2 = data_fixture.create_select_option(field=multiple_select_field)
+    option_3 = data_fixture.create_select_option(field=multiple_select_field)
+    b_text_field = data_fixture.create_text_field(table=table_b, name="text")
+    link_field = FieldHandler().create_field(
+        user, table_a, "link_row", name="link", link_row_table=table_b
+    )
+
+    b_rows = (
+        RowHandler()
+        .force_create_rows(
+            user,
+            table_b,
+            [{b_text_field.db_column: "b1"}, {b_text_field.db_column: "b2"}],
+        )
+        .created_rows
+    )
+    a_rows = (
+        RowHandler()
+        .force_create_rows(
+            user,
+            table_a,
+            [
+                {
+                    text_field.db_column: "a1",
+                    single_select_field.db_column: option_1.id,
+                    multiple_select_field.db_column: [option_2.id, option_3.id],
+                    link_field.db_column: [b_rows[0].id, b_rows[1].id],
+                },
+                {text_field.db_column: "a2"},
+            ],
+        )
+        .created_rows
+    )
+    table_a.get_model().objects_and_trash.filter(id=a_rows[1].id).update(trashed=True)
+    table_b.get_model().objects_and_trash.filter(id=b_rows[1].id).update(trashed=True)
+
+    with patch.object(
+        DatabaseApplicationType, "_import_serialized_fields_values_to_row"
+    ) as mock_import_row:
+        duplicated_database = CoreHandler().duplicate_application(user, database)
+
+    mock_import_row.assert_not_called()
+
+    duplicated_table_a = duplicated_database.table_set.get(name="A")
+    duplicated_table_b = duplicated_database.table_set.get(name="B")
+    fields = {f.name: f for f in duplicated_table_a.field_set.all()}
+    duplicated_option_1 = fields["single"].select_options.get()
+    duplicated_options = list(fields["multiple"].select_options.order_by("id"))
+    assert duplicated_option_1.id != option_1.id
+
+    rows_a = list(duplicated_table_a.get_model().objects.all())
+    assert len(rows_a) == 1
+    assert rows_a[0].id == a_rows[0].id
+    assert getattr(rows_a[0], fields["text"].db_column) == "a1"
+    assert getattr(rows_a[0], fields["single"].db_column).id == (duplicated_option_1.id)
+    assert {o.id for o in getattr(rows_a[0], fields["multiple"].db_column).all()} == {
+        o.id for o in duplicated_options
+    }
+    assert [r.id for r in getattr(rows_a[0], fields["link"].db_column).all()] == [
+        b_rows[0].id
+    ]
+
+    rows_b = list(duplicated_table_b.get_model().objects.all())
+    assert [r.id for r in rows_b] == [b_rows[0].id]
+
+    # It must still be possible to create a new row in the duplicated table.
+    assert duplicated_table_a.get_model().objects.create().id == a_rows[1].id + 1
+
+
 @pytest.mark.django_db
 def test_create_application_and_init_with_data(data_fixture):
     core_handler = CoreHandler()
@@ -1,5 +1,6 @@
 import random
 from decimal import Decimal
+from unittest.mock import patch
 
 import pytest
 from faker import Faker
@@ -7,9 +8,11 @@ from faker import Faker
 from baserow.contrib.database.fields.exceptions import FieldNotInTable
 from baserow.contrib.database.fields.field_types import SingleSelectFieldType
 from baserow.contrib.database.fields.handler import FieldHandler
+from baserow.contrib.database.rows.handler import RowHandler
 from baserow.contrib.database.views.exceptions import FieldAggregationNotSupported
 from baserow.contrib.database.views.handler import ViewHandler
 from baserow.contrib.database.views.registries import view_aggregation_type_registry
+from baserow.contrib.database.views.view_types import GridViewType
 from baserow.core.trash.handler import TrashHandler
 from baserow.test_utils.helpers import setup_interesting_test_table
 
@@ -382,6 +385,152 @@ def test_view_aggregation_errors(data_fixture):
         )
 
 
+@pytest.mark.django_db
+def test_cached_aggregations_are_updated_incrementally_when_rows_change(
+    data_fixture, django_capture_on_commit_callbacks
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    number_field = data_fixture.create_number_field(
+        table=table, number_decimal_places=1
+    )
+    text_field = data_fixture.create_text_field(table=table)
+    grid_view = data_fixture.create_grid_view(table=table)
+    data_fixture.create_view_filter(
+        view=grid_view, field=number_field, type="higher_than", value="0"
+    )
+
+    view_handler = ViewHandler()
+    view_handler.update_field_options(
+        view=grid_view,
+        field_options={
+            number_field.id: {
+                "aggregation_type": "sum",
+                "aggregation_raw_type": "sum",
+            },
+            text_field.id: {
+                "aggregation_type": "empty_count",
+                "aggregation_raw_type": "empty_count",
+            },
+        },
+    )
+
+    row_handler = RowHandler()
+    rows = row_handler.force_create_rows(
+        user,
+        table,
+        [
+            {number_field.db_column: 1, text_field.db_column: "a"},
+            {number_field.db_column: 2},
+            {number_field.db_column: -3},
+        ],
+    ).created_rows
+
+    assert view_handler.get_view_field_aggregations(user, grid_view) == {
+        number_field.db_column: Decimal("3.0"),
+        text_field.db_column: 1,
+    }
+
+    with django_capture_on_commit_callbacks(execute=True):
+        row_handler.force_create_rows(
+            user,
+            table,
+            [{number_field.db_column: 10}, {number_field.db_column: -10}],
+        )
+    with django_capture_on_commit_callbacks(execute=True):
+        row_handler.force_update_rows(
+            user,
+            table,
+            [
+                {"id": rows[0].id, text_field.db_column: ""},
+                {"id": rows[2].id, number_field.db_column: 5},
+            ],
+        )
+    with django_capture_on_commit_callbacks(execute=True):
+        row_handler.force_delete_rows(user, table, [rows[1].id])
+
+    with patch.object(
+        ViewHandler, "get_field_aggregations", wraps=view_handler.get_field_aggregations
+    ) as get_field_aggregations:
+        assert view_handler.get_view_field_aggregations(user, grid_view) == {
+            number_field.db_column: Decimal("16.0"),
+            text_field.db_column: 3,
+        }
+        get_field_aggregations.assert_not_called()
+
+
+@pytest.mark.django_db
+def test_aggregations_rows_snapshot_skips_tables_without_cached_aggregations(
+    data_fixture,
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    number_field = data_fixture.create_number_field(table=table)
+    grid_view = data_fixture.create_grid_view(table=table)
+
+    view_handler = ViewHandler()
+    view_handler.update_field_options(
+        view=grid_view,
+        field_options={
+            number_field.id: {
+                "aggregation_type": "sum",
+                "aggregation_raw_type": "sum",
+            },
+        },
+    )
+
+    model = table.get_model()
+    with patch.object(
+        GridViewType,
+        "get_visible_aggregations_of_table",
+        wraps=GridViewType().get_visible_aggregations_of_table,
+    ) as get_visible_aggregations_of_table:
+        assert view_handler.get_aggregations_rows_snapshot(table, model) == []
+        get_visible_aggregations_of_table.assert_not_called()
+
+        view_handler.get_view_field_aggregations(user, grid_view)
+        snapshots = view_handler.get_aggregations_rows_snapshot(table, model)
+        get_visible_aggregations_of_table.assert_called_once()
+
+    assert [snapshot.view.id for snapshot in snapshots] == [grid_view.id]
+
+
+@pytest.mark.django_db
+def test_not_incremental_aggregations_are_recomputed_when_rows_change(
+    data_fixture, django_capture_on_commit_callbacks
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    number_field = data_fixture.create_number_field(table=table)
+    grid_view = data_fixture.create_grid_view(table=table)
+
+    view_handler = ViewHandler()
+    view_handler.update_field_options(
+        view=grid_view,
+        field_options={
+            number_field.id: {
+                "aggregation_type": "median",
+                "aggregation_raw_type": "median",
+            },
+        },
+    )
+
+    row_handler = RowHandler()
+    row_handler.force_create_rows(
+        user, table, [{number_field.db_column: 1}, {number_field.db_column: 3}]
+    )
+    assert view_handler.get_view_field_aggregations(user, grid_view) == {
+        number_field.db_column: 2,
+    }
+
+    with django_capture_on_commit_callbacks(execute=True):
+        row_handler.force_create_rows(user, table, [{number_field.db_column: 5}])
+
+    assert view_handler.get_view_field_aggregations(user, grid_view) == {
+        number_field.db_column: 3,
+    }
+
+
 @pytest.mark.django_db
 def test_aggregation_is_updated_when_view_is_trashed(data_fixture):
     """
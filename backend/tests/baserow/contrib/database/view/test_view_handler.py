@@ -18,6 +18,7 @@ from baserow.contrib.database.fields.registries import field_type_registry
 from baserow.contrib.database.rows.handler import RowHandler
 from baserow.contrib.database.search.handler import ALL_SEARCH_MODES
 from baserow.contrib.database.table.handler import TableHandler
+from baserow.contrib.database.table.models import TableUsage, TableUsageUpdate
 from baserow.contrib.database.views.exceptions import (
     CannotShareViewTypeError,
     FormViewFieldTypeIsNotSupported,
@@ -4415,6 +4416,38 @@ def test_get_queryset_apply_sorts(data_fixture):
     assert row_ids == [row_3.id, row_2.id, row_1.id]
 
 
+@pytest.mark.django_db
+def test_get_approximate_queryset_count(data_fixture):
+    table = data_fixture.create_database_table()
+    text_field = data_fixture.create_text_field(table=table)
+    grid_view = data_fixture.create_grid_view(table=table)
+    model = table.get_model()
+    for value in ["a", "b", "c"]:
+        model.objects.create(**{f"field_{text_field.id}": value})
+    view_handler = ViewHandler()
+
+    queryset = view_handler.get_queryset(grid_view)
+    # Small tables are counted exactly.
+    assert view_handler.get_approximate_queryset_count(queryset) == 3
+
+    TableUsage.objects.create(table=table, row_count=1000)
+    TableUsageUpdate.objects.create(table=table, row_count=-10)
+    with override_settings(BASEROW_APPROXIMATE_COUNT_MIN_ROWS=100):
+        # The count of the unfiltered view comes from the table usage.
+        assert view_handler.get_approximate_queryset_count(queryset) == 990
+
+        data_fixture.create_view_filter(
+            view=grid_view, field=text_field, type="equal", value="a"
+        )
+        queryset = view_handler.get_queryset(grid_view)
+        with patch(
+            "baserow.contrib.database.views.handler.get_estimated_count",
+            return_value=42,
+        ) as get_estimated_count:
+            assert view_handler.get_approximate_queryset_count(queryset) == 42
+        get_estimated_count.assert_called_once()
+
+
 @pytest.mark.django_db
 def test_can_duplicate_views_with_multiple_collaborator_has_filter(data_fixture):
     user_1 = data_fixture.create_user()
@@ -7,8 +7,12 @@ from django.test import override_settings
 
 import httpretty as httpretty
 import pytest
+import responses
 
-from baserow.contrib.database.webhooks.validators import url_validator
+from baserow.contrib.database.webhooks.validators import (
+    get_webhook_request_function,
+    url_validator,
+)
 from baserow.test_utils.helpers import stub_getaddrinfo
 
 URL_BLACKLIST_ONLY_ALLOWING_GOOGLE_WEBHOOKS = re.compile(r"(?!(www\.)?google\.com).*")
@@ -186,3 +190,50 @@ def test_advocate_hostname_blacklist_overrides_ip_lists(
 
     # This request should still go through
     url_validator("https://www.google.com/")
+
+
+def get_adapter(request):
+    return request.__self__.get_adapter("https://example.com")
+
+
+def test_webhook_request_function_reuses_pooled_adapter():
+    with override_settings(BASEROW_WEBHOOKS_ALLOW_PRIVATE_ADDRESS=True):
+        private_request = get_webhook_request_function()
+        other_private_request = get_webhook_request_function()
+        assert private_request.__self__ is not other_private_request.__self__
+        assert get_adapter(private_request) is get_adapter(other_private_request)
+
+    with override_settings(BASEROW_WEBHOOKS_ALLOW_PRIVATE_ADDRESS=False):
+        public_request = get_webhook_request_function()
+        assert get_adapter(get_webhook_request_function()) is get_adapter(
+            public_request
+        )
+
+    with override_settings(
+        BASEROW_WEBHOOKS_ALLOW_PRIVATE_ADDRESS=False,
+        BASEROW_WEBHOOKS_IP_BLACKLIST=[ip_network("1.1.1.1/32")],
+    ):
+        blacklist_request = get_webhook_request_function()
+
+    assert get_adapter(private_request) is not get_adapter(public_request)
+    assert get_adapter(blacklist_request) is not get_adapter(public_request)
+
+
+@responses.activate
+@override_settings(BASEROW_WEBHOOKS_ALLOW_PRIVATE_ADDRESS=True)
+def test_webhook_request_function_does_not_send_cookies_of_previous_calls():
+    responses.add(
+        responses.POST,
+        "http://localhost/",
+        status=200,
+        headers={"Set-Cookie": "session=secret; Path=/"},
+    )
+
+    for _ in range(2):
+        request = get_webhook_request_function()
+        response = request("POST", "http://localhost/", json={})
+        assert len(request.__self__.cookies) == 0
+
+    assert response.status_code == 200
+    assert len(responses.calls) == 2
+    assert "Cookie" not in responses.calls[1].request.headers
@@ -2111,3 +2111,40 @@ def test_given_row_invisible_in_public_view_when_moved_no_update_sent(
             call(f"table-{table.id}", ANY, ANY, None),
         ]
     )
+
+
+@pytest.mark.django_db
+def test_public_views_rows_visibility_is_checked_in_a_single_query(
+    data_fixture, django_assert_num_queries
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    field = data_fixture.create_text_field(table=table)
+    views = []
+    for value in ["a", "b", "c"]:
+        view = data_fixture.create_grid_view(table=table, public=True)
+        data_fixture.create_view_filter(
+            view=view, field=field, type="equal", value=value
+        )
+        views.append(view)
+
+    model = table.get_model()
+    row_a = model.objects.create(**{f"field_{field.id}": "a"})
+    row_b = model.objects.create(**{f"field_{field.id}": "b"})
+
+    row_checker = ViewHandler().get_public_views_row_checker(
+        table, model, only_include_views_which_want_realtime_events=True
+    )
+    with django_assert_num_queries(1):
+        public_views = row_checker.get_public_views_where_rows_are_visible(
+            [row_a, row_b]
+        )
+
+    assert [(v.view.id, v.allowed_row_ids) for v in public_views] == unordered(
+        [(views[0].id, {row_a.id}), (views[1].id, {row_b.id})]
+    )
+
+    # The results are cached because no updated fields have been provided.
+    with django_assert_num_queries(0):
+        visible_views = row_checker.get_public_views_where_row_is_visible(row_a)
+    assert [view.id for view in visible_views] == [views[0].id]
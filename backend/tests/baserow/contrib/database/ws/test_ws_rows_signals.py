@@ -3,6 +3,7 @@ from typing import Any, Dict, List
 from unittest.mock import call, patch
 
 from django.db import transaction
+from django.test.utils import override_settings
 
 import pytest
 from freezegun import freeze_time
@@ -15,6 +16,7 @@ from baserow.contrib.database.rows.registries import (
     RowMetadataType,
     row_metadata_registry,
 )
+from baserow.contrib.database.ws.rows.signals import broadcast_buffered_rows_updated
 from baserow.test_utils.helpers import AnyInt, register_instance_temporarily
 
 
@@ -383,3 +385,127 @@ def test_rows_history_updated(
         mock_broadcast_many_channel_group.mock_calls == row_history_many_broadcast_calls
     )
     assert mock_broadcast_channel_group.mock_calls == table_and_row_broadcast_calls
+
+
+@pytest.mark.django_db(transaction=True)
+@override_settings(BASEROW_REALTIME_ROWS_UPDATED_DEBOUNCE_MS=100)
+@patch("baserow.contrib.database.ws.rows.signals.flush_rows_updated_broadcast_buffer")
+@patch("baserow.ws.registries.broadcast_to_channel_group")
+def test_rows_updated_are_coalesced_when_debounced(
+    mock_broadcast_to_channel_group, mock_flush, data_fixture
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    field = data_fixture.create_text_field(table=table)
+    field_2 = data_fixture.create_text_field(table=table)
+    row = table.get_model().objects.create()
+
+    RowHandler().update_row_by_id(
+        user=user, table=table, row_id=row.id, values={f"field_{field.id}": "A"}
+    )
+    RowHandler().update_row_by_id(
+        user=user, table=table, row_id=row.id, values={f"field_{field_2.id}": "B"}
+    )
+
+    # Nothing is broadcast until the end of the window, and only one flush is
+    # scheduled.
+    mock_broadcast_to_channel_group.delay.assert_not_called()
+    mock_flush.apply_async.assert_called_once_with((table.id, None), countdown=0.1)
+
+    broadcast_buffered_rows_updated(table.id, None)
+
+    mock_broadcast_to_channel_group.delay.assert_called_once()
+    args = mock_broadcast_to_channel_group.delay.call_args
+    assert args[0][0] == f"table-{table.id}"
+    assert args[0][1]["type"] == "rows_updated"
+    assert len(args[0][1]["rows"]) == 1
+    assert args[0][1]["rows_before_update"][0][f"field_{field.id}"] is None
+    assert args[0][1]["rows_before_update"][0][f"field_{field_2.id}"] is None
+    assert args[0][1]["rows"][0][f"field_{field.id}"] == "A"
+    assert args[0][1]["rows"][0][f"field_{field_2.id}"] == "B"
+    assert args[0][1]["updated_field_ids"] == sorted([field.id, field_2.id])
+
+    # The buffer is empty after the flush.
+    mock_broadcast_to_channel_group.delay.reset_mock()
+    broadcast_buffered_rows_updated(table.id, None)
+    mock_broadcast_to_channel_group.delay.assert_not_called()
+
+
+@pytest.mark.django_db(transaction=True)
+@override_settings(
+    BASEROW_REALTIME_ROWS_UPDATED_DEBOUNCE_MS=100,
+    BASEROW_REALTIME_ROWS_UPDATED_REFRESH_THRESHOLD=1,
+)
+@patch("baserow.contrib.database.ws.rows.signals.flush_rows_updated_broadcast_buffer")
+@patch("baserow.ws.registries.broadcast_to_channel_group")
+def test_rows_updated_over_threshold_refresh_the_table(
+    mock_broadcast_to_channel_group, mock_flush, data_fixture
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    field = data_fixture.create_text_field(table=table)
+    model = table.get_model()
+    row_1, row_2 = model.objects.create(), model.objects.create()
+
+    RowHandler().update_rows(
+        user,
+        table,
+        [
+            {"id": row_1.id, f"field_{field.id}": "A"},
+            {"id": row_2.id, f"field_{field.id}": "B"},
+        ],
+    )
+    broadcast_buffered_rows_updated(table.id, None)
+
+    mock_broadcast_to_channel_group.delay.assert_called_once()
+    args = mock_broadcast_to_channel_group.delay.call_args
+    assert args[0][0] == f"table-{table.id}"
+    assert args[0][1]["type"] == "table_updated"
+    assert args[0][1]["table_id"] == table.id
+    assert args[0][1]["force_table_refresh"] is True
+
+
+@pytest.mark.django_db(transaction=True)
+@override_settings(BASEROW_REALTIME_ROWS_UPDATED_DEBOUNCE_MS=100)
+@patch("baserow.contrib.database.ws.rows.signals.flush_rows_updated_broadcast_buffer")
+@patch("baserow.ws.registries.broadcast_to_channel_group")
+def test_pending_rows_updated_are_flushed_before_rows_deleted(
+    mock_broadcast_to_channel_group, mock_flush, data_fixture
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    field = data_fixture.create_text_field(table=table)
+    row = table.get_model().objects.create()
+
+    RowHandler().update_row_by_id(
+        user=user, table=table, row_id=row.id, values={f"field_{field.id}": "A"}
+    )
+    RowHandler().delete_row_by_id(user, table, row.id)
+
+    message_types = [
+        c[0][1]["type"] for c in mock_broadcast_to_channel_group.delay.call_args_list
+    ]
+    assert message_types == ["rows_updated", "rows_deleted"]
+
+
+@pytest.mark.django_db(transaction=True)
+@override_settings(BASEROW_REALTIME_ROWS_UPDATED_DEBOUNCE_MS=100)
+@patch("baserow.contrib.database.ws.rows.signals.flush_rows_updated_broadcast_buffer")
+@patch("baserow.ws.registries.broadcast_to_channel_group")
+def test_pending_rows_updated_are_flushed_before_row_orders_recalculated(
+    mock_broadcast_to_channel_group, mock_flush, data_fixture
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    field = data_fixture.create_text_field(table=table)
+    row = table.get_model().objects.create()
+
+    RowHandler().update_row_by_id(
+        user=user, table=table, row_id=row.id, values={f"field_{field.id}": "A"}
+    )
+    RowHandler().recalculate_row_orders(table=table)
+
+    message_types = [
+        c[0][1]["type"] for c in mock_broadcast_to_channel_group.delay.call_args_list
+    ]
+    assert message_types == ["rows_updated", "row_orders_recalculated"]
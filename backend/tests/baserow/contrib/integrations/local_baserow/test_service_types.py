@@ -2042,6 +2042,51 @@ def test_local_baserow_rows_created_trigger_service_type_handler(data_fixture):
     mocked_on_event.assert_called_once()
 
 
+@pytest.mark.django_db(transaction=True)
+def test_local_baserow_rows_created_trigger_service_type_ignores_other_tables(
+    data_fixture,
+):
+    mocked_on_event = Mock()
+    user = data_fixture.create_user()
+    service_type = service_type_registry.get(
+        LocalBaserowRowsCreatedTriggerServiceType.type
+    )
+    service_type.on_event = mocked_on_event
+    table = data_fixture.create_database_table(user=user)
+    other_table = data_fixture.create_database_table(user=user)
+    field = data_fixture.create_text_field(user, table=table)
+    data_fixture.create_local_baserow_rows_created_service(table=other_table)
+    assert table.id not in service_type.get_listened_table_ids()
+    assert other_table.id in service_type.get_listened_table_ids()
+
+    RowHandler().create_rows(
+        user=user,
+        table=table,
+        model=table.get_model(),
+        rows_values=[{f"field_{field.id}": "Construction"}],
+        skip_search_update=True,
+    )
+    mocked_on_event.assert_not_called()
+
+    # Saving a trigger service must invalidate the listened tables.
+    data_fixture.create_local_baserow_rows_created_service(table=table)
+    assert table.id in service_type.get_listened_table_ids()
+
+    RowHandler().create_rows(
+        user=user,
+        table=table,
+        model=table.get_model(),
+        rows_values=[{f"field_{field.id}": "Construction"}],
+        skip_search_update=True,
+    )
+    mocked_on_event.assert_called_once()
+
+    # The rows are only serialized when a workflow has to run.
+    event_payload = mocked_on_event.call_args[0][1]
+    assert callable(event_payload)
+    assert event_payload()[0][f"field_{field.id}"] == "Construction"
+
+
 @pytest.mark.django_db(transaction=True)
 def test_local_baserow_rows_updated_trigger_service_type_handler(data_fixture):
     mocked_on_event = Mock()
@@ -2084,7 +2129,7 @@ def test_local_baserow_rows_deleted_trigger_service_type_handler(data_fixture):
     model = table.get_model()
     row1 = model.objects.create()
     row2 = model.objects.create()
-    data_fixture.create_local_baserow_rows_updated_service(
+    data_fixture.create_local_baserow_rows_deleted_service(
         table=table,
     )
     RowHandler().delete_rows(
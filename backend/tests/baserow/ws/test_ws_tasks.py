@@ -1,9 +1,15 @@
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext, override_settings
+
 import pytest
 from asgiref.sync import sync_to_async
 from channels.db import database_sync_to_async
 from channels.testing import WebsocketCommunicator
 
 from baserow.config.asgi import application
+from baserow.core.handler import CoreHandler
 from baserow.ws.tasks import (
     broadcast_to_channel_group,
     broadcast_to_group,
@@ -509,6 +515,33 @@ async def test_broadcast_to_users_individual_payloads(data_fixture):
     await communicator_2.disconnect()
 
 
+def test_broadcast_to_users_only_sends_to_the_channel_groups_of_the_users():
+    channel_layer = MagicMock(spec=["group_send"])
+    channel_layer.group_send = AsyncMock()
+
+    with patch("channels.layers.get_channel_layer", return_value=channel_layer):
+        broadcast_to_users([1, 2, 2], {"message": "test"})
+        # The number of messages doesn't depend on the number of connections.
+        assert sorted(
+            call.args[0] for call in channel_layer.group_send.call_args_list
+        ) == ["user_1", "user_2"]
+
+        channel_layer.group_send.reset_mock()
+        broadcast_to_users_individual_payloads({"1": {"message": "test"}})
+        channel_layer.group_send.assert_called_once_with(
+            "user_1",
+            {
+                "type": "broadcast_to_users_individual_payloads",
+                "payload_map": {"1": {"message": "test"}},
+                "ignore_web_socket_id": None,
+            },
+        )
+
+        channel_layer.group_send.reset_mock()
+        broadcast_to_users([], {"message": "test"}, send_to_all_users=True)
+        assert channel_layer.group_send.call_args.args[0] == "users"
+
+
 @pytest.mark.django_db
 def test_broadcast_application_created_does_not_fail_for_trashed_applications(
     data_fixture,
@@ -567,3 +600,37 @@ def test_broadcast_to_permitted_users_does_not_fail_for_trashed_objects(data_fix
         )
     except Exception as e:
         pytest.fail(f"broadcast_to_permitted_users raised an exception: {e}")
+
+
+@pytest.mark.django_db
+@override_settings(BASEROW_WS_PERMITTED_USERS_CACHE_TTL_SECONDS=60)
+def test_broadcast_to_permitted_users_caches_the_permitted_users(data_fixture):
+    from baserow.ws.tasks import broadcast_to_permitted_users
+
+    user_1 = data_fixture.create_user()
+    user_2 = data_fixture.create_user()
+    workspace = data_fixture.create_workspace(users=[user_1])
+    application = data_fixture.create_database_application(workspace=workspace)
+
+    def broadcast():
+        broadcast_to_permitted_users(
+            workspace.id,
+            "application.read",
+            "application",
+            application.id,
+            {"message": "test"},
+        )
+
+    with patch("baserow.ws.tasks.broadcast_to_users") as mock_broadcast_to_users:
+        broadcast()
+        with CaptureQueriesContext(connection) as captured:
+            broadcast()
+
+        assert len(captured.captured_queries) == 0
+        assert mock_broadcast_to_users.call_args.args[0] == [user_1.id]
+
+        CoreHandler().add_user_to_workspace(workspace, user_2)
+        broadcast()
+        assert sorted(mock_broadcast_to_users.call_args.args[0]) == sorted(
+            [user_1.id, user_2.id]
+        )
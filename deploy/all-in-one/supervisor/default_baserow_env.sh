@@ -57,6 +57,7 @@ if [[ "${BASEROW_ALL_IN_ONE_DEV_MODE:-}" == "true"  ]]; then
   DEFAULT_BACKEND_STARTUP_COMMAND='django-dev-no-attach'
   DEFAULT_CELERY_WORKER_STARTUP_COMMAND='watch-py celery-worker'
   DEFAULT_CELERY_EXPORT_WORKER_STARTUP_COMMAND='watch-py celery-exportworker'
+  DEFAULT_CELERY_WEBHOOKS_WORKER_STARTUP_COMMAND='watch-py celery-webhooks-worker'
   DEFAULT_CELERY_BEAT_STARTUP_COMMAND='celery-beat'
 else
   DEFAULT_DJANGO_SETTINGS_MODULE='baserow.config.settings.base'
@@ -64,6 +65,7 @@ else
   DEFAULT_BACKEND_STARTUP_COMMAND='gunicorn'
   DEFAULT_CELERY_WORKER_STARTUP_COMMAND='celery-worker'
   DEFAULT_CELERY_EXPORT_WORKER_STARTUP_COMMAND='celery-exportworker'
+  DEFAULT_CELERY_WEBHOOKS_WORKER_STARTUP_COMMAND='celery-webhooks-worker'
   DEFAULT_CELERY_BEAT_STARTUP_COMMAND='celery-beat'
 fi
 
@@ -72,6 +74,7 @@ export BASEROW_WEB_FRONTEND_STARTUP_COMMAND="${BASEROW_WEB_FRONTEND_STARTUP_COMM
 export BASEROW_BACKEND_STARTUP_COMMAND="${BASEROW_BACKEND_STARTUP_COMMAND:-$DEFAULT_BACKEND_STARTUP_COMMAND}"
 export BASEROW_CELERY_WORKER_STARTUP_COMMAND="${BASEROW_CELERY_WORKER_STARTUP_COMMAND:-$DEFAULT_CELERY_WORKER_STARTUP_COMMAND}"
 export BASEROW_CELERY_EXPORT_WORKER_STARTUP_COMMAND="${BASEROW_CELERY_EXPORT_WORKER_STARTUP_COMMAND:-$DEFAULT_CELERY_EXPORT_WORKER_STARTUP_COMMAND}"
+export BASEROW_CELERY_WEBHOOKS_WORKER_STARTUP_COMMAND="${BASEROW_CELERY_WEBHOOKS_WORKER_STARTUP_COMMAND:-$DEFAULT_CELERY_WEBHOOKS_WORKER_STARTUP_COMMAND}"
 export BASEROW_CELERY_BEAT_STARTUP_COMMAND="${BASEROW_CELERY_BEAT_STARTUP_COMMAND:-$DEFAULT_CELERY_BEAT_STARTUP_COMMAND}"
 export XDG_CONFIG_HOME=/home/$DOCKER_USER/
 export HOME=/home/$DOCKER_USER/
@@ -16,6 +16,22 @@ class BaserowEnterpriseConfig(AppConfig):
 
         job_type_registry.register(AuditLogExportJobType())
 
+        from baserow.core.buffered_writes import buffered_write_type_registry
+        from baserow_enterprise.audit_log.buffered_write_types import (
+            AuditLogEntryBufferedWriteType,
+        )
+
+        buffered_write_type_registry.register(AuditLogEntryBufferedWriteType())
+
+        from baserow.core.partitioning import time_partitioned_model_type_registry
+        from baserow_enterprise.audit_log.partition_types import (
+            AuditLogEntryTimePartitionedModelType,
+        )
+
+        time_partitioned_model_type_registry.register(
+            AuditLogEntryTimePartitionedModelType()
+        )
+
         from baserow.api.user.registries import member_data_registry
         from baserow.core.action.registries import (
             action_scope_registry,
@@ -0,0 +1,7 @@
+from baserow.core.buffered_writes import BufferedWriteType
+from baserow_enterprise.audit_log.models import AuditLogEntry
+
+
+class AuditLogEntryBufferedWriteType(BufferedWriteType):
+    type = "audit_log_entry"
+    model_class = AuditLogEntry
@@ -6,7 +6,9 @@ from django.contrib.auth.models import AbstractUser
 from baserow.api.sessions import get_user_remote_addr_ip
 from baserow.core.action.registries import ActionType
 from baserow.core.action.signals import ActionCommandType
+from baserow.core.buffered_writes import buffered_write_type_registry
 from baserow.core.models import Workspace
+from baserow.core.partitioning import time_partitioned_model_type_registry
 
 from .models import AuditLogEntry
 
@@ -41,6 +43,8 @@ class AuditLogHandler:
             is sent so it can be used to identify other resources created at the
             same time (i.e. row_history entries).
         :param workspace: The workspace that the action was performed on.
+        :return: The audit log entry. It's only saved later, by the
+            `flush_buffered_writes` task, if buffered writes are enabled.
         """
 
         workspace_id, workspace_name = None, None
@@ -50,7 +54,7 @@ class AuditLogHandler:
 
         ip_address = get_user_remote_addr_ip(user)
 
-        return AuditLogEntry.objects.create(
+        entry = AuditLogEntry(
             user_id=getattr(user, "id", None),
             user_email=getattr(user, "email", None),
             workspace_id=workspace_id,
@@ -65,6 +69,8 @@ class AuditLogHandler:
             original_action_context_descr=action_type.description.context,
             ip_address=ip_address,
         )
+        buffered_write_type_registry.get_by_model(AuditLogEntry).write([entry])
+        return entry
 
     @classmethod
     def delete_entries_older_than(cls, cutoff: datetime):
@@ -74,4 +80,9 @@ class AuditLogHandler:
         :param cutoff: The date and time before which all entries will be deleted.
         """
 
+        # Dropping the partitions only containing older entries, if the table is
+        # partitioned, avoids deleting them one by one.
+        time_partitioned_model_type_registry.get_by_model(
+            AuditLogEntry
+        ).drop_partitions_older_than(cutoff)
         AuditLogEntry.objects.filter(action_timestamp__lt=cutoff).delete()
@@ -0,0 +1,8 @@
+from baserow.core.partitioning import TimePartitionedModelType
+from baserow_enterprise.audit_log.models import AuditLogEntry
+
+
+class AuditLogEntryTimePartitionedModelType(TimePartitionedModelType):
+    type = "audit_log_entry"
+    model_class = AuditLogEntry
+    partition_field_name = "action_timestamp"
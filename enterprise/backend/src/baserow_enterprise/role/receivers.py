@@ -8,13 +8,17 @@ from baserow.core.models import Workspace, WorkspaceUser
 from baserow.core.registries import subject_type_registry
 from baserow.core.signals import permissions_updated, workspace_user_updated
 from baserow.core.types import Subject
-from baserow.ws.tasks import broadcast_to_users
+from baserow.ws.tasks import broadcast_to_users, invalidate_permitted_users_cache
 from baserow_enterprise.signals import (
     role_assignment_created,
     role_assignment_deleted,
     role_assignment_updated,
     team_deleted,
     team_restored,
+    team_subject_created,
+    team_subject_deleted,
+    team_subject_restored,
+    team_updated,
 )
 from baserow_enterprise.teams.models import Team
 
@@ -46,6 +50,18 @@ def send_permissions_updated_when_team_was_deleted(sender, team: Team, **kwargs)
     permissions_updated.send(sender, subject=team, workspace=team.workspace)
 
 
+@receiver(team_updated)
+def invalidate_permitted_users_when_team_updated(sender, team: Team, **kwargs):
+    invalidate_permitted_users_cache([team.workspace_id])
+
+
+@receiver(team_subject_created)
+@receiver(team_subject_deleted)
+@receiver(team_subject_restored)
+def invalidate_permitted_users_when_team_subject_changed(sender, subject, **kwargs):
+    invalidate_permitted_users_cache([subject.team.workspace_id])
+
+
 @receiver(permissions_updated)
 def notify_users_about_updated_permissions(
     sender, subject: Subject, workspace: Workspace, **kwargs
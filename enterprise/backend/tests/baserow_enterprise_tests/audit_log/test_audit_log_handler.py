@@ -1,14 +1,13 @@
-from datetime import datetime
-
-from django.test.utils import override_settings
+from datetime import datetime, timezone
 
 import pytest
-from freezegun import freeze_time
-
 from baserow.core.action.handler import ActionHandler
 from baserow.core.actions import CreateWorkspaceActionType
+from baserow.core.partitioning import time_partitioned_model_type_registry
 from baserow_enterprise.audit_log.handler import AuditLogHandler
 from baserow_enterprise.audit_log.models import AuditLogEntry
+from django.test.utils import override_settings
+from freezegun import freeze_time
 
 
 @pytest.mark.django_db
@@ -52,6 +51,55 @@ def test_audit_log_handler_can_clear_entries_older_than(
     assert AuditLogEntry.objects.count() == 0
 
 
+@pytest.mark.django_db
+@override_settings(
+    DEBUG=True,
+    BASEROW_TIME_PARTITION_INTERVAL="month",
+    BASEROW_TIME_PARTITIONS_AHEAD=3,
+)
+def test_audit_log_handler_can_clear_entries_older_than_in_partitioned_table(
+    api_client, enterprise_data_fixture, synced_roles
+):
+    enterprise_data_fixture.enable_enterprise()
+    user = enterprise_data_fixture.create_user()
+
+    with freeze_time("2026-10-10 12:00:00"):
+        CreateWorkspaceActionType.do(user, "workspace 1")
+
+    time_partitioned_model_type = time_partitioned_model_type_registry.get_by_model(
+        AuditLogEntry
+    )
+    with freeze_time("2026-10-18 12:00:00"):
+        assert time_partitioned_model_type.convert_to_partitioned_table() is True
+
+    with freeze_time("2026-11-05 12:00:00"):
+        CreateWorkspaceActionType.do(user, "workspace 2")
+    with freeze_time("2026-12-05 12:00:00"):
+        CreateWorkspaceActionType.do(user, "workspace 3")
+
+    assert AuditLogEntry.objects.count() == 3
+
+    AuditLogHandler.delete_entries_older_than(
+        datetime(2026, 12, 1, tzinfo=timezone.utc)
+    )
+
+    assert [
+        partition.name for partition in time_partitioned_model_type.get_partitions()
+    ] == [
+        "baserow_enterprise_auditlogentry_p20261201",
+        "baserow_enterprise_auditlogentry_p20270101",
+    ]
+    assert list(AuditLogEntry.objects.values_list("workspace_name", flat=True)) == [
+        "workspace 3"
+    ]
+
+    AuditLogHandler.delete_entries_older_than(
+        datetime(2026, 12, 6, tzinfo=timezone.utc)
+    )
+
+    assert AuditLogEntry.objects.count() == 0
+
+
 @pytest.mark.django_db
 @pytest.mark.undo_redo
 @override_settings(DEBUG=True)